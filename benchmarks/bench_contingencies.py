@@ -0,0 +1,55 @@
+"""
+Compare building N-1 outage variants with deep copies against outage views.
+
+    python benchmarks/bench_contingencies.py case118 case2383wp
+"""
+
+import copy
+import sys
+import time
+import tracemalloc
+from functools import partial
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.contingencies import STATUS_COLUMNS, contingencies
+
+
+def deepcopy_variants(case, outages):
+    for contingency in outages:
+        variant = copy.deepcopy(case)
+        df = getattr(variant, contingency.attribute)
+        df.iloc[contingency.position, df.columns.get_loc(STATUS_COLUMNS["branch"])] = 0
+        yield contingency, variant
+
+
+def measure(make_variants):
+    """Time of consuming all variants, and peak memory when keeping them alive."""
+    t0 = time.perf_counter()
+    n = sum(1 for _ in make_variants())
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    kept = list(make_variants())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del kept
+    return elapsed, peak, n
+
+
+def main(cases):
+    print(f"{'case':<16}{'method':<12}{'n':>6}{'time [ms]':>12}{'peak [MB]':>12}")
+    for case in cases:
+        cf = CaseFrames(case)
+        outages = contingencies(cf, elements=("branch",))
+        for method, make_variants in [
+            ("deepcopy", partial(deepcopy_variants, cf, outages)),
+            ("views", partial(cf.iter_outages, outages)),
+        ]:
+            elapsed, peak, n = measure(make_variants)
+            print(
+                f"{case:<16}{method:<12}{n:>6}{elapsed * 1e3:>12.1f}"
+                f"{peak / 2**20:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["case118", "case2383wp"])
@@ -0,0 +1,60 @@
+"""
+Time storing scenarios as deltas against a base case, and rebuilding them.
+
+    python benchmarks/bench_deltas.py case_ACTIVSg2000 200
+"""
+
+import pickle
+import sys
+import time
+
+import numpy as np
+
+from matpowercaseframes import CaseFrames, DeltaStore
+
+
+def scenarios(case, n, seed=0):
+    """Scenarios with 5% of loads changed and one branch outage each."""
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        other = case.copy()
+        pd_ = other.bus["PD"].to_numpy(copy=True)
+        rows = rng.choice(len(pd_), max(1, len(pd_) // 20), replace=False)
+        pd_[rows] *= rng.uniform(0.8, 1.2, len(rows))
+        other.bus["PD"] = pd_
+        status = other.branch["BR_STATUS"].to_numpy(copy=True)
+        status[rng.integers(len(status))] = 0
+        other.branch["BR_STATUS"] = status
+        yield other
+
+
+def main(case, n):
+    cf = CaseFrames(case)
+    cases = list(scenarios(cf, n))
+    store = DeltaStore(cf)
+
+    t0 = time.perf_counter()
+    store.extend(cases)
+    t_add = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for s in range(n):
+        store.get(s)
+    t_get = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    store.to_batch()
+    t_batch = time.perf_counter() - t0
+
+    full = sum(len(pickle.dumps(c, protocol=5)) for c in cases)
+    deltas = len(pickle.dumps(store, protocol=5))
+    print(f"{case}, {n} scenarios")
+    print(f"  size      full {full / 1e6:.1f} MB, deltas {deltas / 1e6:.2f} MB")
+    print(f"  add       {t_add / n * 1e3:.2f} ms/scenario")
+    print(f"  get       {t_get / n * 1e3:.2f} ms/scenario")
+    print(f"  to_batch  {t_batch * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else "case_ACTIVSg2000",
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    )
@@ -0,0 +1,53 @@
+"""
+Time diffing a case against an edited snapshot, and applying the diff back.
+
+    python benchmarks/bench_diff.py case_ACTIVSg70k
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from matpowercaseframes import CaseFrames
+
+
+def timeit(func, repeat=10):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t0)
+    return min(times), result
+
+
+def edited(case, seed=0):
+    """Snapshot with 1% of loads changed, 10 branches removed, and 1 gen added."""
+    rng = np.random.default_rng(seed)
+    other = case.copy()
+    pd_ = other.bus["PD"].to_numpy(copy=True)
+    rows = rng.choice(len(pd_), len(pd_) // 100, replace=False)
+    pd_[rows] *= 1.1
+    other.bus["PD"] = pd_
+    other.branch = other.branch.drop(index=other.branch.index[:10])
+    new = other.gen.iloc[[0]].set_axis([other.gen.index.max() + 1])
+    other.gen = pd.concat([other.gen, new])
+    return other
+
+
+def main(cases):
+    print(f"{'case':<20}{'cells':>8}{'diff [ms]':>12}{'apply [ms]':>12}")
+    for case in cases:
+        cf = CaseFrames(case)
+        other = edited(cf)
+        t_diff, diff = timeit(lambda c=cf, o=other: c.diff(o))
+        t_apply, _ = timeit(lambda c=cf, d=diff: d.apply(c))
+        print(
+            f"{case:<20}{len(diff.changes):>8}{t_diff * 1e3:>12.1f}"
+            f"{t_apply * 1e3:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["case2383wp", "case_ACTIVSg70k"])
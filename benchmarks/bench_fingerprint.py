@@ -0,0 +1,57 @@
+"""
+Compare hashing the tables of a case with `pd.util.hash_pandas_object` against
+`CaseFrames.fingerprint`, from scratch and after editing one table.
+
+    python benchmarks/bench_fingerprint.py case2383wp case6515rte
+"""
+
+import sys
+import time
+
+import pandas as pd
+
+from matpowercaseframes import CaseFrames
+
+
+def timeit(func, repeat=20):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def hash_pandas_object(case):
+    for attribute in case.attributes:
+        df = getattr(case, attribute)
+        if isinstance(df, pd.DataFrame):
+            pd.util.hash_pandas_object(df).to_numpy()
+
+
+def fingerprint_fresh(case):
+    case.cache_clear()
+    case.fingerprint()
+
+
+def fingerprint_edited(case):
+    case.gen.iloc[0, 1] += 1
+    case.fingerprint()
+
+
+def main(cases):
+    print(f"{'case':<16}{'method':<24}{'time [ms]':>12}")
+    for case in cases:
+        cf = CaseFrames(case)
+        cf.fingerprint()
+        for method, func in [
+            ("hash_pandas_object", hash_pandas_object),
+            ("fingerprint", fingerprint_fresh),
+            ("fingerprint, gen edited", fingerprint_edited),
+        ]:
+            elapsed = timeit(lambda f=func, c=cf: f(c))
+            print(f"{case:<16}{method:<24}{elapsed * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["case2383wp", "case6515rte"])
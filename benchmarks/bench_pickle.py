@@ -0,0 +1,52 @@
+"""
+Compare pickle round trips of CaseFrames with protocol 4, and with protocol 5 in-band
+and with out-of-band buffers.
+
+    python benchmarks/bench_pickle.py case2383wp case6515rte
+"""
+
+import pickle
+import sys
+import time
+from functools import partial
+
+from matpowercaseframes import CaseFrames
+
+
+def timeit(func, repeat=20):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def round_trip(case, protocol, out_of_band=False):
+    if out_of_band:
+        buffers = []
+        data = pickle.dumps(case, protocol, buffer_callback=buffers.append)
+        pickle.loads(data, buffers=buffers)
+        return len(data)
+    data = pickle.dumps(case, protocol)
+    pickle.loads(data)
+    return len(data)
+
+
+def main(cases):
+    print(f"{'case':<16}{'method':<16}{'pickle [kB]':>12}{'time [ms]':>12}")
+    for case in cases:
+        cf = CaseFrames(case)
+        cf.make_ybus()  # derived caches are not pickled
+        for method, protocol, out_of_band in [
+            ("protocol 4", 4, False),
+            ("protocol 5", 5, False),
+            ("out-of-band", 5, True),
+        ]:
+            size = round_trip(cf, protocol, out_of_band)
+            elapsed = timeit(partial(round_trip, cf, protocol, out_of_band))
+            print(f"{case:<16}{method:<16}{size / 1e3:>12.1f}{elapsed * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["case2383wp", "case6515rte"])
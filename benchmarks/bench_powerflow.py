@@ -0,0 +1,69 @@
+"""
+Compare native power flow against MATPOWER through Octave.
+
+    python benchmarks/bench_powerflow.py case9 case118 case2383wp
+
+Octave timings are skipped when Octave or MATPOWER is not available.
+"""
+
+import sys
+import time
+from functools import partial
+
+import numpy as np
+
+from matpowercaseframes import CaseFrames
+
+
+def timeit(func, repeat=5):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def start_octave():
+    try:
+        from matpower import start_instance
+
+        m = start_instance()
+    except Exception as e:
+        print(f"Octave path skipped: {e}")
+        return None
+    return m
+
+
+def main(cases):
+    m = start_octave()
+    if m is not None:
+        mpopt = m.mpoption("verbose", 0, "out.all", 0)
+
+    print(f"{'case':<20}{'method':<10}{'native [ms]':>14}{'octave [ms]':>14}")
+    for case in cases:
+        cf = CaseFrames(case)
+
+        for method in ["run_pf", "run_dcpf"]:
+            native = timeit(getattr(cf, method))
+            octave = float("nan")
+            if m is not None:
+                func = getattr(m, method.replace("_", ""))
+                # includes the transfer of the case to Octave, as used in practice
+                octave = timeit(lambda f=func, c=cf: f(c.to_mpc(), mpopt))
+            print(f"{case:<20}{method:<10}{native * 1e3:>14.2f}{octave * 1e3:>14.2f}")
+
+        # per-scenario time of batched power flows over scaled loads
+        n_scenarios = 20
+        PD = np.linspace(0.9, 1.1, n_scenarios)[:, None] * cf.bus["PD"].to_numpy()
+        for method, dc in [("batch_pf", False), ("batch_dc", True)]:
+            native = timeit(partial(cf.run_pf_batch, PD=PD, dc=dc), repeat=1)
+            native /= n_scenarios
+            print(f"{case:<20}{method:<10}{native * 1e3:>14.2f}{float('nan'):>14.2f}")
+
+    if m is not None:
+        m.exit()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ["case9", "case118", "case300", "case2383wp"])
@@ -1,14 +1,22 @@
+from .batch import CaseBatch
 from .core import (
     CaseFrames,
     DataFramesStruct,
     ReservesFrames,
     xGenDataTableFrames,
 )
+from .deltas import DeltaStore
+from .perunit import PerUnitView
+from .profiles import Profile
 from .version import __version__
 
 __all__ = [
+    "CaseBatch",
     "CaseFrames",
     "DataFramesStruct",
+    "DeltaStore",
+    "PerUnitView",
+    "Profile",
     "ReservesFrames",
     "xGenDataTableFrames",
     "__version__",
@@ -0,0 +1,317 @@
+import numpy as np
+import pandas as pd
+
+
+def _positions(key, n):
+    """Normalize an int, slice, mask, or list of positions into position array."""
+    if key is None:
+        return np.arange(n)
+    return np.arange(n)[key].reshape(-1)
+
+
+class CaseBatch:
+    """
+    Scenarios of one CaseFrames stored as stacked arrays.
+
+    Columns that are equal in every scenario are kept once in a base CaseFrames,
+    while varying columns (loads, statuses, limits, costs, ...) are stored as
+    (n_scenarios, n_rows) arrays. A column becomes varying the first time it is
+    edited through `set` or `scale`. Rows are addressed by position, as in the
+    MATPOWER matrices.
+    """
+
+    def __init__(self, case, n_scenarios=1, varying=None):
+        """
+        Initialize the batch with n_scenarios copies of case.
+
+
+        Args:
+            case (CaseFrames):
+                Base case, shared by all scenarios.
+            n_scenarios (int):
+                Number of scenarios.
+            varying (dict | None):
+                Columns to store per scenario from the start, as
+                {attribute: [columns]}.
+        """
+        self._base = case.copy()
+        self._n_scenarios = int(n_scenarios)
+        self._data = {}
+        for attribute, columns in (varying or {}).items():
+            for column in columns:
+                self._varying_array(attribute, column)
+
+    @classmethod
+    def from_cases(cls, cases):
+        """
+        Stack CaseFrames with identical table shapes into a batch.
+
+        Only columns that differ between cases are stored per scenario.
+
+
+        Args:
+            cases (list):
+                List of CaseFrames.
+
+
+        Returns:
+            CaseBatch: Batch with one scenario per case.
+        """
+        cases = list(cases)
+        if not cases:
+            raise ValueError("At least one case is required.")
+        batch = cls(cases[0], n_scenarios=len(cases))
+        for attribute in batch._base.attributes:
+            df = getattr(batch._base, attribute)
+            if not isinstance(df, pd.DataFrame):
+                continue
+            tables = [getattr(case, attribute) for case in cases]
+            for table in tables[1:]:
+                if table.shape != df.shape or not table.columns.equals(df.columns):
+                    raise ValueError(
+                        f"Table '{attribute}' differs in shape or columns between"
+                        " cases."
+                    )
+            for column in df.columns:
+                values = np.stack([table[column].to_numpy() for table in tables])
+                same = values == values[:1]
+                if values.dtype.kind == "f":
+                    same |= np.isnan(values) & np.isnan(values[:1])
+                if not same.all():
+                    batch._data.setdefault(attribute, {})[column] = values
+        return batch
+
+    @property
+    def base(self):
+        """CaseFrames: Base case holding the static columns."""
+        return self._base
+
+    @property
+    def n_scenarios(self):
+        """int: Number of scenarios."""
+        return self._n_scenarios
+
+    @property
+    def varying(self):
+        """dict: Varying columns, as {attribute: [columns]}."""
+        return {attribute: list(columns) for attribute, columns in self._data.items()}
+
+    def __len__(self):
+        return self._n_scenarios
+
+    def _table(self, attribute, column):
+        df = getattr(self._base, attribute, None)
+        if not isinstance(df, pd.DataFrame):
+            raise KeyError(f"'{attribute}' is not a table of the base case.")
+        if column not in df.columns:
+            raise KeyError(f"Column '{column}' not found in '{attribute}'.")
+        return df
+
+    def _varying_array(self, attribute, column, dtype=None):
+        columns = self._data.setdefault(attribute, {})
+        if column not in columns:
+            values = self._table(attribute, column)[column].to_numpy()
+            columns[column] = np.tile(values, (self._n_scenarios, 1))
+        array = columns[column]
+        if dtype is not None and np.result_type(array, dtype) != array.dtype:
+            array = columns[column] = array.astype(np.result_type(array, dtype))
+        return array
+
+    def get(self, attribute, column):
+        """
+        Get the values of a column in every scenario.
+
+
+        Args:
+            attribute (str):
+                Table name, e.g. 'bus'.
+            column (str):
+                Column name, e.g. 'PD'.
+
+
+        Returns:
+            np.ndarray: Values of shape (n_scenarios, n_rows). Static columns are
+                returned as a read-only broadcast view.
+        """
+        columns = self._data.get(attribute, {})
+        if column in columns:
+            return columns[column]
+        values = self._table(attribute, column)[column].to_numpy()
+        return np.broadcast_to(values, (self._n_scenarios, len(values)))
+
+    def set(self, attribute, column, values, scenarios=None, rows=None):
+        """
+        Set values of a column across scenarios, making it varying.
+
+
+        Args:
+            attribute (str):
+                Table name, e.g. 'bus'.
+            column (str):
+                Column name, e.g. 'PD'.
+            values (array_like):
+                Values broadcastable to (len(scenarios), len(rows)).
+            scenarios (int | slice | array_like | None):
+                Scenario positions or mask. Defaults to all scenarios.
+            rows (int | slice | array_like | None):
+                Row positions or mask. Defaults to all rows.
+        """
+        values = np.asarray(values)
+        array = self._varying_array(attribute, column, dtype=values.dtype)
+        s = _positions(scenarios, array.shape[0])
+        r = _positions(rows, array.shape[1])
+        array[np.ix_(s, r)] = values
+
+    def scale(self, attribute, column, factors, scenarios=None, rows=None):
+        """
+        Multiply values of a column across scenarios, making it varying.
+
+
+        Args:
+            attribute (str):
+                Table name, e.g. 'bus'.
+            column (str):
+                Column name, e.g. 'PD'.
+            factors (array_like):
+                Multipliers broadcastable to (len(scenarios), len(rows)), e.g. one
+                per scenario with shape (n_scenarios, 1).
+            scenarios (int | slice | array_like | None):
+                Scenario positions or mask. Defaults to all scenarios.
+            rows (int | slice | array_like | None):
+                Row positions or mask. Defaults to all rows.
+        """
+        factors = np.asarray(factors)
+        array = self._varying_array(
+            attribute, column, dtype=np.result_type(factors, float)
+        )
+        s = _positions(scenarios, array.shape[0])
+        r = _positions(rows, array.shape[1])
+        array[np.ix_(s, r)] *= factors
+
+    def update(self, attribute, column, scenarios, rows, values, how="replace"):
+        """
+        Modify individual cells given as (scenario, row) pairs, making the column
+        varying.
+
+
+        Args:
+            attribute (str):
+                Table name, e.g. 'branch'.
+            column (str):
+                Column name, e.g. 'BR_STATUS'.
+            scenarios (array_like):
+                Scenario position of each cell.
+            rows (array_like):
+                Row position of each cell.
+            values (array_like):
+                Value of each cell, or a scalar.
+            how (str):
+                'replace' the cells, 'scale' them by values, or 'shift' them by
+                values. Repeated cells are scaled or shifted repeatedly.
+        """
+        values = np.asarray(values)
+        dtype = values.dtype if how == "replace" else np.result_type(values, float)
+        array = self._varying_array(attribute, column, dtype=dtype)
+        index = (np.asarray(scenarios, dtype=int), np.asarray(rows, dtype=int))
+        if how == "replace":
+            array[index] = values
+        elif how == "scale":
+            np.multiply.at(array, index, values)
+        elif how == "shift":
+            np.add.at(array, index, values)
+        else:
+            raise ValueError(f"Unknown update '{how}', use replace, scale, or shift.")
+
+    def scenario(self, s, copy=False):
+        """
+        Materialize one scenario as a CaseFrames.
+
+        Static columns are shared with the base case. Without copy, varying columns
+        are read-only views into the batch arrays, so building a scenario costs no
+        data copies and writing into it raises an error. Without pandas
+        Copy-on-Write, both are copied instead, see `CaseFrames.copy`.
+
+
+        Args:
+            s (int):
+                Scenario position.
+            copy (bool):
+                Whether to copy varying columns, allowing in-place edits.
+
+
+        Returns:
+            CaseFrames: Case of scenario s.
+        """
+        s = range(self._n_scenarios)[s]
+        case = self._base.copy()
+        for attribute, columns in self._data.items():
+            df = getattr(case, attribute)
+            for column, array in columns.items():
+                values = array[s]
+                if copy:
+                    values = values.copy()
+                else:
+                    values = values.view()
+                    values.flags.writeable = False
+                df[column] = pd.Series(values, index=df.index, copy=False)
+        return case
+
+    def __getitem__(self, s):
+        return self.scenario(s)
+
+    def __iter__(self):
+        for s in range(self._n_scenarios):
+            yield self.scenario(s)
+
+    def to_cases(self):
+        """
+        Materialize all scenarios as independent CaseFrames.
+
+
+        Returns:
+            list: List of CaseFrames.
+        """
+        return [self.scenario(s, copy=True) for s in range(self._n_scenarios)]
+
+    def run_pf_batch(self, dc=False, **kwargs):
+        """
+        Run power flows of all scenarios with `CaseFrames.run_pf_batch`.
+
+        Only bus PD, QD and gen PG may vary between scenarios. Requires scipy.
+
+
+        Args:
+            dc (bool):
+                Whether to run DC instead of AC power flows. Defaults to False.
+            **kwargs:
+                Passed to `CaseFrames.run_pf_batch`.
+
+
+        Returns:
+            dict: Scenario-by-row result arrays.
+        """
+        supported = {"bus": {"PD", "QD"}, "gen": {"PG"}}
+        for attribute, columns in self._data.items():
+            unsupported = set(columns) - supported.get(attribute, set())
+            if unsupported:
+                raise ValueError(
+                    f"Batched power flow does not support varying {attribute} "
+                    f"columns {sorted(unsupported)}."
+                )
+        return self._base.run_pf_batch(
+            PD=self.get("bus", "PD"),
+            QD=self.get("bus", "QD"),
+            PG=self.get("gen", "PG"),
+            dc=dc,
+            **kwargs,
+        )
+
+    def __repr__(self):
+        varying = ", ".join(
+            f"{attribute}: [{', '.join(columns)}]"
+            for attribute, columns in self._data.items()
+        )
+        return (
+            f"{self.__class__.__name__}(n_scenarios={self._n_scenarios}, "
+            f"varying={{{varying}}})"
+        )
@@ -0,0 +1,474 @@
+import numpy as np
+import pandas as pd
+
+from .constants import BUS_TYPES, COLUMNS
+from .costs import modcost
+from .idx.ct import (
+    CT_ADD,
+    CT_CHGTYPE,
+    CT_COL,
+    CT_LABEL,
+    CT_LOAD_ALL_P,
+    CT_LOAD_ALL_PQ,
+    CT_LOAD_DIS_P,
+    CT_LOAD_DIS_PQ,
+    CT_LOAD_FIX_P,
+    CT_LOAD_FIX_PQ,
+    CT_MODCOST_F,
+    CT_MODCOST_X,
+    CT_NEWVAL,
+    CT_REL,
+    CT_REP,
+    CT_ROW,
+    CT_TABLE,
+    CT_TAREABRCH,
+    CT_TAREABUS,
+    CT_TAREAGEN,
+    CT_TAREAGENCOST,
+    CT_TAREALOAD,
+    CT_TBRCH,
+    CT_TBUS,
+    CT_TGEN,
+    CT_TGENCOST,
+    CT_TLOAD,
+)
+
+# table modified by each CT_TABLE value, other than loads
+CT_TABLES = {
+    CT_TBUS: "bus",
+    CT_TGEN: "gen",
+    CT_TBRCH: "branch",
+    CT_TGENCOST: "gencost",
+    CT_TAREABUS: "bus",
+    CT_TAREAGEN: "gen",
+    CT_TAREABRCH: "branch",
+    CT_TAREAGENCOST: "gencost",
+}
+CT_AREA_TABLES = (CT_TAREABUS, CT_TAREAGEN, CT_TAREABRCH, CT_TAREAGENCOST)
+
+# columns that can be modified, as MATPOWER `apply_changes`
+CT_COLUMNS = {
+    "bus": ["PD", "QD", "GS", "BS", "VMAX", "VMIN"],
+    "gen": [
+        "QMAX",
+        "QMIN",
+        "GEN_STATUS",
+        "PMAX",
+        "PMIN",
+        "PC1",
+        "PC2",
+        "QC1MIN",
+        "QC1MAX",
+        "QC2MIN",
+        "QC2MAX",
+        "RAMP_AGC",
+        "RAMP_10",
+        "RAMP_30",
+        "RAMP_Q",
+        "APF",
+    ],
+    "branch": [
+        "BR_R",
+        "BR_X",
+        "BR_B",
+        "RATE_A",
+        "RATE_B",
+        "RATE_C",
+        "TAP",
+        "SHIFT",
+        "BR_STATUS",
+        "ANGMIN",
+        "ANGMAX",
+    ],
+}
+
+# (which, pq) of each load modification code
+CT_LOAD_OPTIONS = {
+    CT_LOAD_ALL_PQ: ("BOTH", True),
+    CT_LOAD_FIX_PQ: ("FIXED", True),
+    CT_LOAD_DIS_PQ: ("DISPATCHABLE", True),
+    CT_LOAD_ALL_P: ("BOTH", False),
+    CT_LOAD_FIX_P: ("FIXED", False),
+    CT_LOAD_DIS_P: ("DISPATCHABLE", False),
+}
+
+
+def changes_table(chgtab):
+    """
+    Convert a changes table into a float array with 7 columns.
+
+
+    Args:
+        chgtab (array_like | pd.DataFrame):
+            Changes table in MATPOWER layout, see `matpowercaseframes.idx.ct`.
+
+
+    Returns:
+        np.ndarray: Changes table of shape (n_changes, 7).
+    """
+    if isinstance(chgtab, pd.DataFrame):
+        chgtab = chgtab.to_numpy()
+    chgtab = np.array(chgtab, dtype=float, ndmin=2)
+    if chgtab.shape[1] != CT_NEWVAL + 1:
+        raise ValueError(
+            f"Changes table must have {CT_NEWVAL + 1} columns, got {chgtab.shape[1]}."
+        )
+    return chgtab
+
+
+def group_changes(chgtab):
+    """
+    Group the rows of a changes table by label.
+
+
+    Args:
+        chgtab (np.ndarray):
+            Changes table.
+
+
+    Returns:
+        tuple: (labels, groups), sorted unique labels and, for each label, the row
+            positions of its changes in their original order.
+    """
+    labels, inverse = np.unique(chgtab[:, CT_LABEL], return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.cumsum(np.bincount(inverse, minlength=len(labels)))[:-1]
+    return labels, np.split(order, bounds)
+
+
+class _ColumnEdits:
+    """
+    Columns of a case modified by a set of changes.
+
+    Columns are copied on first modification, so untouched data is shared with the
+    original case.
+    """
+
+    def __init__(self, case):
+        self.case = case
+        self.columns = {}
+        self.tables = {}
+
+    def peek(self, attribute, column):
+        """Current values of a column, without copying."""
+        if column in self.columns.get(attribute, {}):
+            return self.columns[attribute][column]
+        return getattr(self.case, attribute)[column].to_numpy(dtype=float)
+
+    def get(self, attribute, column):
+        """Writable values of a column."""
+        columns = self.columns.setdefault(attribute, {})
+        if column not in columns:
+            df = getattr(self.case, attribute)
+            columns[column] = df[column].to_numpy(dtype=float, copy=True)
+        return columns[column]
+
+    def table(self, attribute):
+        """Writable values of a whole table, as a 2-D array."""
+        if attribute not in self.tables:
+            df = getattr(self.case, attribute)
+            self.tables[attribute] = df.to_numpy(dtype=float, copy=True)
+        return self.tables[attribute]
+
+    def items(self):
+        """Iterate over (attribute, column, values) of modified columns."""
+        for attribute, columns in self.columns.items():
+            yield from ((attribute, column, v) for column, v in columns.items())
+        for attribute, values in self.tables.items():
+            df = getattr(self.case, attribute)
+            for j, column in enumerate(df.columns):
+                current = df[column].to_numpy(dtype=float)
+                if not np.array_equal(values[:, j], current, equal_nan=True):
+                    yield attribute, column, values[:, j]
+
+    def to_case(self):
+        """Shallow copy of the case with modified columns replaced."""
+        cf = self.case.copy()
+        for attribute, column, values in self.items():
+            getattr(cf, attribute)[column] = values
+        return cf
+
+
+def _column_name(attribute, col):
+    """Name of a modifiable column from its 1-based MATPOWER column number."""
+    columns = COLUMNS[attribute]
+    column = (
+        columns[int(col) - 1] if col == int(col) and 1 <= col <= len(columns) else None
+    )
+    if column not in CT_COLUMNS[attribute]:
+        raise ValueError(
+            f"Modification to column {col:g} of {attribute} table not supported."
+        )
+    return column
+
+
+def _modify(values, rows, typ, val, table):
+    if typ == CT_REP:
+        values[rows] = val
+    elif typ == CT_REL:
+        values[rows] = val * values[rows]
+    elif typ == CT_ADD:
+        values[rows] = val + values[rows]
+    else:
+        raise ValueError(f"Unsupported modification type {typ:g} for {table} table.")
+
+
+def _bus_area(case, attribute):
+    """Area of each row of bus, gen, or branch (from and to buses)."""
+    bus = case.bus
+    area = bus["BUS_AREA"].to_numpy()
+    index = pd.Index(bus["BUS_I"].to_numpy())
+    if attribute == "bus":
+        return (area,)
+    elif attribute in ("gen", "gencost"):
+        # only active power costs for gencost, as MATPOWER
+        return (area[index.get_indexer(case.gen["GEN_BUS"].to_numpy())],)
+    return (
+        area[index.get_indexer(case.branch["F_BUS"].to_numpy())],
+        area[index.get_indexer(case.branch["T_BUS"].to_numpy())],
+    )
+
+
+def _change_rows(case, tbl, row, attribute):
+    if tbl in CT_AREA_TABLES:
+        return np.flatnonzero(np.any([a == row for a in _bus_area(case, attribute)], 0))
+    if row == 0:
+        return slice(None)
+    n_rows = len(getattr(case, attribute))
+    if row != int(row) or not 1 <= row <= n_rows:
+        raise ValueError(f"Row {row:g} out of range for {attribute} table.")
+    return int(row) - 1
+
+
+def _apply_change(edits, tbl, row, col, typ, val):
+    case = edits.case
+    if tbl in (CT_TLOAD, CT_TAREALOAD):
+        _apply_load_change(edits, tbl, row, col, typ, val)
+        return
+    if tbl not in CT_TABLES:
+        raise ValueError(f"Unsupported table type {tbl:g} in changes table.")
+
+    attribute = CT_TABLES[tbl]
+    rows = _change_rows(case, tbl, row, attribute)
+    if attribute == "gencost":
+        values = edits.table("gencost")
+        if col in (CT_MODCOST_F, CT_MODCOST_X):
+            if typ not in (CT_REL, CT_ADD):
+                raise ValueError(
+                    f"Unsupported modification type {typ:g} for gencost table"
+                    " CT_MODCOST_F/X modification."
+                )
+            modtype = ("SCALE_" if typ == CT_REL else "SHIFT_") + (
+                "F" if col == CT_MODCOST_F else "X"
+            )
+            values[rows] = modcost(values[rows], val, modtype)
+            return
+        if col < 1 or col != int(col) or col > values.shape[1]:
+            raise ValueError(
+                f"Modification to column {col:g} of gencost table not supported."
+            )
+        _modify(values[:, int(col) - 1], rows, typ, val, attribute)
+        return
+
+    column = _column_name(attribute, col)
+    _modify(edits.get(attribute, column), rows, typ, val, attribute)
+
+
+def _load_zone(edits, tbl, row):
+    """Buses of a load change, and dispatchable loads at them."""
+    case = edits.case
+    if tbl == CT_TLOAD:
+        zone = np.zeros(len(case.bus), dtype=bool)
+        zone[_change_rows(case, CT_TBUS, row, "bus")] = True
+    else:
+        zone = case.bus["BUS_AREA"].to_numpy() == row
+
+    index = pd.Index(case.bus["BUS_I"].to_numpy())
+    gen_bus = index.get_indexer(case.gen["GEN_BUS"].to_numpy())
+    is_ld = (
+        (edits.peek("gen", "PMIN") < 0)
+        & (edits.peek("gen", "PMAX") == 0)
+        & (edits.peek("gen", "GEN_STATUS") > 0)
+    )
+    return zone, np.flatnonzero(is_ld & zone[gen_bus]), gen_bus
+
+
+def _apply_load_change(edits, tbl, row, col, typ, val):
+    case = edits.case
+    if abs(col) not in CT_LOAD_OPTIONS:
+        raise ValueError(f"Column {col:g} for load modifications is not supported.")
+    which, pq = CT_LOAD_OPTIONS[abs(col)]
+    zone, ld, gen_bus = _load_zone(edits, tbl, row)
+
+    scale = _load_change_scale(edits, zone, ld, gen_bus, typ, val, which)
+    if which != "DISPATCHABLE" and zone.any():
+        for column in ("PD", "QD") if pq else ("PD",):
+            edits.get("bus", column)[zone] *= scale
+    if which != "FIXED" and len(ld):
+        for column in ("PG", "PMIN", "QG", "QMIN", "QMAX") if pq else ("PG", "PMIN"):
+            edits.get("gen", column)[ld] *= scale
+        if col < 0 and "gencost" in case.attributes:
+            # costs of dispatchable loads, including reactive costs
+            values = edits.table("gencost")
+            rows = ld
+            if pq and len(values) == 2 * len(case.gen):
+                rows = np.r_[ld, ld + len(case.gen)]
+            values[rows] = modcost(values[rows], scale, "SCALE_F")
+            values[rows] = modcost(values[rows], scale, "SCALE_X")
+
+
+def _load_change_scale(edits, zone, ld, gen_bus, typ, val, which):
+    """Scale factor of a load change, as MATPOWER `scale_load`."""
+    if typ == CT_REL:
+        return val
+    elif typ not in (CT_REP, CT_ADD):
+        raise ValueError(f"Unsupported modification type {typ:g} for loads.")
+
+    pd_ = edits.peek("bus", "PD")
+    dmd = val
+    if typ == CT_ADD:
+        # total of fixed and actual dispatchable load, as MATPOWER `total_load`
+        on = edits.case.bus["BUS_TYPE"].to_numpy() != BUS_TYPES["NONE"]
+        ld_on = ld[on[gen_bus[ld]]]
+        dmd += pd_[zone & on].sum() - edits.peek("gen", "PG")[ld_on].sum()
+    dispatchable = -edits.peek("gen", "PMIN")[ld].sum()
+    return _load_scale(dmd, pd_[zone].sum(), dispatchable, which)
+
+
+def _load_scale(dmd, fixed, dispatchable, which):
+    """Scale factor making the selected loads of a zone total dmd."""
+    if which == "BOTH":
+        base, other = fixed + dispatchable, 0
+    elif which == "FIXED":
+        base, other = fixed, dispatchable
+    else:
+        base, other = dispatchable, fixed
+    if base != 0:
+        return (dmd - other) / base
+    if dmd == other:
+        return 1.0
+    raise ValueError(
+        f"Impossible to make zone load equal {dmd:g} by scaling non-existent"
+        f" {which.lower()} load."
+    )
+
+
+def _label_edits(case, chgtab, rows):
+    edits = _ColumnEdits(case)
+    for tbl, row, col, typ, val in chgtab[rows][
+        :, [CT_TABLE, CT_ROW, CT_COL, CT_CHGTYPE, CT_NEWVAL]
+    ]:
+        _apply_change(edits, tbl, row, col, typ, val)
+    return edits
+
+
+def apply_changes(case, label, chgtab):
+    """
+    Apply the changes of one label to a case, equivalent to MATPOWER
+    `apply_changes`.
+
+
+    Args:
+        case (CaseFrames):
+            Case to be modified, not changed.
+        label (int):
+            Change set label.
+        chgtab (array_like | pd.DataFrame):
+            Changes table, see `matpowercaseframes.idx.ct`. Rows and columns in it
+            are 1-based, as in MATPOWER.
+
+
+    Returns:
+        CaseFrames: Shallow copy of case with the modified columns replaced.
+    """
+    chgtab = changes_table(chgtab)
+    rows = np.flatnonzero(chgtab[:, CT_LABEL] == label)
+    if len(rows) == 0:
+        raise ValueError(f"Label {label} not found in changes table.")
+    return _label_edits(case, chgtab, rows).to_case()
+
+
+def iter_changes(case, chgtab):
+    """
+    Lazily apply every change set of a changes table.
+
+
+    Args:
+        case (CaseFrames):
+            Base case, not changed.
+        chgtab (array_like | pd.DataFrame):
+            Changes table, see `matpowercaseframes.idx.ct`.
+
+
+    Yields:
+        tuple: (label, CaseFrames) for each label, in increasing label order.
+    """
+    chgtab = changes_table(chgtab)
+    labels, groups = group_changes(chgtab)
+    for label, rows in zip(labels, groups):
+        yield label, _label_edits(case, chgtab, rows).to_case()
+
+
+def _is_cell_change(chgtab):
+    """Changes of a single cell of a bus, gen, or branch column."""
+    tbl, row, col = chgtab[:, CT_TABLE], chgtab[:, CT_ROW], chgtab[:, CT_COL]
+    simple = np.isin(tbl, [CT_TBUS, CT_TGEN, CT_TBRCH]) & (row >= 1) & (col >= 1)
+    return simple & np.isin(chgtab[:, CT_CHGTYPE], [CT_REP, CT_REL, CT_ADD])
+
+
+def _update_cells(batch, chgtab, scenario):
+    """Apply single cell changes of all labels, grouped by table and column."""
+    keys = chgtab[:, [CT_TABLE, CT_COL]]
+    for tbl, col in np.unique(keys, axis=0):
+        attribute = CT_TABLES[tbl]
+        column = _column_name(attribute, col)
+        k = np.flatnonzero((keys[:, 0] == tbl) & (keys[:, 1] == col))
+        rows = chgtab[k, CT_ROW]
+        if (rows != rows.astype(int)).any() or rows.max() > len(
+            getattr(batch.base, attribute)
+        ):
+            raise ValueError(f"Row out of range for {attribute} table.")
+        for typ, how in [(CT_REP, "replace"), (CT_REL, "scale"), (CT_ADD, "shift")]:
+            m = chgtab[k, CT_CHGTYPE] == typ
+            if m.any():
+                values = chgtab[k[m], CT_NEWVAL]
+                rows_m = rows[m].astype(int) - 1
+                batch.update(attribute, column, scenario[k[m]], rows_m, values, how)
+
+
+def changes_batch(case, chgtab):
+    """
+    Apply every change set of a changes table into a CaseBatch.
+
+    When all changes modify single cells of the bus, gen, or branch table and no
+    cell is changed twice within a label (as in contingency lists), they are
+    applied across all labels at once with vectorized index operations.
+
+
+    Args:
+        case (CaseFrames):
+            Base case, not changed.
+        chgtab (array_like | pd.DataFrame):
+            Changes table, see `matpowercaseframes.idx.ct`.
+
+
+    Returns:
+        tuple: (labels, CaseBatch) with one scenario per label, in increasing label
+            order.
+    """
+    from .batch import CaseBatch
+
+    chgtab = changes_table(chgtab)
+    labels, groups = group_changes(chgtab)
+    batch = CaseBatch(case, n_scenarios=len(labels))
+
+    scenario = np.searchsorted(labels, chgtab[:, CT_LABEL])
+    cells = np.c_[scenario, chgtab[:, [CT_TABLE, CT_ROW, CT_COL]]]
+    if _is_cell_change(chgtab).all() and len(np.unique(cells, axis=0)) == len(cells):
+        _update_cells(batch, chgtab, scenario)
+        return labels, batch
+
+    for s, rows in enumerate(groups):
+        for attribute, column, values in _label_edits(case, chgtab, rows).items():
+            batch.set(attribute, column, values, scenarios=s)
+    return labels, batch
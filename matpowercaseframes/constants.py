@@ -176,6 +176,76 @@ COLUMNS = {
     "case": ["CASENAME", "VERSION", "BASE_MVA", "F"],
 }
 
+# columns rescaled by per-unit conversion, grouped by their physical unit
+PU_COLUMNS = {
+    "bus": {
+        "MW": ["PD", "QD", "GS", "BS"],
+        "u/MW": ["LAM_P", "LAM_Q"],
+        "deg": ["VA"],
+    },
+    "gen": {
+        "MW": [
+            "PG",
+            "QG",
+            "QMAX",
+            "QMIN",
+            "PMAX",
+            "PMIN",
+            "PC1",
+            "PC2",
+            "QC1MIN",
+            "QC1MAX",
+            "QC2MIN",
+            "QC2MAX",
+            "RAMP_AGC",
+            "RAMP_10",
+            "RAMP_30",
+            "RAMP_Q",
+        ],
+        "u/MW": ["MU_PMAX", "MU_PMIN", "MU_QMAX", "MU_QMIN"],
+    },
+    "branch": {
+        "MW": ["RATE_A", "RATE_B", "RATE_C", "PF", "QF", "PT", "QT"],
+        "u/MW": ["MU_SF", "MU_ST"],
+        "deg": ["SHIFT", "ANGMIN", "ANGMAX"],
+        "u/deg": ["MU_ANGMIN", "MU_ANGMAX"],
+    },
+    "dcline": {
+        "MW": [
+            "PF",
+            "PT",
+            "QF",
+            "QT",
+            "PMIN",
+            "PMAX",
+            "QMINF",
+            "QMAXF",
+            "QMINT",
+            "QMAXT",
+            "LOSS0",
+        ],
+        "u/MW": [
+            "MU_PMIN",
+            "MU_PMAX",
+            "MU_QMINF",
+            "MU_QMAXF",
+            "MU_QMINT",
+            "MU_QMAXT",
+        ],
+    },
+}
+
+# cost tables rescaled by per-unit conversion, based on each row's cost model
+PU_COST_ATTRIBUTES = ("gencost", "dclinecost")
+
+# columns written by power flow and OPF solutions, rather than case inputs
+RESULT_COLUMNS = {
+    "bus": ["LAM_P", "LAM_Q", "MU_VMAX", "MU_VMIN"],
+    "gen": ["MU_PMAX", "MU_PMIN", "MU_QMAX", "MU_QMIN"],
+    "branch": ["PF", "QF", "PT", "QT", "MU_SF", "MU_ST", "MU_ANGMIN", "MU_ANGMAX"],
+    "dcline": ["MU_PMIN", "MU_PMAX", "MU_QMINF", "MU_QMAXF", "MU_QMINT", "MU_QMAXT"],
+}
+
 # TODO:
 # Support following attributes:
 # 'ct'
@@ -0,0 +1,333 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .utils import index_positions
+
+# status column of each element that can be outaged
+STATUS_COLUMNS = {"branch": "BR_STATUS", "gen": "GEN_STATUS", "dcline": "BR_STATUS"}
+
+Contingency = namedtuple("Contingency", ["attribute", "index", "position"])
+Contingency.__doc__ = """
+Outage of one element: table name, index label, and 0-based row position.
+"""
+
+
+def _branch_ends(case):
+    """Bus positions of the in-service branch ends, and the branch positions."""
+    index = pd.Index(case.bus["BUS_I"].to_numpy())
+    branch = case.branch
+    on = np.flatnonzero(branch["BR_STATUS"].to_numpy() > 0)
+    f = index_positions(index, branch["F_BUS"].to_numpy()[on])
+    t = index_positions(index, branch["T_BUS"].to_numpy()[on])
+    return f, t, on
+
+
+def radial_branches(case):
+    """
+    Find in-service branches connecting a bus with no other in-service branch, whose
+    outage isolates that bus.
+
+
+    Args:
+        case (CaseFrames):
+            Case with bus and branch tables.
+
+
+    Returns:
+        np.ndarray: Boolean mask over the branch rows.
+
+
+    Raises:
+        ValueError: If an in-service branch references a missing bus.
+    """
+    f, t, on = _branch_ends(case)
+    loop = f == t
+    degree = np.bincount(np.r_[f[~loop], t[~loop]], minlength=len(case.bus))
+    mask = np.zeros(len(case.branch), dtype=bool)
+    mask[on] = ((degree[f] == 1) | (degree[t] == 1)) & ~loop
+    return mask
+
+
+def bridges(case):
+    """
+    Find in-service branches whose outage splits their island in two.
+
+    Parallel branches are never bridges. Uses the cached `CaseFrames.topology`
+    when scipy is installed, otherwise an iterative depth-first search (Tarjan),
+    both linear in the size of the network.
+
+
+    Args:
+        case (CaseFrames):
+            Case with bus and branch tables.
+
+
+    Returns:
+        np.ndarray: Boolean mask over the branch rows.
+
+
+    Raises:
+        ValueError: If an in-service branch references a missing bus.
+    """
+    try:
+        import scipy  # noqa: F401
+    except ImportError:
+        return _bridges_dfs(case)
+    return case.topology(dcline=False).bridges()
+
+
+def _bridges_dfs(case):
+    """Bridges found by an iterative depth-first search (Tarjan), without scipy."""
+    f, t, on = _branch_ends(case)
+    n_bus = len(case.bus)
+    # adjacency in CSR layout, each edge stored in both directions
+    heads = np.r_[f, t]
+    tails = np.r_[t, f]
+    edges = np.r_[np.arange(len(f)), np.arange(len(f))]
+    order = np.argsort(heads, kind="stable")
+    tails, edges = tails[order].tolist(), edges[order].tolist()
+    start = np.r_[0, np.cumsum(np.bincount(heads, minlength=n_bus))].tolist()
+
+    is_bridge = np.zeros(len(f), dtype=bool)
+    disc = [-1] * n_bus
+    low = [0] * n_bus
+    counter = 0
+    for root in range(n_bus):
+        if disc[root] >= 0:
+            continue
+        disc[root] = low[root] = counter
+        counter += 1
+        stack = [(root, -1, start[root])]
+        while stack:
+            u, parent_edge, k = stack[-1]
+            if k < start[u + 1]:
+                stack[-1] = (u, parent_edge, k + 1)
+                v, e = tails[k], edges[k]
+                if e == parent_edge:
+                    continue
+                if disc[v] < 0:
+                    disc[v] = low[v] = counter
+                    counter += 1
+                    stack.append((v, e, start[v]))
+                else:
+                    low[u] = min(low[u], disc[v])
+            else:
+                stack.pop()
+                if stack:
+                    p = stack[-1][0]
+                    low[p] = min(low[p], low[u])
+                    if low[u] > disc[p]:
+                        is_bridge[parent_edge] = True
+    mask = np.zeros(len(case.branch), dtype=bool)
+    mask[on[is_bridge]] = True
+    return mask
+
+
+def _voltage_level(case, attribute):
+    """Highest base kV of the buses of each element."""
+    base_kv = case.bus["BASE_KV"].to_numpy(dtype=float)
+    index = pd.Index(case.bus["BUS_I"].to_numpy())
+    df = getattr(case, attribute)
+    if attribute == "gen":
+        return base_kv[index_positions(index, df["GEN_BUS"].to_numpy(), attribute)]
+    return np.maximum(
+        base_kv[index_positions(index, df["F_BUS"].to_numpy(), attribute)],
+        base_kv[index_positions(index, df["T_BUS"].to_numpy(), attribute)],
+    )
+
+
+def contingencies(
+    case,
+    elements=("branch", "gen"),
+    skip_radial=False,
+    skip_bridges=False,
+    min_kv=None,
+    max_kv=None,
+):
+    """
+    List N-1 outages of in-service elements.
+
+
+    Args:
+        case (CaseFrames):
+            Base case.
+        elements (tuple):
+            Tables whose elements are outaged, among 'branch', 'gen', and 'dcline'.
+        skip_radial (bool):
+            Whether to skip radial branches, whose outage isolates a bus.
+        skip_bridges (bool):
+            Whether to skip branches whose outage splits an island, including
+            radial branches.
+        min_kv, max_kv (float | None):
+            Only outage elements whose highest bus base kV is within the range.
+
+
+    Returns:
+        list: List of Contingency, grouped by table in the order of elements.
+
+
+    Raises:
+        ValueError: If an element table is not supported, or references a
+            missing bus.
+    """
+    result = []
+    for attribute in elements:
+        if attribute not in STATUS_COLUMNS:
+            raise ValueError(
+                f"Outages of '{attribute}' are not supported, use"
+                f" {list(STATUS_COLUMNS)}."
+            )
+        if attribute not in case.attributes:
+            continue
+        df = getattr(case, attribute)
+        mask = df[STATUS_COLUMNS[attribute]].to_numpy() > 0
+        if attribute == "branch" and skip_bridges:
+            mask &= ~bridges(case)
+        elif attribute == "branch" and skip_radial:
+            mask &= ~radial_branches(case)
+        if min_kv is not None or max_kv is not None:
+            level = _voltage_level(case, attribute)
+            if min_kv is not None:
+                mask &= level >= min_kv
+            if max_kv is not None:
+                mask &= level <= max_kv
+        positions = np.flatnonzero(mask)
+        result.extend(
+            Contingency(attribute, label, int(p))
+            for label, p in zip(df.index[positions], positions)
+        )
+    return result
+
+
+def outage_case(case, contingency):
+    """
+    Case with one element out of service.
+
+    Only the status column of the outaged table is new; every other column is
+    shared with case under pandas Copy-on-Write, so a variant costs one column.
+
+
+    Args:
+        case (CaseFrames):
+            Base case, not changed.
+        contingency (Contingency):
+            Outage to apply.
+
+
+    Returns:
+        CaseFrames: Shallow copy of case with the element out of service.
+    """
+    attribute, _, position = contingency
+    variant = case.copy()
+    df = getattr(variant, attribute)
+    column = STATUS_COLUMNS[attribute]
+    status = df[column].to_numpy(copy=True)
+    status[position] = 0
+    df[column] = status
+    return variant
+
+
+def iter_outages(case, outages=None, **filters):
+    """
+    Lazily yield N-1 outage variants of a case.
+
+    Variants are built one at a time, see `outage_case`, so only the variant being
+    consumed is kept in memory.
+
+
+    Args:
+        case (CaseFrames):
+            Base case, not changed.
+        outages (list | None):
+            Contingencies to apply. Defaults to `contingencies(case, **filters)`.
+        **filters:
+            Passed to `contingencies`.
+
+
+    Yields:
+        tuple: (Contingency, CaseFrames).
+    """
+    if outages is None:
+        outages = contingencies(case, **filters)
+    for contingency in outages:
+        yield contingency, outage_case(case, contingency)
+
+
+# base case and function of a worker process, set once by _init_worker
+_WORKER = {}
+
+
+def _init_worker(case, func):
+    from .shared import SharedCaseDescriptor
+
+    if isinstance(case, SharedCaseDescriptor):
+        case = case.attach()
+    _WORKER["case"] = case
+    _WORKER["func"] = func
+
+
+def _run_outages(outages):
+    case, func = _WORKER["case"], _WORKER["func"]
+    return [func(outage_case(case, contingency)) for contingency in outages]
+
+
+def map_outages(
+    func, case, outages=None, processes=None, chunksize=None, shared=False, **filters
+):
+    """
+    Evaluate a function on every N-1 outage variant, keeping only its results.
+
+
+    Args:
+        func (callable):
+            Function of a CaseFrames, e.g. `CaseFrames.run_dcpf` or a function
+            extracting a few values of its result. Must be picklable when
+            processes are used.
+        case (CaseFrames):
+            Base case, not changed.
+        outages (list | None):
+            Contingencies to apply. Defaults to `contingencies(case, **filters)`.
+        processes (int | None):
+            Number of worker processes. The base case is sent once to each worker
+            and only contingencies are sent per task. If None, run serially.
+        chunksize (int | None):
+            Contingencies per task. Defaults to an even split into 4 tasks per
+            worker.
+        shared (bool):
+            Whether to send the base case to workers through shared memory, see
+            `matpowercaseframes.shared`, instead of pickling it to each worker.
+        **filters:
+            Passed to `contingencies`.
+
+
+    Returns:
+        dict: {Contingency: result}, in the order of outages.
+    """
+    if outages is None:
+        outages = contingencies(case, **filters)
+    outages = list(outages)
+    if processes is None or processes <= 1 or len(outages) <= 1:
+        return {c: func(variant) for c, variant in iter_outages(case, outages)}
+
+    if chunksize is None:
+        chunksize = max(1, -(-len(outages) // (4 * processes)))
+    chunks = [outages[i : i + chunksize] for i in range(0, len(outages), chunksize)]
+    if shared:
+        from .shared import SharedCaseFrames
+
+        with SharedCaseFrames(case) as shared_case:
+            results = _map_chunks(shared_case.descriptor, func, chunks, processes)
+    else:
+        results = _map_chunks(case, func, chunks, processes)
+    return dict(zip(outages, results))
+
+
+def _map_chunks(case, func, chunks, processes):
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=processes, initializer=_init_worker, initargs=(case, func)
+    ) as executor:
+        return [r for chunk in executor.map(_run_outages, chunks) for r in chunk]
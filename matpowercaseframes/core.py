@@ -4,14 +4,30 @@
 
 import copy
 import os
-import warnings
+from collections import namedtuple
 
 import numpy as np
 import pandas as pd
 
-from .constants import ATTRIBUTES, ATTRIBUTES_INFO, ATTRIBUTES_NAME, COLUMNS
+from .constants import (
+    ATTRIBUTES,
+    ATTRIBUTES_INFO,
+    ATTRIBUTES_NAME,
+    COLUMNS,
+    RESULT_COLUMNS,
+)
+from .costs import cost_columns
+from .perunit import PerUnitView, convert_pu
 from .reader import find_attributes, find_name, parse_file
-from .utils import get_attr, has_attr
+from .utils import (
+    changed_columns,
+    copy_on_write,
+    data_token,
+    get_attr,
+    has_attr,
+    index_positions,
+    lazy_copy,
+)
 
 try:
     import matpower
@@ -30,6 +46,125 @@ def display(*args, **kwargs):
         print(*args, **kwargs)
 
 
+def _copy_value(value, deep=False):
+    """
+    Copy a struct member, sharing immutable or copy-on-write data when shallow.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=True) if deep else lazy_copy(value)
+    if isinstance(value, BaseStruct):
+        return value.copy(deep=deep)
+    if deep:
+        return copy.deepcopy(value)
+    if isinstance(value, (dict, list)):
+        # containers such as _attributes and columns_templates are mutated in place
+        return copy.copy(value)
+    return value
+
+
+# members not pickled, restored empty or dropped (None)
+_UNPICKLED = {
+    "_cache": dict,
+    "_cache_stats": dict,
+    "_clean": None,
+    "_shared_memory": None,
+    "_cow_base": None,
+}
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "currsize"])
+CacheInfo.__doc__ = """
+Statistics of the derived-results cache of a CaseFrames, see `CaseFrames.memoize`.
+"""
+
+
+def _frozen_table(df):
+    """
+    Table over read-only views of the columns of df, without copying.
+
+    Columns with extension dtypes (e.g. strings) are shared as they are.
+    """
+    data = {}
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy().view()
+            values.flags.writeable = False
+        else:
+            values = column.array
+        data[i] = values
+    frozen = pd.DataFrame(data, index=df.index, copy=False)
+    frozen.columns = df.columns
+    return frozen
+
+
+def _table_data(df):
+    """
+    Data of a DataFrame to pickle: its index, its columns, and its values split
+    into runs of adjacent columns of one dtype. Each numeric run is one 2-D array,
+    which numpy pickles as one `pickle.PickleBuffer` under protocol 5, without
+    copying when the run lies in one pandas block. Other runs are DataFrames.
+    """
+    dtypes = list(df.dtypes)
+    runs = []
+    start = 0
+    for stop in range(1, len(dtypes) + 1):
+        if stop < len(dtypes) and dtypes[stop] == dtypes[start]:
+            continue
+        run = df.iloc[:, start:stop]
+        dtype = dtypes[start]
+        if isinstance(dtype, np.dtype) and dtype.kind in "biufc":
+            run = run.to_numpy()
+        runs.append(run)
+        start = stop
+    return df.index, df.columns, runs
+
+
+def _table_from_data(index, columns, runs, frozen=False):
+    """
+    Rebuild a table from `_table_data`. Arrays are used without copies, except
+    read-only ones (e.g. loaded from bytes sent out-of-band) of a struct that is
+    not frozen, which are copied so that the table can be written into.
+    """
+    parts = []
+    for run in runs:
+        if isinstance(run, pd.DataFrame):
+            parts.append(lazy_copy(run))
+            continue
+        if not (frozen or run.flags.writeable):
+            run = run.copy()
+        parts.append(pd.DataFrame(run, index=index, copy=False))
+    if not parts:
+        return pd.DataFrame(index=index, columns=columns)
+    if len(parts) == 1:
+        df = parts[0]
+    else:
+        # without Copy-on-Write, concat copies unless told not to
+        df = pd.concat(parts, axis=1, **({} if copy_on_write() else {"copy": False}))
+    df.columns = columns
+    return df
+
+
+def _rebuild_struct(cls, state, tables):
+    """Rebuild a struct pickled by `BaseStruct.__reduce_ex__`."""
+    new = cls.__new__(cls)
+    for key, value in state.items():
+        if key == "_frozen":
+            continue
+        if key in _UNPICKLED:
+            if _UNPICKLED[key] is None:
+                continue
+            value = _UNPICKLED[key]()
+        elif key == "columns_templates" and value is None:
+            value = copy.deepcopy(COLUMNS)
+        object.__setattr__(new, key, value)
+    frozen = state.get("_frozen", False)
+    for key, index, columns, runs in tables:
+        object.__setattr__(new, key, _table_from_data(index, columns, runs, frozen))
+    if frozen:
+        new.freeze()
+    return new
+
+
 class BaseStruct:
     """
     Base class for struct-like containers.
@@ -49,7 +184,12 @@ class BaseStruct:
         Args:
             name (str): Attribute name.
             value: Attribute value.
+
+
+        Raises:
+            AttributeError: If the struct is frozen.
         """
+        self._check_not_frozen(name)
         if name not in self._attributes:
             self._attributes.append(name)
         super().__setattr__(name, value)
@@ -65,6 +205,151 @@ class BaseStruct:
         """
         return self._attributes
 
+    def copy(self, deep=False):
+        """
+        Make a copy of the struct.
+
+        By default the copy is shallow: new DataFrame objects are created for every
+        table, but they share the underlying column data with the original. With
+        pandas Copy-on-Write (default since pandas 3.0), a column is only duplicated
+        once it is modified in either object, so tables that are never touched cost
+        no memory. Without Copy-on-Write (pandas < 3.0 unless enabled), tables are
+        copied deeply, see `utils.lazy_copy`.
+
+
+        Args:
+            deep (bool):
+                Whether to eagerly copy all data. Defaults to False.
+
+
+        Returns:
+            BaseStruct: Copy of the struct, of the same class.
+        """
+        new = self.__class__.__new__(self.__class__)
+        for key, value in self.__dict__.items():
+            if key == "_frozen" or (key == "_cow_base" and deep):
+                continue
+            if key == "_cow_base":
+                # kept alive so that copies keep sharing references with it
+                object.__setattr__(new, key, value)
+                continue
+            if not deep and isinstance(value, pd.DataFrame):
+                value = self._table_copy(key)
+            else:
+                value = _copy_value(value, deep=deep)
+            object.__setattr__(new, key, value)
+        return new
+
+    def _table_copy(self, key):
+        """Shallow copy of a table that can be written into, also when frozen."""
+        if self.frozen:
+            return lazy_copy(self._cow_base[key])
+        return lazy_copy(getattr(self, key))
+
+    def __copy__(self):
+        return self.copy()
+
+    @property
+    def frozen(self):
+        """bool: Whether the struct is frozen, see `freeze`."""
+        return self.__dict__.get("_frozen", False)
+
+    def freeze(self):
+        """
+        Make the struct read-only, in place.
+
+        Every table is rebuilt over read-only views of its columns (NumPy
+        `writeable=False`) without copying, so writing into a table raises
+        `ValueError`, and setting an attribute raises `AttributeError`. Nested
+        structs are frozen too. Derived results cached by a frozen case (e.g.
+        `make_ybus`, `content_hash`, or `bus_index`) stay valid, so it can be read
+        from many threads without locks or defensive copies.
+
+        Use `thaw` (or `copy`) to get a mutable copy-on-write version.
+
+
+        Returns:
+            BaseStruct: The struct itself.
+        """
+        if self.frozen:
+            return self
+        # Copies are made from twin tables over the same read-only data. Pandas
+        # copies shared data before writing into it, so copies stay writable, while
+        # the frozen tables share no references and keep raising on writes.
+        cow_base = {}
+        for key, value in list(self.__dict__.items()):
+            if isinstance(value, pd.DataFrame):
+                frozen = _frozen_table(value)
+                cow_base[key] = _frozen_table(frozen)
+                object.__setattr__(self, key, frozen)
+            elif isinstance(value, BaseStruct):
+                value.freeze()
+        object.__setattr__(self, "_cow_base", cow_base)
+        object.__setattr__(self, "_frozen", True)
+        return self
+
+    def thaw(self):
+        """
+        Make a mutable copy of a frozen struct.
+
+        The copy shares all data with the frozen struct under pandas Copy-on-Write,
+        so only the columns written into are duplicated. Without Copy-on-Write, the
+        data is copied, see `copy`.
+
+
+        Returns:
+            BaseStruct: Mutable shallow copy, see `copy`.
+        """
+        return self.copy()
+
+    def _check_not_frozen(self, name):
+        if self.frozen:
+            raise AttributeError(
+                f"Cannot set '{name}' of a frozen {self.__class__.__name__}, use"
+                " thaw() to get a mutable copy."
+            )
+
+    def __setattr__(self, name, value):
+        self._check_not_frozen(name)
+        super().__setattr__(name, value)
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickle support, also used by `copy.copy` and `copy.deepcopy`.
+
+        The numeric columns of each table are passed as one 2-D array per run of
+        adjacent columns of one dtype (usually one per pandas block), which numpy
+        pickles under protocol 5 as a `pickle.PickleBuffer` that can be sent
+        out-of-band without copies (e.g. with a `buffer_callback`). Derived caches
+        are not pickled.
+
+        Buffers loaded out-of-band are used without copies when writable (e.g.
+        bytearray) or when the struct was frozen. Read-only buffers (e.g. bytes)
+        of a mutable struct are copied on load, so that its tables can be written
+        into.
+
+
+        Args:
+            protocol (int):
+                Pickle protocol.
+
+
+        Returns:
+            tuple: Reduce value.
+        """
+        state = {}
+        tables = []
+        for key, value in self.__dict__.items():
+            if key in _UNPICKLED:
+                state[key] = None
+            elif isinstance(value, pd.DataFrame):
+                tables.append((key, *_table_data(value)))
+            elif key == "columns_templates" and value == COLUMNS:
+                state[key] = None  # default templates, rebuilt when loading
+            else:
+                state[key] = value
+        return _rebuild_struct, (self.__class__, state, tables)
+
     @staticmethod
     def _infer_numpy(df):
         """
@@ -489,6 +774,7 @@ class CaseFrames(DataFramesStruct):
         """
         # TODO: support Path object
         super().__init__()
+        self._cache = {}
         if columns_templates is None:
             self.columns_templates = copy.deepcopy(COLUMNS)
         else:
@@ -993,31 +1279,8 @@ class CaseFrames(DataFramesStruct):
                     f" than the expected number."
                 )
                 raise IndexError(msg)
-            NCOST = n_cols - len(columns)
-            # Warning if mixed models exist
-            gencost_models = data[:, 0]
-            first_row_model = int(gencost_models[0])  # TODO: support mixed models
-            unique_models = np.unique(gencost_models).astype(int)
-
-            if len(unique_models) > 1:
-                warnings.warn(
-                    f"Mixed cost models detected in {attribute}: "
-                    f"{unique_models.tolist()}. "
-                    f"Using model type {first_row_model} from first row. "
-                    "Mixed models are not fully supported.",
-                    UserWarning,
-                    stacklevel=2,
-                )
-
-            if first_row_model == 1:  # PW_LINEAR
-                ncost_cols = [
-                    f"{prefix}{i}"
-                    for i in range(1, (NCOST // 2) + 1)
-                    for prefix in ("X", "Y")
-                ]
-                columns = columns + ncost_cols
-            else:  # POLYNOMIAL
-                columns = columns + [f"C{i}" for i in range(NCOST - 1, -1, -1)]
+            # parameters of mixed models are named generically, see CostCurves
+            columns = columns + cost_columns(data[:, 0], n_cols - len(columns))
 
         return pd.DataFrame(data, columns=columns)
 
@@ -1193,66 +1456,855 @@ class CaseFrames(DataFramesStruct):
         """
         Create a new CaseFrame object with data in p.u. and rad.
 
+        The new object is a shallow copy (see `copy`), only the rescaled columns are
+        newly allocated. Cost coefficients in `gencost` and `dclinecost` are rescaled
+        so that evaluating them at p.u. power gives the same cost.
+
 
         Returns:
             CaseFrames: CaseFrames object with data in p.u. and rad.
         """
-        # TODO: resclace cost based on mode
-        cf = copy.deepcopy(self)
-
-        if "bus" in self.attributes:
-            columns = ["PD", "QD", "GS", "BS"]
-            columns_exist = [col for col in columns if col in cf.bus.columns]
-            cf.bus[columns_exist] = cf.bus[columns_exist] / self.baseMVA
-            columns = ["LAM_P", "LAM_Q"]
-            columns_exist = [col for col in columns if col in cf.bus.columns]
-            cf.bus[columns_exist] = cf.bus[columns_exist] * self.baseMVA
-            cf.bus["VA"] = cf.bus["VA"] * np.pi / 180
-
-        if "gen" in self.attributes:
-            columns = [
-                "PG",
-                "QG",
-                "QMAX",
-                "QMIN",
-                "PMAX",
-                "PMIN",
-                "PC1",
-                "PC2",
-                "QC1MIN",
-                "QC1MAX",
-                "QC2MIN",
-                "QC2MAX",
-                "RAMP_AGC",
-                "RAMP_10",
-                "RAMP_30",
-                "RAMP_Q",
-            ]
-            columns_exist = [col for col in columns if col in cf.gen.columns]
-            cf.gen[columns_exist] = cf.gen[columns_exist] / self.baseMVA
-
-            columns = ["MU_PMAX", "MU_PMIN", "MU_QMAX", "MU_QMIN"]
-            columns_exist = [col for col in columns if col in cf.gen.columns]
-            cf.gen[columns_exist] = cf.gen[columns_exist] * self.baseMVA
-
-        if "branch" in self.attributes:
-            columns = ["RATE_A", "RATE_B", "RATE_C", "PF", "QF", "PT", "QT"]
-            columns_exist = [col for col in columns if col in cf.branch.columns]
-            cf.branch[columns_exist] = cf.branch[columns_exist] / self.baseMVA
-
-            columns = ["MU_SF", "MU_ST"]
-            columns_exist = [col for col in columns if col in cf.branch.columns]
-            cf.branch[columns_exist] = cf.branch[columns_exist] * self.baseMVA
-
-            columns = ["SHIFT", "ANGMIN", "ANGMAX"]
-            columns_exist = [col for col in columns if col in cf.branch.columns]
-            cf.branch[columns_exist] = cf.branch[columns_exist] * np.pi / 180
-
-            columns = ["MU_ANGMIN", "MU_ANGMAX"]
-            columns_exist = [col for col in columns if col in cf.branch.columns]
-            cf.branch[columns_exist] = cf.branch[columns_exist] * 180 / np.pi
-
-        return cf
+        return convert_pu(self, inverse=False)
+
+    def from_pu(self):
+        """
+        Create a new CaseFrame object with data in MW, MVAr, and deg.
+
+        Inverse of `to_pu`, assuming this object holds data in p.u. and rad.
+
+
+        Returns:
+            CaseFrames: CaseFrames object with data in physical units.
+        """
+        return convert_pu(self, inverse=True)
+
+    def pu_view(self):
+        """
+        Create a lazy per-unit view over this CaseFrames.
+
+        Tables of the view are rescaled on first access and cached until the
+        underlying table changes, so per-unit and physical-unit consumers share one
+        case without duplicating unchanged data.
+
+
+        Returns:
+            PerUnitView: Lazy per-unit view of this CaseFrames.
+        """
+        return PerUnitView(self)
+
+    def memoize(self, key, inputs, compute):
+        """
+        Return a cached derived result, recomputing it only if its inputs changed.
+
+        Changes are tracked by column: writing into other columns or tables, or
+        rewriting an input column with equal values, keeps the cached result. Under
+        pandas Copy-on-Write (or for frozen cases), unchanged inputs are recognized
+        by their data pointers without reading values. Otherwise writes in place
+        keep the pointers, so inputs are compared by value with a snapshot. Hits and
+        misses are counted, see `cache_info`.
+
+
+        Args:
+            key (str):
+                Cache key.
+            inputs (dict):
+                Mapping of attribute name to list of input columns, or None for all
+                columns of the table.
+            compute (callable):
+                Function without arguments that computes the result.
+
+
+        Returns:
+            Any: Result of compute.
+
+
+        Example:
+            >>> cf.memoize("n_on", {"branch": ["BR_STATUS"]},
+            ...            lambda: int((cf.branch["BR_STATUS"] > 0).sum()))
+        """
+        # NOTE: objects created without __init__ (e.g. old pickles) have no cache
+        cache = self.__dict__.setdefault("_cache", {})
+        stats = self.__dict__.setdefault("_cache_stats", {})
+        tables = {attribute: getattr(self, attribute) for attribute in inputs}
+        token = (
+            getattr(self, "baseMVA", None),
+            tuple(
+                # index objects are immutable, relabeling rows replaces them
+                (attribute, id(df.index), data_token(df, inputs[attribute]))
+                for attribute, df in tables.items()
+            ),
+        )
+        hits, misses = stats.get(key, (0, 0))
+        entry = cache.get(key)
+        trust_token = self.frozen or copy_on_write()
+        if entry is not None and (
+            (trust_token and entry[1] == token)
+            or self._inputs_unchanged(entry, token, tables, inputs)
+        ):
+            stats[key] = (hits + 1, misses)
+            if entry[1] != token:
+                # equal values in new data, follow the new data from now on
+                cache[key] = (self._snapshot(tables), token, entry[2])
+            return entry[2]
+
+        stats[key] = (hits, misses + 1)
+        value = compute()
+        cache[key] = (self._snapshot(tables), token, value)
+        return value
+
+    def _snapshot(self, tables):
+        if self.frozen:
+            # read-only inputs cannot change in place, and shallow copies would let
+            # pandas copy them on write instead of raising
+            return dict(tables)
+        # keep shallow snapshots so that writes into the inputs trigger copy-on-write,
+        # or deep ones without Copy-on-Write
+        return {attribute: lazy_copy(df) for attribute, df in tables.items()}
+
+    def _inputs_unchanged(self, entry, token, tables, inputs):
+        """Whether inputs whose data were reallocated still hold equal values."""
+        snapshot, old_token, _ = entry
+        if self.frozen or old_token[0] != token[0] or snapshot.keys() != tables.keys():
+            return False
+        return not any(
+            not snapshot[attribute].index.equals(df.index)
+            or changed_columns(snapshot[attribute], df, inputs[attribute])
+            for attribute, df in tables.items()
+        )
+
+    def cache_info(self, key=None):
+        """
+        Statistics of the derived-results cache, see `memoize`.
+
+
+        Args:
+            key (str | None):
+                Cache key. If None, sum over all keys.
+
+
+        Returns:
+            CacheInfo: (hits, misses, currsize), like `functools.lru_cache`.
+        """
+        cache = self.__dict__.get("_cache", {})
+        stats = self.__dict__.get("_cache_stats", {})
+        if key is not None:
+            hits, misses = stats.get(key, (0, 0))
+            return CacheInfo(hits, misses, int(key in cache))
+        return CacheInfo(
+            sum(hits for hits, _ in stats.values()),
+            sum(misses for _, misses in stats.values()),
+            len(cache),
+        )
+
+    def cache_clear(self, key=None):
+        """
+        Drop cached derived results and their statistics.
+
+
+        Args:
+            key (str | None):
+                Cache key to drop. If None, drop all.
+        """
+        cache = self.__dict__.setdefault("_cache", {})
+        stats = self.__dict__.setdefault("_cache_stats", {})
+        if key is None:
+            cache.clear()
+            stats.clear()
+        else:
+            cache.pop(key, None)
+            stats.pop(key, None)
+
+    def mark_clean(self):
+        """
+        Start tracking changes of the tables, see `dirty_columns`.
+
+        Keeps shallow snapshots of the tables, which cost no memory until the
+        tables are written into, or deep ones without pandas Copy-on-Write, see
+        `utils.lazy_copy`. Marks are not pickled.
+        """
+        clean = {
+            attribute: self._table_copy(attribute)
+            for attribute in self.attributes
+            if isinstance(getattr(self, attribute), pd.DataFrame)
+        }
+        object.__setattr__(self, "_clean", clean)
+
+    def dirty_columns(self):
+        """
+        Find the columns changed since the last `mark_clean`.
+
+        Changes are detected by column, whether tables are written into or replaced
+        (e.g. with `set_attribute`). Rewriting a column with equal values is
+        not a change. Before any `mark_clean`, every column is dirty.
+
+
+        Returns:
+            dict: {attribute: changed columns} of the changed tables only. Tables
+                added or removed list all their columns.
+        """
+        clean = self.__dict__.get("_clean", {})
+        current = {
+            attribute: getattr(self, attribute)
+            for attribute in self.attributes
+            if isinstance(getattr(self, attribute), pd.DataFrame)
+        }
+        dirty = {}
+        for attribute in clean.keys() | current.keys():
+            if attribute not in current:
+                dirty[attribute] = list(clean[attribute].columns)
+            elif attribute not in clean:
+                dirty[attribute] = list(current[attribute].columns)
+            else:
+                columns = changed_columns(clean[attribute], current[attribute])
+                if columns:
+                    dirty[attribute] = columns
+        return dirty
+
+    def is_dirty(self, attribute=None, column=None):
+        """
+        Whether tables changed since the last `mark_clean`, see `dirty_columns`.
+
+
+        Args:
+            attribute (str | None):
+                Table to check. If None, check all tables.
+            column (str | None):
+                Column of the table to check. If None, check all columns.
+
+
+        Returns:
+            bool: Whether anything checked changed.
+        """
+        dirty = self.dirty_columns()
+        if attribute is None:
+            return bool(dirty)
+        return attribute in dirty and (column is None or column in dirty[attribute])
+
+    def content_hash(self):
+        """
+        Exact hash of every table and baseMVA, cached until they change.
+
+        Covers the values, dtypes, index, and column names of the tables, including
+        result columns, see `fingerprint`.
+
+
+        Returns:
+            str: Hexadecimal digest.
+        """
+        return self.fingerprint(
+            normalize_dtypes=False, ignore_results=False, index=True
+        )
+
+    def table_digests(self, normalize_dtypes=True, ignore_results=True, index=False):
+        """
+        Digest of each table, see `fingerprint.table_digest`.
+
+        Digests of top-level tables are cached and only recomputed for the tables
+        that changed, so a case can be rehashed incrementally after edits.
+
+
+        Args:
+            normalize_dtypes (bool):
+                Whether to hash numeric columns as float64, ignoring dtype details.
+            ignore_results (bool):
+                Whether to skip solution columns (RESULT_COLUMNS, e.g. LAM_P, MU_*,
+                or PF) and the attributes f, et, and success.
+            index (bool):
+                Whether to include the index labels.
+
+
+        Returns:
+            dict: {name: digest}, with nested tables named like 'reserves.zones'.
+        """
+        from .fingerprint import table_digest
+
+        digests = {}
+        for attribute in self.attributes:
+            if ignore_results and attribute in ("f", "et", "success"):
+                continue
+            value = getattr(self, attribute)
+            ignore = RESULT_COLUMNS.get(attribute, ()) if ignore_results else ()
+            if isinstance(value, pd.DataFrame):
+                digests[attribute] = self.memoize(
+                    f"digest:{attribute}:{normalize_dtypes}:{ignore_results}:{index}",
+                    {attribute: None},
+                    lambda df=value, ignore=ignore: table_digest(
+                        df, normalize_dtypes, ignore, index
+                    ),
+                )
+            elif isinstance(value, BaseStruct):
+                for name in value.attributes:
+                    df = getattr(value, name)
+                    if isinstance(df, pd.DataFrame):
+                        digests[f"{attribute}.{name}"] = table_digest(
+                            df, normalize_dtypes, ignore, index
+                        )
+        return digests
+
+    def fingerprint(
+        self, normalize_dtypes=True, ignore_results=True, index=False, tables=False
+    ):
+        """
+        Stable content fingerprint of the case, e.g. to deduplicate scenarios or key
+        caches.
+
+        Hashes the values of each table with vectorized NumPy operations and a
+        BLAKE2b digest of the column sums, see `fingerprint.table_digest`, which
+        takes less time than `pd.util.hash_pandas_object` on large cases (see
+        benchmarks/bench_fingerprint.py). By default the fingerprint only
+        depends on the case inputs: equal values hash equal whatever their numeric
+        dtype or index labels, and solution columns are ignored. Digests of the
+        tables are cached, see `table_digests`.
+
+
+        Args:
+            normalize_dtypes (bool):
+                Whether to hash numeric columns as float64, ignoring dtype details.
+            ignore_results (bool):
+                Whether to skip solution columns (RESULT_COLUMNS, e.g. LAM_P, MU_*,
+                or PF) and the attributes f, et, and success.
+            index (bool):
+                Whether to include the index labels.
+            tables (bool):
+                Whether to also return the digest of each table.
+
+
+        Returns:
+            str | tuple: Hexadecimal digest, or (digest, {name: digest}) if tables.
+        """
+        from .fingerprint import combine_digests
+
+        digests = self.table_digests(normalize_dtypes, ignore_results, index)
+        digest = combine_digests(digests, getattr(self, "baseMVA", None))
+        if tables:
+            return digest, digests
+        return digest
+
+    def bus_index(self):
+        """
+        Index of the bus numbers (BUS_I), cached until they change.
+
+        Its hash table is built on first lookup and reused, see `bus_positions`.
+
+
+        Returns:
+            pd.Index: Bus numbers in row order.
+        """
+        return self.memoize(
+            "bus_index",
+            {"bus": ["BUS_I"]},
+            lambda: pd.Index(self.bus["BUS_I"].to_numpy()),
+        )
+
+    def bus_positions(self, bus_numbers, attribute="branch"):
+        """
+        Map external bus numbers into 0-based row positions of the bus table.
+
+
+        Args:
+            bus_numbers (array_like):
+                External bus numbers to map.
+            attribute (str):
+                Name of the referencing table, used in the error message.
+
+
+        Returns:
+            np.ndarray: Row positions in the bus table.
+
+
+        Raises:
+            ValueError: If a bus number is not found in the bus table.
+        """
+        return index_positions(self.bus_index(), bus_numbers, attribute)
+
+    def make_ybus(self, use_cache=True):
+        """
+        Build the bus admittance matrix and branch admittance matrices.
+
+        Equivalent to MATPOWER `makeYbus`, with buses numbered by their row position
+        in the bus table. Requires scipy. The result is cached and rebuilt only when
+        baseMVA or the used columns of `bus` and `branch` change.
+
+
+        Args:
+            use_cache (bool):
+                Whether to use the cached result. Defaults to True.
+
+
+        Returns:
+            tuple: (Ybus, Yf, Yt) as scipy.sparse.csr_matrix.
+        """
+        from .network import YBUS_INPUTS, make_ybus
+
+        def compute():
+            return make_ybus(self.baseMVA, self.bus, self.branch)
+
+        if not use_cache:
+            return compute()
+        return self.memoize("ybus", YBUS_INPUTS, compute)
+
+    def make_bdc(self, use_cache=True):
+        """
+        Build the B matrices and phase shift injections for the DC power flow.
+
+        Equivalent to MATPOWER `makeBdc`, with buses numbered by their row position
+        in the bus table. Requires scipy. The result is cached and rebuilt only when
+        the used columns of `bus` and `branch` change.
+
+
+        Args:
+            use_cache (bool):
+                Whether to use the cached result. Defaults to True.
+
+
+        Returns:
+            tuple: (Bbus, Bf, Pbusinj, Pfinj), see `network.make_bdc`.
+        """
+        from .network import BDC_INPUTS, make_bdc
+
+        def compute():
+            return make_bdc(self.baseMVA, self.bus, self.branch)
+
+        if not use_cache:
+            return compute()
+        return self.memoize("bdc", BDC_INPUTS, compute)
+
+    def topology(self, dcline=True):
+        """
+        Bus graph of the in-service branches and DC lines, with a sparse adjacency
+        matrix, islands, bridges, radial branches, and neighbourhoods, see
+        `topology.Topology`. Requires scipy. Cached until bus numbers, branch or DC
+        line ends, or statuses change.
+
+
+        Args:
+            dcline (bool):
+                Whether in-service DC lines connect their buses.
+
+
+        Returns:
+            Topology: Topology of the case.
+        """
+        from .topology import TOPOLOGY_INPUTS, Topology
+
+        inputs = {"bus": TOPOLOGY_INPUTS["bus"], "branch": TOPOLOGY_INPUTS["branch"]}
+        if dcline and "dcline" in self._attributes:
+            inputs["dcline"] = TOPOLOGY_INPUTS["dcline"]
+        return self.memoize(
+            f"topology:{dcline}", inputs, lambda: Topology(self, dcline=dcline)
+        )
+
+    def islands(self, dcline=True):
+        """
+        Label the island of each bus, see `topology`.
+
+
+        Args:
+            dcline (bool):
+                Whether in-service DC lines connect their buses.
+
+
+        Returns:
+            pd.Series: 0-based island labels, indexed like the bus table.
+        """
+        labels = self.topology(dcline=dcline).labels
+        return pd.Series(labels, index=self.bus.index, name="island")
+
+    def extract(self, buses, renumber=False):
+        """
+        Extract the subnetwork of a set of buses, such as an island or an area,
+        filtering every dependent table, name index, and reserve zone, see
+        `matpowercaseframes.subnetwork.extract`.
+
+
+        Args:
+            buses (array_like | pd.Series):
+                Boolean mask over the bus rows, or bus numbers (BUS_I).
+            renumber (bool):
+                Whether to renumber the kept buses compactly.
+
+
+        Returns:
+            Extraction: (case, ties, bus_map), the subnetwork case, the boundary
+                branch (and dcline) rows of this case, and the map from bus numbers
+                of this case to the subnetwork.
+
+
+        Example:
+            >>> main = cf.extract(cf.islands() == 0).case
+        """
+        from .subnetwork import extract
+
+        return extract(self, buses, renumber=renumber)
+
+    def merge(self, others, keys=None, ties=None, offsets=None):
+        """
+        Merge this case with others into one case, shifting bus numbers and
+        concatenating every dependent table, see
+        `matpowercaseframes.merge.concat_cases`.
+
+
+        Args:
+            others (list):
+                Cases merged after this one.
+            keys (list | None):
+                Source key of each case, this one first. Defaults to 0, 1, ...
+            ties (pd.DataFrame | None):
+                Tie-lines with F_CASE, F_BUS, T_CASE, T_BUS and optional branch
+                columns.
+            offsets (int | list | None):
+                Bus number offsets. Defaults to shifting each case past the largest
+                bus number of the previous ones.
+
+
+        Returns:
+            Merge: (case, mappings), the merged case and the per-source mappings of
+                bus numbers and row labels.
+        """
+        from .merge import concat_cases
+
+        return concat_cases([self, *others], keys=keys, ties=ties, offsets=offsets)
+
+    def dcpf_solver(self, use_cache=True):
+        """
+        Get the factorized DC power flow solver of this case.
+
+        The factorization is cached and reused until the network, bus types,
+        reference angles, or generator statuses change. Requires scipy.
+
+
+        Args:
+            use_cache (bool):
+                Whether to use the cached solver. Defaults to True.
+
+
+        Returns:
+            DCPowerFlow: Solver reusable across many injection vectors.
+        """
+        from .powerflow import DCPF_INPUTS, DCPowerFlow
+
+        if not use_cache:
+            return DCPowerFlow(self)
+        return self.memoize("dcpf", DCPF_INPUTS, lambda: DCPowerFlow(self))
+
+    def run_dcpf(self):
+        """
+        Run a DC power flow, equivalent to MATPOWER `rundcpf`. Requires scipy.
+
+
+        Returns:
+            CaseFrames: New CaseFrames with results written into VA, PF, PT (and VM,
+                QF, QT, and slack PG as MATPOWER does).
+        """
+        from .powerflow import run_dcpf
+
+        return run_dcpf(self)
+
+    def run_pf(self, qlim=False, tol=1e-8, max_it=10):
+        """
+        Run an AC power flow with Newton's method, equivalent to MATPOWER `runpf`.
+        Requires scipy.
+
+
+        Args:
+            qlim (bool):
+                Whether to enforce generator reactive power limits. Defaults to
+                False.
+            tol (float):
+                Tolerance on the maximum P and Q mismatch in p.u.
+            max_it (int):
+                Maximum number of Newton iterations.
+
+
+        Returns:
+            CaseFrames: New CaseFrames with results written into VM, VA, PG, QG, PF,
+                QF, PT, and QT, and `success` and `et` attributes.
+        """
+        from .powerflow import run_pf
+
+        return run_pf(self, qlim=qlim, tol=tol, max_it=max_it)
+
+    def run_pf_batch(
+        self, PD=None, QD=None, PG=None, dc=False, tol=1e-8, max_it=10, processes=None
+    ):
+        """
+        Run power flows of this network under many load and generation scenarios.
+        Requires scipy.
+
+
+        Args:
+            PD, QD (array_like | None):
+                Bus demand in MW and MVAr, of shape (n_scenarios, nb). Defaults to
+                the case values.
+            PG (array_like | None):
+                Generator real power in MW, of shape (n_scenarios, ng). Defaults to
+                the case values.
+            dc (bool):
+                Whether to run DC instead of AC power flows. Defaults to False.
+            tol (float):
+                Tolerance on the maximum P and Q mismatch in p.u. (AC only).
+            max_it (int):
+                Maximum number of Newton iterations (AC only).
+            processes (int | None):
+                Number of worker processes for AC scenarios. If None, solve in the
+                current process.
+
+
+        Returns:
+            dict: Scenario-by-bus 'VM', 'VA', scenario-by-branch 'PF', 'QF', 'PT',
+                'QT', scenario-by-gen 'PG', 'QG', and per-scenario 'success' and
+                'iterations' arrays.
+        """
+        from .powerflow import run_pf_batch
+
+        return run_pf_batch(
+            self,
+            PD=PD,
+            QD=QD,
+            PG=PG,
+            dc=dc,
+            tol=tol,
+            max_it=max_it,
+            processes=processes,
+        )
+
+    def cost_curves(self, attribute="gencost"):
+        """
+        Cost functions of a cost table with the model and NCOST of each row, for
+        tables mixing polynomial and piecewise linear rows, see
+        `costs.CostCurves`. Cached until the table changes.
+
+
+        Args:
+            attribute (str):
+                'gencost' or 'dclinecost'.
+
+
+        Returns:
+            CostCurves: Cost curves of the rows.
+        """
+        from .costs import CostCurves
+
+        return self.memoize(
+            f"cost_curves:{attribute}",
+            {attribute: None},
+            lambda: CostCurves.from_table(getattr(self, attribute)),
+        )
+
+    def _cost_inputs(self, attribute, pg, reactive):
+        """Cost rows and outputs to evaluate, see `total_cost`."""
+        if attribute == "gencost":
+            table, column = self.gen, "QG" if reactive else "PG"
+        elif attribute == "dclinecost" and not reactive:
+            table, column = self.dcline, "PF"
+        else:
+            raise ValueError(
+                f"Costs of '{attribute}' are not supported, use 'gencost' (optionally"
+                " reactive) or 'dclinecost'."
+            )
+        costs = getattr(self, attribute).to_numpy(dtype=float)
+        n = len(table)
+        start = n if reactive else 0
+        if len(costs) < start + n:
+            raise ValueError(
+                f"'{attribute}' has {len(costs)} rows, expected {start + n}."
+            )
+        if pg is None:
+            pg = table[column].to_numpy(dtype=float)
+        return costs[start : start + n], pg
+
+    def total_cost(self, pg=None, attribute="gencost", reactive=False):
+        """
+        Evaluate the cost of each generator (or DC line) at given outputs, for
+        polynomial and piecewise linear rows alike, see `costs.totcost`.
+
+
+        Args:
+            pg (array_like | None):
+                Outputs in MW (MVAr if reactive), of shape (n,) or
+                (n_scenarios, n) for batches of dispatch points. Defaults to PG
+                (QG if reactive) of gen, or PF of dcline.
+            attribute (str):
+                'gencost' or 'dclinecost'.
+            reactive (bool):
+                Whether to use the reactive power costs, the second half of the
+                rows of gencost.
+
+
+        Returns:
+            np.ndarray: Costs of the shape of pg.
+
+
+        Raises:
+            ValueError: If the cost table is unknown or has too few rows.
+        """
+        from .costs import totcost
+
+        return totcost(*self._cost_inputs(attribute, pg, reactive))
+
+    def marginal_cost(self, pg=None, attribute="gencost", reactive=False):
+        """
+        Evaluate the marginal cost of each generator (or DC line) at given outputs,
+        see `total_cost` and `costs.marginal_cost`.
+
+
+        Returns:
+            np.ndarray: Marginal costs of the shape of pg.
+        """
+        from .costs import marginal_cost
+
+        return marginal_cost(*self._cost_inputs(attribute, pg, reactive))
+
+    def cost_segments(self, pg=None, attribute="gencost", reactive=False):
+        """
+        Find the piecewise linear cost segment of each generator (or DC line) at
+        given outputs, see `total_cost` and `costs.segment_index`.
+
+
+        Returns:
+            np.ndarray: 0-based segment indices of the shape of pg, -1 for
+                polynomial rows.
+        """
+        from .costs import segment_index
+
+        return segment_index(*self._cost_inputs(attribute, pg, reactive))
+
+    def apply_changes(self, chgtab, label=None, batch=False):
+        """
+        Apply change sets of a MOST changes table, see `matpowercaseframes.idx.ct`.
+
+        Equivalent to MATPOWER `apply_changes`, with rows and columns in the changes
+        table 1-based as in MATPOWER. The case itself is not modified.
+
+
+        Args:
+            chgtab (array_like | pd.DataFrame):
+                Changes table with 7 columns.
+            label (int | None):
+                Change set to apply. If None, apply every change set.
+            batch (bool):
+                If True (and label is None), return all change sets as a CaseBatch.
+                Defaults to False.
+
+
+        Returns:
+            CaseFrames | generator | tuple: The changed case if label is given, a
+                (labels, CaseBatch) tuple if batch is True, otherwise a generator
+                lazily yielding (label, CaseFrames) for each label.
+        """
+        from .changes import apply_changes, changes_batch, iter_changes
+
+        if label is not None:
+            return apply_changes(self, label, chgtab)
+        if batch:
+            return changes_batch(self, chgtab)
+        return iter_changes(self, chgtab)
+
+    def validate(self, checks=None, skip=()):
+        """
+        Check the case for malformed data, such as generators or branches on
+        missing buses, a missing reference bus, inverted limits, or bad cost rows,
+        see `matpowercaseframes.validation`.
+
+
+        Args:
+            checks (list | None):
+                Names of the checks to run. Defaults to all registered checks.
+            skip (list):
+                Names of checks not to run.
+
+
+        Returns:
+            ValidationReport: Found issues, with `report.ok` False on errors.
+        """
+        from .validation import validate
+
+        return validate(self, checks=checks, skip=skip)
+
+    def diff(self, other, attributes=None):
+        """
+        Compare with another case, aligning the rows of each table by index label.
+
+        The diff lists added, removed, and modified rows, with changed cells in a
+        long-format change set, and can be applied back as a patch, see
+        `matpowercaseframes.diff.CaseDiff`.
+
+
+        Args:
+            other (CaseFrames):
+                New case.
+            attributes (list | None):
+                Attributes to compare. Defaults to the attributes of both cases.
+
+
+        Returns:
+            CaseDiff: Differences from this case into other, with
+                `diff.apply(self)` equal to other.
+        """
+        from .diff import diff_cases
+
+        return diff_cases(self, other, attributes=attributes)
+
+    def apply_profiles(self, profiles, nt=None, nj=None, xgd=None):
+        """
+        Apply MOST profiles across time periods and scenarios, see
+        `matpowercaseframes.idx.profile`. The case itself is not modified.
+
+
+        Args:
+            profiles (Profile | dict | list):
+                Profiles of type 'mpcData' or 'xGenData', applied in order.
+            nt (int | None):
+                Number of time periods. Defaults to the longest profile.
+            nj (int | None):
+                Number of scenarios. Defaults to the largest profile.
+            xgd (xGenDataTableFrames | None):
+                Base xGenData, required by 'xGenData' profiles.
+
+
+        Returns:
+            ExpandedProfiles: Modified columns as (nt, nj, n_rows) arrays.
+        """
+        from .profiles import expand_profiles
+
+        return expand_profiles(self, profiles, nt=nt, nj=nj, xgd=xgd)
+
+    def iter_outages(self, outages=None, **filters):
+        """
+        Lazily yield N-1 outage variants of the case, where only the status column
+        of the outaged table differs, see `matpowercaseframes.contingencies`.
+
+
+        Args:
+            outages (list | None):
+                Contingencies to apply. Defaults to every in-service branch and
+                generator passing filters.
+            **filters:
+                skip_radial, skip_bridges, min_kv, max_kv, or elements, see
+                `contingencies.contingencies`.
+
+
+        Returns:
+            generator: Generator of (Contingency, CaseFrames).
+        """
+        from .contingencies import iter_outages
+
+        return iter_outages(self, outages=outages, **filters)
+
+    def to_shared_memory(self):
+        """
+        Copy the numeric tables into a shared memory block for worker processes,
+        see `matpowercaseframes.shared`. Requires Python 3.8 or later.
+
+
+        Returns:
+            SharedCaseFrames: Owner of the block. Send its `descriptor` to workers,
+                which rebuild a read-only case with `descriptor.attach()`, and call
+                `close` once they are done.
+        """
+        from .shared import SharedCaseFrames
+
+        return SharedCaseFrames(self)
 
     def to_excel(self, path, prefix="", suffix=""):
         """
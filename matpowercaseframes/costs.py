@@ -0,0 +1,795 @@
+import numpy as np
+import pandas as pd
+
+from .constants import COLUMNS, COST_MODELS
+from .idx.cost import COST, MODEL, NCOST, SHUTDOWN, STARTUP
+from .perunit import cost_pu_factors
+
+MODCOST_TYPES = ("SCALE_F", "SCALE_X", "SHIFT_F", "SHIFT_X")
+
+
+def cost_columns(models, n_params):
+    """
+    Names of the parameter columns of a cost table.
+
+    Tables of one model get model-specific names, C2, C1, C0 for polynomials and
+    X1, Y1, X2, Y2, ... for piecewise linear costs. Tables mixing models get the
+    generic names COST1, COST2, ..., since the meaning of a column differs between
+    rows, see `CostCurves`.
+
+
+    Args:
+        models (array_like):
+            MODEL of each row.
+        n_params (int):
+            Number of parameter columns.
+
+
+    Returns:
+        list: Column names.
+    """
+    models = np.unique(np.asarray(models, dtype=float))
+    if len(models) > 1:
+        return [f"COST{i}" for i in range(1, n_params + 1)]
+    if len(models) == 1 and models[0] == COST_MODELS["PW_LINEAR"]:
+        return [f"{'XY'[j % 2]}{j // 2 + 1}" for j in range(n_params)]
+    return [f"C{i}" for i in range(n_params - 1, -1, -1)]
+
+
+def cost_masks(values):
+    """
+    Masks of the meaningful parameter columns of each cost row.
+
+
+    Args:
+        values (np.ndarray):
+            Cost table in MATPOWER layout (MODEL, STARTUP, SHUTDOWN, NCOST, ...).
+
+
+    Returns:
+        tuple: (is_poly, is_pwl, coef, x, y), where is_poly and is_pwl are row masks
+            of shape (n,), and coef, x, and y are masks of shape (n, m - COST) of
+            polynomial coefficients, piecewise linear breakpoints, and piecewise
+            linear costs.
+    """
+    model = values[:, MODEL]
+    ncost = np.nan_to_num(values[:, NCOST]).astype(int)[:, None]
+    j = np.arange(values.shape[1] - COST)[None, :]
+    is_poly = model == COST_MODELS["POLYNOMIAL"]
+    is_pwl = model == COST_MODELS["PW_LINEAR"]
+    coef = is_poly[:, None] & (j < ncost)
+    x = is_pwl[:, None] & (j % 2 == 0) & (j < 2 * ncost)
+    y = is_pwl[:, None] & (j % 2 == 1) & (j < 2 * ncost)
+    return is_poly, is_pwl, coef, x, y
+
+
+def modcost(gencost, alpha, modtype="SCALE_F"):
+    """
+    Modify generator cost functions, equivalent to MATPOWER `modcost`.
+
+    Only the NCOST meaningful parameters of each row are modified, padding columns
+    are kept as is.
+
+
+    Args:
+        gencost (array_like):
+            Cost table in MATPOWER layout.
+        alpha (float | array_like):
+            Scalar or one value per row.
+        modtype (str):
+            'SCALE_F' scales the cost, f(x) -> alpha * f(x); 'SCALE_X' scales the
+            argument, f(x) -> f(x / alpha); 'SHIFT_F' shifts the cost,
+            f(x) -> f(x) + alpha; 'SHIFT_X' shifts the argument,
+            f(x) -> f(x - alpha).
+
+
+    Returns:
+        np.ndarray: Modified copy of the cost table.
+    """
+    if modtype not in MODCOST_TYPES:
+        raise ValueError(f"'{modtype}' is not a valid modtype.")
+    values = np.array(gencost, dtype=float, ndmin=2)
+    n_rows = values.shape[0]
+    alpha = np.asarray(alpha, dtype=float).reshape(-1)
+    if alpha.size == 1:
+        alpha = np.full(n_rows, alpha[0])
+    elif alpha.size != n_rows:
+        raise ValueError("alpha must be a scalar or have one value per row.")
+    if n_rows == 0:
+        return values
+
+    params = values[:, COST:]  # view, modified in place
+    is_poly, _, coef, x, y = cost_masks(values)
+    ncost = np.nan_to_num(values[:, NCOST]).astype(int)
+    a = alpha[:, None]
+    j = np.arange(params.shape[1])[None, :]
+    power = ncost[:, None] - 1 - j
+
+    if modtype == "SCALE_F":
+        params[:] = np.where(coef | y, params * a, params)
+    elif modtype == "SCALE_X":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scaled = params / a ** np.maximum(power, 0)
+        params[:] = np.where(coef, scaled, np.where(x, params * a, params))
+    elif modtype == "SHIFT_F":
+        # constant term of polynomials, all costs of piecewise linear
+        params[:] = np.where((coef & (power == 0)) | y, params + a, params)
+    else:
+        params[:] = np.where(x, params + a, params)
+        for n in np.unique(ncost[is_poly]):
+            rows = np.flatnonzero(is_poly & (ncost == n))
+            params[rows, :n] = polyshift(params[rows, :n], alpha[rows])
+    return values
+
+
+def _binomials(n):
+    """Binomial coefficients C(i, j) for i, j < n, zero for j > i, by Pascal's rule."""
+    binom = np.zeros((n, n))
+    binom[:, 0] = 1
+    for i in range(1, n):
+        binom[i, 1:] = binom[i - 1, 1:] + binom[i - 1, :-1]
+    return binom
+
+
+def polyshift(coefs, alpha):
+    """
+    Coefficients of p(x - alpha) given coefficients of p(x), highest order first.
+
+
+    Args:
+        coefs (np.ndarray):
+            Polynomial coefficients of shape (n_rows, n).
+        alpha (np.ndarray):
+            Shift of each row, of shape (n_rows,).
+
+
+    Returns:
+        np.ndarray: Shifted coefficients of shape (n_rows, n).
+    """
+    coefs = np.asarray(coefs, dtype=float)
+    n = coefs.shape[1]
+    p = n - 1 - np.arange(n)  # power of each coefficient
+    # term c_j x^p_j contributes C(p_j, k) (-alpha)^(p_j - k) to power k
+    k = p[None, :]
+    binom = _binomials(n)[np.ix_(p, p)]
+    exponent = np.maximum(p[:, None] - k, 0)
+    factors = binom[None] * (-np.asarray(alpha, dtype=float))[:, None, None] ** exponent
+    return np.einsum("rj,rjk->rk", coefs, factors)
+
+
+def _cost_arrays(gencost):
+    """Cost table as a float array, with the NCOST of each row."""
+    values = np.array(gencost, dtype=float, ndmin=2)
+    ncost = np.nan_to_num(values[:, NCOST]).astype(int)
+    return values, ncost
+
+
+def _poly_by_power(values, ncost, is_poly):
+    """Polynomial coefficients of each row by power, constant first, zero padded."""
+    n_rows = len(values)
+    width = max(int(ncost[is_poly].max(initial=0)), 1)
+    params = np.nan_to_num(values[:, COST : COST + width])
+    power = ncost[:, None] - 1 - np.arange(params.shape[1])[None, :]
+    valid = is_poly[:, None] & (power >= 0)
+    coefs = np.zeros((n_rows, width))
+    rows = np.broadcast_to(np.arange(n_rows)[:, None], power.shape)
+    coefs[rows[valid], power[valid]] = params[valid]
+    return coefs
+
+
+def _horner(coefs, pg):
+    """Evaluate polynomials given by power, constant first, at pg of shape (..., n)."""
+    result = np.zeros(np.broadcast_shapes(pg.shape, coefs.shape[:1]))
+    for k in range(coefs.shape[1] - 1, -1, -1):
+        result = result * pg + coefs[:, k]
+    return result
+
+
+def _breakpoints(values, ncost, is_pwl):
+    """Breakpoints (x, y) of the piecewise linear rows, shape (n, max NCOST)."""
+    width = max(int(ncost[is_pwl].max(initial=0)), 2)
+    params = values[:, COST : COST + 2 * width]
+    x = np.full((len(values), width), np.nan)
+    y = np.full((len(values), width), np.nan)
+    x[:, : params[:, 0::2].shape[1]] = params[:, 0::2]
+    y[:, : params[:, 1::2].shape[1]] = params[:, 1::2]
+    return x, y
+
+
+def segment_index(gencost, pg):
+    """
+    Segment of the piecewise linear cost curve of each row where pg falls.
+
+    Points below the first or above the last breakpoint fall in the first or last
+    segment, whose line is extrapolated as in MATPOWER `totcost`.
+
+
+    Args:
+        gencost (array_like):
+            Cost table in MATPOWER layout, with n rows.
+        pg (array_like):
+            Output of each row, of shape (n,) or (..., n) for batches.
+
+
+    Returns:
+        np.ndarray: 0-based segment index, -1 for rows that are not piecewise linear.
+    """
+    values, ncost = _cost_arrays(gencost)
+    pg = np.asarray(pg, dtype=float)
+    is_pwl = values[:, MODEL] == COST_MODELS["PW_LINEAR"]
+    x, _ = _breakpoints(values, ncost, is_pwl)
+    segment = np.zeros(np.broadcast_shapes(pg.shape, ncost.shape), dtype=int)
+    # a point passing interior breakpoint k lies at least in segment k
+    for k in range(1, x.shape[1] - 1):
+        segment += (pg >= x[:, k]) & (k < ncost - 1)
+    return np.where(is_pwl & (ncost >= 2), segment, -1)
+
+
+def _pwl_segment(values, ncost, pg):
+    """Start (x0, y0) and slope of the segment of each point."""
+    is_pwl = values[:, MODEL] == COST_MODELS["PW_LINEAR"]
+    x, y = _breakpoints(values, ncost, is_pwl)
+    segment = np.maximum(segment_index(values, pg), 0)
+    rows = np.arange(len(values))
+    x0, y0 = x[rows, segment], y[rows, segment]
+    x1, y1 = x[rows, segment + 1], y[rows, segment + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (y1 - y0) / (x1 - x0)
+    return x0, y0, slope
+
+
+def totcost(gencost, pg):
+    """
+    Total cost of each row at the given outputs, equivalent to MATPOWER `totcost`.
+
+    Polynomial and piecewise linear rows may be mixed, each with its own NCOST.
+    Startup and shutdown costs are not included.
+
+
+    Args:
+        gencost (array_like):
+            Cost table in MATPOWER layout, with n rows.
+        pg (array_like):
+            Output of each row, of shape (n,) or (..., n) for batches of dispatch
+            points, in the units of the cost table (usually MW).
+
+
+    Returns:
+        np.ndarray: Cost of shape of pg, NaN for rows of unknown model.
+    """
+    values, ncost = _cost_arrays(gencost)
+    pg = np.asarray(pg, dtype=float)
+    is_poly, is_pwl, *_ = cost_masks(values)
+    cost = np.full(np.broadcast_shapes(pg.shape, ncost.shape), np.nan)
+    if is_poly.any():
+        cost = np.where(
+            is_poly, _horner(_poly_by_power(values, ncost, is_poly), pg), cost
+        )
+    if is_pwl.any():
+        x0, y0, slope = _pwl_segment(values, ncost, pg)
+        cost = np.where(is_pwl, y0 + slope * (pg - x0), cost)
+    return cost
+
+
+def marginal_cost(gencost, pg):
+    """
+    Marginal cost (derivative of the total cost) of each row at the given outputs.
+
+    For piecewise linear rows it is the slope of the segment where pg falls, see
+    `segment_index`, so a point at a breakpoint gets the slope of the next segment.
+
+
+    Args:
+        gencost (array_like):
+            Cost table in MATPOWER layout, with n rows.
+        pg (array_like):
+            Output of each row, of shape (n,) or (..., n) for batches.
+
+
+    Returns:
+        np.ndarray: Marginal cost of shape of pg, NaN for rows of unknown model.
+    """
+    values, ncost = _cost_arrays(gencost)
+    pg = np.asarray(pg, dtype=float)
+    is_poly, is_pwl, *_ = cost_masks(values)
+    marginal = np.full(np.broadcast_shapes(pg.shape, ncost.shape), np.nan)
+    if is_poly.any():
+        coefs = _poly_by_power(values, ncost, is_poly)
+        derivative = coefs[:, 1:] * np.arange(1, coefs.shape[1])
+        if derivative.shape[1] == 0:
+            derivative = np.zeros((len(values), 1))
+        marginal = np.where(is_poly, _horner(derivative, pg), marginal)
+    if is_pwl.any():
+        _, _, slope = _pwl_segment(values, ncost, pg)
+        marginal = np.where(is_pwl, slope, marginal)
+    return marginal
+
+
+def pwl_segments(gencost):
+    """
+    Segments of the piecewise linear cost curves, as lines cost = slope * x +
+    intercept over [start, end], e.g. for LP formulations.
+
+
+    Args:
+        gencost (array_like):
+            Cost table in MATPOWER layout, with n rows.
+
+
+    Returns:
+        tuple: (start, end, slope, intercept, mask) arrays of shape
+            (n, max NCOST - 1), where mask marks the segments of piecewise linear
+            rows. Values outside the mask are NaN.
+    """
+    values, ncost = _cost_arrays(gencost)
+    is_pwl = values[:, MODEL] == COST_MODELS["PW_LINEAR"]
+    x, y = _breakpoints(values, ncost, is_pwl)
+    k = np.arange(x.shape[1] - 1)[None, :]
+    mask = is_pwl[:, None] & (k < ncost[:, None] - 1)
+    start = np.where(mask, x[:, :-1], np.nan)
+    end = np.where(mask, x[:, 1:], np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (np.where(mask, y[:, 1:], np.nan) - y[:, :-1]) / (end - start)
+    intercept = y[:, :-1] - slope * start
+    return start, end, slope, intercept, mask
+
+
+class CostCurves:
+    """
+    Cost functions of a gencost or dclinecost table, with mixed models.
+
+    The MODEL and NCOST of each row are kept next to a padded (n, m) array of the
+    parameters in MATPOWER order, with masks selecting the polynomial coefficients
+    and the piecewise linear breakpoints of each row. Evaluation and per-unit
+    scaling work on all rows at once, whatever their model.
+    """
+
+    def __init__(self, model, ncost, params, startup=None, shutdown=None, index=None):
+        """
+        Initialize the cost curves, see `from_table`.
+
+
+        Args:
+            model (array_like):
+                MODEL of each row, 1 (piecewise linear) or 2 (polynomial).
+            ncost (array_like):
+                NCOST of each row, the number of coefficients or breakpoints.
+            params (array_like):
+                Parameters of shape (n, m), padded after the meaningful ones.
+            startup, shutdown (array_like | None):
+                Startup and shutdown costs. Default to 0.
+            index (pd.Index | None):
+                Row labels. Defaults to a RangeIndex.
+        """
+        self.model = np.asarray(model, dtype=int)
+        self.ncost = np.asarray(ncost, dtype=int)
+        self.params = np.array(params, dtype=float, ndmin=2)
+        n = len(self.model)
+        self.startup = np.zeros(n) if startup is None else np.asarray(startup, float)
+        self.shutdown = np.zeros(n) if shutdown is None else np.asarray(shutdown, float)
+        self.index = pd.RangeIndex(n) if index is None else index
+        width = np.where(self.is_pwl, 2 * self.ncost, self.ncost)
+        if self.params.shape[1] < width.max(initial=0):
+            raise ValueError(
+                f"Cost parameters have {self.params.shape[1]} columns, but NCOST"
+                f" requires {width.max()}."
+            )
+
+    @classmethod
+    def from_table(cls, table):
+        """
+        Build the cost curves of a cost table.
+
+
+        Args:
+            table (pd.DataFrame | array_like):
+                Cost table in MATPOWER layout (MODEL, STARTUP, SHUTDOWN, NCOST, ...).
+
+
+        Returns:
+            CostCurves: Cost curves of the rows.
+        """
+        index = table.index if isinstance(table, pd.DataFrame) else None
+        values, ncost = _cost_arrays(table)
+        return cls(
+            values[:, MODEL],
+            ncost,
+            values[:, COST:],
+            values[:, STARTUP],
+            values[:, SHUTDOWN],
+            index=index,
+        )
+
+    def __len__(self):
+        return len(self.model)
+
+    def to_numpy(self):
+        """
+        Cost table in MATPOWER layout, padded with zeros.
+
+
+        Returns:
+            np.ndarray: Table of shape (n, COST + m).
+        """
+        params = np.where(self.mask, self.params, 0.0)
+        head = np.column_stack([self.model, self.startup, self.shutdown, self.ncost])
+        return np.hstack([head.astype(float), params])
+
+    def to_frame(self):
+        """
+        Cost table in MATPOWER layout, with columns named by `cost_columns`.
+
+
+        Returns:
+            pd.DataFrame: Cost table.
+        """
+        columns = COLUMNS["gencost"] + cost_columns(self.model, self.params.shape[1])
+        return pd.DataFrame(self.to_numpy(), index=self.index, columns=columns)
+
+    @property
+    def is_poly(self):
+        """np.ndarray: Mask of the polynomial rows."""
+        return self.model == COST_MODELS["POLYNOMIAL"]
+
+    @property
+    def is_pwl(self):
+        """np.ndarray: Mask of the piecewise linear rows."""
+        return self.model == COST_MODELS["PW_LINEAR"]
+
+    @property
+    def mask(self):
+        """np.ndarray: Mask of the meaningful parameters, of shape (n, m)."""
+        _, _, coef, x, y = cost_masks(self._table())
+        return coef | x | y
+
+    def _table(self):
+        head = np.column_stack([self.model, self.startup, self.shutdown, self.ncost])
+        return np.hstack([head.astype(float), self.params])
+
+    def coefficients(self):
+        """
+        Polynomial coefficients aligned by power, e.g. for quadratic programs.
+
+
+        Returns:
+            tuple: (coefs, mask), of shape (n, max NCOST), where coefs[:, k] is the
+                coefficient of power k, zero for missing powers and piecewise linear
+                rows, and mask marks the coefficients given by each polynomial row.
+        """
+        values, ncost = self._table(), self.ncost
+        coefs = _poly_by_power(values, ncost, self.is_poly)
+        k = np.arange(coefs.shape[1])[None, :]
+        return coefs, self.is_poly[:, None] & (k < ncost[:, None])
+
+    def breakpoints(self):
+        """
+        Breakpoints of the piecewise linear rows.
+
+
+        Returns:
+            tuple: (x, y, mask), of shape (n, max NCOST), where mask marks the
+                breakpoints of each piecewise linear row. Values outside the mask
+                are NaN.
+        """
+        x, y = _breakpoints(self._table(), self.ncost, self.is_pwl)
+        k = np.arange(x.shape[1])[None, :]
+        mask = self.is_pwl[:, None] & (k < self.ncost[:, None])
+        return np.where(mask, x, np.nan), np.where(mask, y, np.nan), mask
+
+    def totcost(self, pg):
+        """Total cost at outputs pg of shape (n,) or (..., n), see `totcost`."""
+        return totcost(self._table(), pg)
+
+    def marginal_cost(self, pg):
+        """Marginal cost at outputs pg, see `marginal_cost`."""
+        return marginal_cost(self._table(), pg)
+
+    def segment_index(self, pg):
+        """Piecewise linear segment of outputs pg, see `segment_index`."""
+        return segment_index(self._table(), pg)
+
+    def pwl_segments(self):
+        """Piecewise linear segments as lines, see `pwl_segments`."""
+        return pwl_segments(self._table())
+
+    def to_pu(self, baseMVA):
+        """
+        Convert into costs of p.u. power, see `perunit.cost_pu_factors`.
+
+
+        Args:
+            baseMVA (float):
+                System MVA base.
+
+
+        Returns:
+            CostCurves: Converted copy.
+        """
+        return self._scaled(cost_pu_factors(self._table(), baseMVA))
+
+    def from_pu(self, baseMVA):
+        """
+        Convert from costs of p.u. power back into costs of MW, see `to_pu`.
+
+
+        Args:
+            baseMVA (float):
+                System MVA base.
+
+
+        Returns:
+            CostCurves: Converted copy.
+        """
+        return self._scaled(1 / cost_pu_factors(self._table(), baseMVA))
+
+    def _scaled(self, factors):
+        return self.__class__(
+            self.model,
+            self.ncost,
+            self.params * factors,
+            self.startup,
+            self.shutdown,
+            index=self.index,
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(rows={len(self)},"
+            f" polynomial={int(self.is_poly.sum())},"
+            f" piecewise_linear={int(self.is_pwl.sum())})"
+        )
+
+
+def _like(gencost, values):
+    """Cost table values as a DataFrame like gencost, or as an array."""
+    if not isinstance(gencost, pd.DataFrame):
+        return values
+    columns = COLUMNS["gencost"] + cost_columns(
+        values[:, MODEL], values.shape[1] - COST
+    )
+    return pd.DataFrame(values, index=gencost.index, columns=columns)
+
+
+def _with_pwl(values, is_pwl, x, y, keep):
+    """
+    Cost table with the piecewise linear rows replaced by their kept breakpoints,
+    packed to the left, and NCOST updated.
+    """
+    order = np.argsort(~keep, axis=1, kind="stable")
+    ncost = keep.sum(axis=1)
+    x = np.take_along_axis(x, order, axis=1)
+    y = np.take_along_axis(y, order, axis=1)
+    packed = np.arange(x.shape[1])[None, :] < ncost[:, None]
+    width = max(values.shape[1] - COST, 2 * int(ncost[is_pwl].max(initial=0)))
+    result = np.zeros((len(values), COST + width))
+    result[:, : values.shape[1]] = np.nan_to_num(values)
+    params = np.zeros((len(values), 2 * x.shape[1]))
+    params[:, 0::2] = np.where(packed, x, 0)
+    params[:, 1::2] = np.where(packed, y, 0)
+    pwl = np.flatnonzero(is_pwl)
+    result[pwl, COST:] = 0
+    result[pwl, COST : COST + params.shape[1]] = params[pwl, :width]
+    result[pwl, MODEL] = COST_MODELS["PW_LINEAR"]
+    result[pwl, NCOST] = ncost[pwl]
+    return result
+
+
+def _max_curvature(coefs, pmin, pmax, n_samples=65):
+    """Largest |f''| of each polynomial (by power) sampled over [pmin, pmax]."""
+    t = np.linspace(0, 1, n_samples)[:, None]
+    p = pmin + t * (pmax - pmin)
+    k = np.arange(2, coefs.shape[1])
+    second = coefs[:, 2:] * k * (k - 1)
+    return np.abs(_horner(second, p)).max(axis=0) if len(k) else np.zeros(len(coefs))
+
+
+def poly_to_pwl(gencost, pmin, pmax, n_segments=None, max_error=None):
+    """
+    Convert polynomial costs into piecewise linear costs over [pmin, pmax].
+
+    Breakpoints are evenly spaced, with a fixed number of segments, or with the
+    fewest segments keeping the interpolation error within max_error, from the
+    bound max|f''| h^2 / 8 for segments of width h (exact for quadratics).
+    Piecewise linear rows are kept. Rows with pmax <= pmin are converted over
+    [pmin, pmin + 1].
+
+
+    Args:
+        gencost (pd.DataFrame | array_like):
+            Cost table in MATPOWER layout.
+        pmin, pmax (array_like):
+            Output range of each row, e.g. gen PMIN and PMAX.
+        n_segments (int | array_like | None):
+            Number of segments, for all rows or for each row.
+        max_error (float | None):
+            Largest deviation from the polynomial, in cost units. Exactly one of
+            n_segments and max_error is required.
+
+
+    Returns:
+        pd.DataFrame | np.ndarray: Piecewise linear cost table in MATPOWER layout,
+            a DataFrame if gencost is one.
+
+
+    Raises:
+        ValueError: If not exactly one of n_segments and max_error is given.
+    """
+    if (n_segments is None) == (max_error is None):
+        raise ValueError("Give exactly one of n_segments and max_error.")
+    values, ncost = _cost_arrays(gencost)
+    is_poly, is_pwl, *_ = cost_masks(values)
+    pmin = np.broadcast_to(np.asarray(pmin, dtype=float), ncost.shape)
+    pmax = np.broadcast_to(np.asarray(pmax, dtype=float), ncost.shape)
+    pmax = np.where(pmax > pmin, pmax, pmin + 1)
+
+    coefs = _poly_by_power(values, ncost, is_poly)
+    if n_segments is None:
+        curvature = _max_curvature(coefs, pmin, pmax)
+        n = np.ceil((pmax - pmin) * np.sqrt(curvature / (8 * max_error)))
+    else:
+        n = np.broadcast_to(np.asarray(n_segments), ncost.shape)
+    n = np.where(is_poly, np.maximum(n, 1), 0).astype(int)
+
+    # breakpoints of converted rows, then the existing piecewise linear rows
+    k = np.arange(max(int(n.max(initial=0)) + 1, 2))[None, :]
+    x = pmin[:, None] + (pmax - pmin)[:, None] * np.minimum(
+        k / np.maximum(n, 1)[:, None], 1
+    )
+    y = _horner(coefs, x.T).T
+    keep = is_poly[:, None] & (k <= n[:, None])
+    old_x, old_y = _breakpoints(values, ncost, is_pwl)
+    width = max(x.shape[1], old_x.shape[1])
+    x, y, keep = (np.pad(a, ((0, 0), (0, width - a.shape[1]))) for a in (x, y, keep))
+    old_x, old_y = (
+        np.pad(a, ((0, 0), (0, width - a.shape[1]))) for a in (old_x, old_y)
+    )
+    old_keep = is_pwl[:, None] & (np.arange(width)[None, :] < ncost[:, None])
+    x = np.where(is_pwl[:, None], old_x, x)
+    y = np.where(is_pwl[:, None], old_y, y)
+    keep = np.where(is_pwl[:, None], old_keep, keep)
+    return _like(gencost, _with_pwl(values, is_poly | is_pwl, x, y, keep))
+
+
+def is_convex(gencost, pmin=None, pmax=None, tol=1e-9):
+    """
+    Check which cost curves are convex.
+
+    Piecewise linear curves are convex when their slopes never decrease, quadratic
+    and lower order polynomials when their C2 is not negative. Higher order
+    polynomials are checked by sampling f'' over [pmin, pmax].
+
+
+    Args:
+        gencost (pd.DataFrame | array_like):
+            Cost table in MATPOWER layout.
+        pmin, pmax (array_like | None):
+            Output range of each row, required for polynomials of order above 2.
+        tol (float):
+            Tolerance on slope decreases and on negative curvature.
+
+
+    Returns:
+        np.ndarray: Boolean mask over the rows, False for rows of unknown model.
+
+
+    Raises:
+        ValueError: If higher order polynomials are given without a range.
+    """
+    values, ncost = _cost_arrays(gencost)
+    is_poly, is_pwl, *_ = cost_masks(values)
+    convex = np.zeros(len(values), dtype=bool)
+
+    _, _, slope, _, mask = pwl_segments(values)
+    decrease = np.where(mask[:, 1:], slope[:, :-1] - slope[:, 1:], 0) > tol
+    convex[is_pwl] = ~decrease.any(axis=1)[is_pwl]
+
+    coefs = _poly_by_power(values, ncost, is_poly)
+    high = is_poly & (ncost > 3)
+    if high.any():
+        if pmin is None or pmax is None:
+            raise ValueError("pmin and pmax are required for polynomials of order > 2.")
+        pmin = np.asarray(pmin, dtype=float)
+        pmax = np.asarray(pmax, dtype=float)
+        t = np.linspace(0, 1, 65)[:, None]
+        k = np.arange(2, coefs.shape[1])
+        second = _horner(coefs[:, 2:] * k * (k - 1), pmin + t * (pmax - pmin))
+        convex[high] = (second >= -tol).all(axis=0)[high]
+    low = is_poly & (ncost <= 3)
+    c2 = coefs[:, 2] if coefs.shape[1] > 2 else np.zeros(len(values))
+    convex[low] = (c2 >= -tol)[low]
+    return convex
+
+
+def convex_hull(gencost):
+    """
+    Replace non-convex piecewise linear cost curves by their lower convex hull.
+
+    Breakpoints above the line through their neighbours are dropped, all rows at
+    once, until the slopes of every row never decrease. Polynomial rows are kept.
+
+
+    Args:
+        gencost (pd.DataFrame | array_like):
+            Cost table in MATPOWER layout.
+
+
+    Returns:
+        pd.DataFrame | np.ndarray: Convex cost table in MATPOWER layout.
+    """
+    values, ncost = _cost_arrays(gencost)
+    is_pwl = values[:, MODEL] == COST_MODELS["PW_LINEAR"]
+    x, y = _breakpoints(values, ncost, is_pwl)
+    j = np.arange(x.shape[1])
+    keep = is_pwl[:, None] & (j[None, :] < ncost[:, None])
+    while True:
+        # previous and next kept breakpoint of each breakpoint
+        prev = np.maximum.accumulate(np.where(keep, j, -1), axis=1)
+        prev = np.pad(prev[:, :-1], ((0, 0), (1, 0)), constant_values=-1)
+        nxt = np.minimum.accumulate(np.where(keep, j, x.shape[1])[:, ::-1], axis=1)
+        nxt = np.pad(nxt[:, ::-1][:, 1:], ((0, 0), (0, 1)), constant_values=x.shape[1])
+        inner = keep & (prev >= 0) & (nxt < x.shape[1])
+        p = np.clip(prev, 0, x.shape[1] - 1)
+        q = np.clip(nxt, 0, x.shape[1] - 1)
+        rows = np.arange(len(values))[:, None]
+        # cross product > 0: the point lies above the chord of its neighbours
+        with np.errstate(invalid="ignore"):
+            above = (y - y[rows, p]) * (x[rows, q] - x[rows, p]) > (
+                y[rows, q] - y[rows, p]
+            ) * (x - x[rows, p])
+        drop = inner & above
+        if not drop.any():
+            break
+        keep &= ~drop
+    return _like(gencost, _with_pwl(values, is_pwl, x, y, keep))
+
+
+def merge_breakpoints(gencost, slope_tol=1e-9, min_width=0.0):
+    """
+    Simplify piecewise linear cost curves, all rows at once.
+
+    Drops interior breakpoints between segments of equal slope, and breakpoints
+    within min_width of the previous breakpoint (the first and last breakpoints are
+    kept, dropping the one before the last instead).
+
+
+    Args:
+        gencost (pd.DataFrame | array_like):
+            Cost table in MATPOWER layout.
+        slope_tol (float):
+            Largest slope difference of merged segments.
+        min_width (float):
+            Smallest segment width.
+
+
+    Returns:
+        pd.DataFrame | np.ndarray: Simplified cost table in MATPOWER layout.
+    """
+    values, ncost = _cost_arrays(gencost)
+    is_pwl = values[:, MODEL] == COST_MODELS["PW_LINEAR"]
+    x, y = _breakpoints(values, ncost, is_pwl)
+    j = np.arange(x.shape[1])[None, :]
+    keep = is_pwl[:, None] & (j < ncost[:, None])
+    last = ncost[:, None] - 1
+
+    # narrow segments, measured from the previous breakpoint
+    with np.errstate(invalid="ignore"):
+        narrow = np.diff(x, axis=1, prepend=np.nan) <= min_width
+    keep &= ~(narrow & (j < last))
+    narrow_last = np.take_along_axis(narrow, np.maximum(last, 0), axis=1)
+    before_last = (j == last - 1) & narrow_last & (last >= 2)
+    keep &= ~before_last
+
+    # collinear interior breakpoints, among the remaining ones
+    values = _with_pwl(values, is_pwl, x, y, keep)
+    _, ncost = _cost_arrays(values)
+    x, y = _breakpoints(values, ncost, is_pwl)
+    _, _, slope, _, mask = pwl_segments(values)
+    j = np.arange(x.shape[1])[None, :]
+    keep = is_pwl[:, None] & (j < ncost[:, None])
+    collinear = np.zeros_like(keep)
+    with np.errstate(invalid="ignore"):
+        collinear[:, 1:-1] = mask[:, 1:] & (
+            np.abs(slope[:, 1:] - slope[:, :-1]) <= slope_tol
+        )
+    keep &= ~collinear
+    return _like(gencost, _with_pwl(values, is_pwl, x, y, keep))
@@ -0,0 +1,328 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from .batch import CaseBatch
+from .diff import CaseDiff
+
+
+def _cast(values, dtype):
+    """Cast stored float values back into an integer or bool column dtype."""
+    if isinstance(dtype, np.dtype) and dtype.kind in "biu":
+        cast = values.astype(dtype)
+        if (cast == values).all():
+            return cast
+    return values
+
+
+class DeltaStore:
+    """
+    Scenarios stored as sparse deltas against one base case.
+
+    Every scenario is kept as its `CaseDiff` from the base case. Numeric cell
+    changes of all scenarios, including status flips, are packed into flat
+    arrays (scenario, column key, row position, value), about 20 bytes per changed
+    cell. Anything else (added or removed rows, non-numeric cells, other
+    attributes) is kept per scenario as a `CaseDiff`.
+
+    Scenarios are rebuilt on demand, one at a time with `get` or many at once as a
+    `CaseBatch` with `to_batch`.
+
+    Example:
+        >>> store = DeltaStore(base)
+        >>> for case in operating_points:
+        ...     store.add(case)
+        >>> store.save("points.pkl")
+        >>> case = DeltaStore.load("points.pkl")[1234]
+    """
+
+    def __init__(self, base):
+        """
+        Initialize an empty store.
+
+
+        Args:
+            base (CaseFrames):
+                Base case, copied and frozen, see `CaseFrames.freeze`.
+        """
+        self._base = base.copy().freeze()
+        self._n_scenarios = 0
+        self._keys = []  # (attribute, column) of each column key
+        self._codes = {}
+        self._pending = []
+        self._cells = {
+            "scenario": np.zeros(0, dtype=np.int64),
+            "key": np.zeros(0, dtype=np.int32),
+            "row": np.zeros(0, dtype=np.int64),
+            "value": np.zeros(0),
+        }
+        self._extras = {}
+
+    @property
+    def base(self):
+        """CaseFrames: Frozen base case."""
+        return self._base
+
+    def __len__(self):
+        return self._n_scenarios
+
+    @property
+    def nbytes(self):
+        """int: Bytes of the packed cell changes."""
+        self._flush()
+        return sum(array.nbytes for array in self._cells.values())
+
+    def add(self, case):
+        """
+        Add a scenario.
+
+
+        Args:
+            case (CaseFrames):
+                Scenario, with tables aligned to the base case by index label.
+
+
+        Returns:
+            int: Scenario position.
+        """
+        diff = self._base.diff(case)
+        changes = diff.changes
+        packed = np.zeros(len(changes), dtype=bool)
+        for (attribute, column), group in changes.groupby(
+            ["attribute", "column"], sort=False
+        ):
+            base = getattr(self._base, attribute)
+            if column not in base.columns or base[column].dtype.kind not in "biuf":
+                continue
+            values = pd.to_numeric(group["new"], errors="coerce").to_numpy(float)
+            if (np.isnan(values) & ~pd.isna(group["new"]).to_numpy()).any():
+                continue  # non-numeric values
+            rows = base.index.get_indexer(group["index"].to_numpy())
+            code = self._code(attribute, column)
+            self._pending.append((self._n_scenarios, code, rows, values))
+            packed[group.index.to_numpy()] = True
+
+        extra = CaseDiff(
+            changes[~packed].reset_index(drop=True),
+            diff.added,
+            diff.removed,
+            diff.removed_columns,
+            diff.values,
+            diff.dtypes,
+            diff.layout,
+            diff.added_columns,
+        )
+        if not extra.empty:
+            self._extras[self._n_scenarios] = extra
+        self._n_scenarios += 1
+        return self._n_scenarios - 1
+
+    def extend(self, cases):
+        """
+        Add many scenarios.
+
+
+        Args:
+            cases (iterable):
+                Scenarios, see `add`.
+
+
+        Returns:
+            range: Positions of the added scenarios.
+        """
+        start = self._n_scenarios
+        for case in cases:
+            self.add(case)
+        return range(start, self._n_scenarios)
+
+    def _code(self, attribute, column):
+        key = (attribute, column)
+        if key not in self._codes:
+            self._codes[key] = len(self._keys)
+            self._keys.append(key)
+        return self._codes[key]
+
+    def _flush(self):
+        """Pack pending cell changes into the flat arrays."""
+        if not self._pending:
+            return
+        sizes = [len(rows) for _, _, rows, _ in self._pending]
+        new = {
+            "scenario": np.repeat([p[0] for p in self._pending], sizes),
+            "key": np.repeat([p[1] for p in self._pending], sizes).astype(np.int32),
+            "row": np.concatenate([p[2] for p in self._pending]),
+            "value": np.concatenate([p[3] for p in self._pending]),
+        }
+        self._cells = {
+            name: np.concatenate([self._cells[name], new[name]]) for name in new
+        }
+        self._pending = []
+
+    @property
+    def cells(self):
+        """
+        pd.DataFrame: Packed cell changes, with scenario, attribute, index (row
+            label), column, and value.
+        """
+        self._flush()
+        keys = np.array(self._keys + [("", "")], dtype=object)[self._cells["key"]]
+        attributes = [attribute for attribute, _ in keys]
+        labels = np.empty(len(keys), dtype=object)
+        for attribute in set(attributes):
+            mask = np.asarray(attributes) == attribute
+            index = getattr(self._base, attribute).index
+            labels[mask] = np.asarray(index[self._cells["row"][mask]], dtype=object)
+        return pd.DataFrame(
+            {
+                "scenario": self._cells["scenario"],
+                "attribute": attributes,
+                "index": labels,
+                "column": [column for _, column in keys],
+                "value": self._cells["value"],
+            }
+        )
+
+    def _scenario_cells(self, s):
+        self._flush()
+        start, stop = np.searchsorted(self._cells["scenario"], [s, s + 1])
+        return {name: array[start:stop] for name, array in self._cells.items()}
+
+    def get(self, s):
+        """
+        Rebuild one scenario.
+
+        Only the changed columns are copied; the others are shared with the base
+        case under pandas Copy-on-Write.
+
+
+        Args:
+            s (int):
+                Scenario position.
+
+
+        Returns:
+            CaseFrames: Mutable case of scenario s.
+        """
+        s = range(self._n_scenarios)[s]
+        cells = self._scenario_cells(s)
+        case = self._base.copy()
+        for code in np.unique(cells["key"]):
+            attribute, column = self._keys[code]
+            mask = cells["key"] == code
+            df = getattr(case, attribute)
+            values = df[column].to_numpy()
+            new = _cast(cells["value"][mask], values.dtype)
+            values = values.astype(np.result_type(values, new), copy=True)
+            values[cells["row"][mask]] = new
+            df[column] = pd.Series(values, index=df.index, copy=False)
+        if s in self._extras:
+            case = self._extras[s].apply(case)
+        return case
+
+    def __getitem__(self, s):
+        return self.get(s)
+
+    def __iter__(self):
+        for s in range(self._n_scenarios):
+            yield self.get(s)
+
+    def diff(self, s):
+        """
+        Differences of a scenario from the base case.
+
+
+        Args:
+            s (int):
+                Scenario position.
+
+
+        Returns:
+            CaseDiff: Diff such that `diff.apply(store.base)` rebuilds scenario s.
+        """
+        return self._base.diff(self.get(s))
+
+    def to_batch(self, scenarios=None):
+        """
+        Rebuild many scenarios at once as a CaseBatch, scattering the packed cell
+        changes of all of them in one vectorized update per column.
+
+
+        Args:
+            scenarios (array_like | None):
+                Scenario positions, in batch order. Defaults to all scenarios.
+
+
+        Returns:
+            CaseBatch: Batch over the base case.
+
+
+        Raises:
+            ValueError: If a scenario changes more than numeric cells, e.g. adds or
+                removes rows. Use `get` for those.
+        """
+        if scenarios is None:
+            scenarios = np.arange(self._n_scenarios)
+        scenarios = np.arange(self._n_scenarios)[np.asarray(scenarios, dtype=int)]
+        structural = [s for s in scenarios.tolist() if s in self._extras]
+        if structural:
+            raise ValueError(
+                f"Scenarios {structural[:10]} change more than numeric cells and"
+                " cannot be stacked, use get()."
+            )
+        self._flush()
+        # batch position of each stored scenario, -1 if not selected
+        position = np.full(self._n_scenarios, -1)
+        position[scenarios] = np.arange(len(scenarios))
+        selected = position[self._cells["scenario"]] >= 0
+        batch = CaseBatch(self._base, n_scenarios=len(scenarios))
+        keys = self._cells["key"][selected]
+        for code in np.unique(keys):
+            attribute, column = self._keys[code]
+            mask = keys == code
+            dtype = getattr(self._base, attribute)[column].dtype
+            batch.update(
+                attribute,
+                column,
+                position[self._cells["scenario"][selected][mask]],
+                self._cells["row"][selected][mask],
+                _cast(self._cells["value"][selected][mask], dtype),
+            )
+        return batch
+
+    def save(self, path):
+        """
+        Save the store to a file, see `load`.
+
+
+        Args:
+            path (str):
+                File path.
+        """
+        self._flush()
+        with open(path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a store saved with `save`.
+
+
+        Args:
+            path (str):
+                File path.
+
+
+        Returns:
+            DeltaStore: Loaded store.
+        """
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def __repr__(self):
+        self._flush()
+        return (
+            f"{self.__class__.__name__}(scenarios={self._n_scenarios},"
+            f" cells={len(self._cells['key'])}, structural={len(self._extras)})"
+        )
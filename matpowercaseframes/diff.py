@@ -0,0 +1,398 @@
+import numpy as np
+import pandas as pd
+
+from .core import BaseStruct
+from .utils import data_token
+
+# columns of the long-format change set
+DIFF_COLUMNS = ["attribute", "index", "column", "old", "new"]
+
+
+def _changed_cells(old, new):
+    """Mask of differing values of two aligned columns, NaNs being equal."""
+    if old.dtype.kind in "biufc" and new.dtype.kind in "biufc":
+        changed = old != new
+        if old.dtype.kind in "fc" and new.dtype.kind in "fc":
+            changed &= ~(np.isnan(old) & np.isnan(new))
+        return changed
+    old = np.asarray(old, dtype=object)
+    new = np.asarray(new, dtype=object)
+    return ~((old == new) | (pd.isna(old) & pd.isna(new)))
+
+
+def _missing_column(index, dtype):
+    """Column of missing values, in dtype if it can hold them."""
+    if pd.api.types.is_object_dtype(dtype):
+        return pd.Series([None] * len(index), index=index, dtype=object)
+    values = pd.Series(np.nan, index=index)
+    if dtype.kind in "biu":
+        return values
+    try:
+        return values.astype(dtype)
+    except (TypeError, ValueError):
+        return values
+
+
+def _set_cells(df, changes, dtypes):
+    """Write the changed cells of one table into df, in place, column by column."""
+    for column, group in changes.groupby("column", sort=False):
+        positions = df.index.get_indexer(group["index"].to_numpy())
+        new = group["new"].to_numpy()
+        values = df[column].to_numpy()
+        values = values.astype(np.result_type(values, new), copy=True)
+        values[positions] = new
+        values = pd.Series(values, index=df.index)
+        if column in dtypes:
+            values = values.astype(dtypes[column])
+        df[column] = values
+
+
+def _check_unique(df, attribute):
+    if not df.index.is_unique:
+        raise ValueError(
+            f"Index of '{attribute}' has duplicate labels, rows cannot be aligned."
+        )
+
+
+def _table_diff(attribute, old, new):
+    """
+    Cell changes of the common rows, and added and removed rows and columns.
+
+    Returns:
+        tuple: (pieces of the change set, added rows, removed labels, removed
+            columns, dtypes of changed columns, layout, dtypes of added columns).
+    """
+    _check_unique(old, attribute)
+    _check_unique(new, attribute)
+    if old.index.equals(new.index):
+        common = old.index
+        old_rows = new_rows = slice(None)
+        added = new.iloc[:0]
+        removed = old.index[:0]
+    else:
+        common = old.index.intersection(new.index, sort=False)
+        old_rows = old.index.get_indexer(common)
+        new_rows = new.index.get_indexer(common)
+        added = new[~new.index.isin(common)]
+        removed = old.index[~old.index.isin(common)]
+
+    # columns still sharing data, e.g. with copy-on-write snapshots, are equal
+    shared = set()
+    if isinstance(old_rows, slice):
+        old_pointers = dict(zip(old.columns, data_token(old)[2]))
+        shared = {
+            column
+            for column, pointer in zip(new.columns, data_token(new)[2])
+            if old_pointers.get(column) == pointer
+        }
+
+    pieces = []
+    dtypes = {}
+    for column in new.columns:
+        if column in shared:
+            continue
+        new_values = new[column].to_numpy()[new_rows]
+        if column in old.columns:
+            old_values = old[column].to_numpy()[old_rows]
+            changed = np.flatnonzero(_changed_cells(old_values, new_values))
+            old_values = old_values[changed]
+        else:
+            changed = np.flatnonzero(~pd.isna(new_values))
+            old_values = np.full(len(changed), np.nan)
+        if len(changed) == 0:
+            continue
+        dtypes[column] = new[column].dtype
+        pieces.append((column, common[changed], old_values, new_values[changed]))
+    removed_columns = [column for column in old.columns if column not in new.columns]
+    added_columns = {
+        column: new[column].dtype for column in new.columns if column not in old.columns
+    }
+
+    # target order of rows and columns, when the patch alone does not give it
+    index = old.index.difference(removed, sort=False).append(added.index)
+    columns = [c for c in old.columns if c in new.columns]
+    columns += [c for c in new.columns if c not in old.columns]
+    layout = (
+        None if index.equals(new.index) else new.index,
+        None if new.columns.equals(pd.Index(columns)) else new.columns,
+    )
+    return pieces, added, removed, removed_columns, dtypes, layout, added_columns
+
+
+def _change_set(pieces):
+    """Long-format DataFrame from (attribute, column, labels, old, new) pieces."""
+    if not pieces:
+        return pd.DataFrame({column: [] for column in DIFF_COLUMNS})
+    sizes = [len(piece[2]) for piece in pieces]
+    return pd.DataFrame(
+        {
+            "attribute": np.repeat([piece[0] for piece in pieces], sizes),
+            "index": np.concatenate([np.asarray(p[2], dtype=object) for p in pieces]),
+            "column": np.repeat([piece[1] for piece in pieces], sizes),
+            "old": np.concatenate([piece[3] for piece in pieces]),
+            "new": np.concatenate([piece[4] for piece in pieces]),
+        }
+    )
+
+
+def _same_value(old, new):
+    if (old is None) != (new is None):
+        return False
+    if isinstance(old, pd.DataFrame) and isinstance(new, pd.DataFrame):
+        return old.equals(new)
+    if isinstance(old, BaseStruct) and isinstance(new, BaseStruct):
+        from .fingerprint import table_digest
+
+        return type(old) is type(new) and all(
+            isinstance(getattr(old, name), pd.DataFrame)
+            and isinstance(getattr(new, name, None), pd.DataFrame)
+            and table_digest(getattr(old, name), False, index=True)
+            == table_digest(getattr(new, name), False, index=True)
+            for name in set(old.attributes) | set(new.attributes)
+        )
+    try:
+        return bool(np.all(old == new))
+    except (TypeError, ValueError):
+        return False
+
+
+class CaseDiff:
+    """
+    Differences between two cases, see `diff_cases`.
+
+    Changed cells of rows present in both cases are listed in `changes`, a
+    long-format DataFrame with columns attribute, index (row label), column, old,
+    and new. Rows only in the new case are kept whole in `added`, labels of rows
+    only in the old case in `removed`. Columns only in the new case are listed in
+    `added_columns`, their set values on common rows in `changes`. The diff is a
+    patch: `apply` rebuilds the new case from the old one.
+    """
+
+    def __init__(
+        self,
+        changes,
+        added=None,
+        removed=None,
+        removed_columns=None,
+        values=None,
+        dtypes=None,
+        layout=None,
+        added_columns=None,
+    ):
+        """
+        Initialize the diff, see `diff_cases`.
+
+
+        Args:
+            changes (pd.DataFrame):
+                Long-format change set of the cells, with DIFF_COLUMNS.
+            added (dict | None):
+                {attribute: DataFrame} of the added rows.
+            removed (dict | None):
+                {attribute: pd.Index} of the labels of the removed rows.
+            removed_columns (dict | None):
+                {attribute: [columns]} of the removed columns.
+            values (dict | None):
+                {attribute: (old, new)} of other changed attributes, such as
+                baseMVA, nested structs, or tables only in one case (None on the
+                other side).
+            dtypes (dict | None):
+                {attribute: {column: dtype}} of the changed columns in the new case.
+            layout (dict | None):
+                {attribute: (index, columns)} of the new case, where applying the
+                changes does not give its order of rows (index) or columns.
+            added_columns (dict | None):
+                {attribute: {column: dtype}} of the columns only in the new case.
+        """
+        self.changes = changes
+        self.added = added or {}
+        self.removed = removed or {}
+        self.removed_columns = removed_columns or {}
+        self.values = values or {}
+        self.dtypes = dtypes or {}
+        self.layout = layout or {}
+        self.added_columns = added_columns or {}
+
+    @property
+    def empty(self):
+        """bool: Whether the cases are equal, including the order of rows."""
+        return self.changes.empty and not (
+            self.added
+            or self.removed
+            or self.removed_columns
+            or self.added_columns
+            or self.values
+            or self.layout
+        )
+
+    @property
+    def modified(self):
+        """dict: {attribute: pd.Index} of the labels of rows with changed cells."""
+        return {
+            attribute: pd.Index(group["index"].unique()).infer_objects()
+            for attribute, group in self.changes.groupby("attribute", sort=False)
+        }
+
+    def summary(self):
+        """
+        Count the changes of each table.
+
+
+        Returns:
+            pd.DataFrame: Counts of added, removed, and modified rows, and changed
+                cells, indexed by attribute.
+        """
+        attributes = list(
+            dict.fromkeys(
+                [*self.changes["attribute"].unique(), *self.added, *self.removed]
+            )
+        )
+        counts = self.changes.groupby("attribute", sort=False).agg(
+            modified=("index", "nunique"), cells=("index", "size")
+        )
+        summary = pd.DataFrame(
+            {
+                "added": [len(self.added.get(a, ())) for a in attributes],
+                "removed": [len(self.removed.get(a, ())) for a in attributes],
+            },
+            index=pd.Index(attributes, name="attribute"),
+        )
+        summary = summary.join(counts).fillna(0).astype(int)
+        return summary
+
+    def apply(self, case):
+        """
+        Apply the diff as a patch.
+
+
+        Args:
+            case (CaseFrames):
+                Old case, not changed.
+
+
+        Returns:
+            CaseFrames: Shallow copy of case with the changes applied, equal to the
+                new case.
+        """
+        cf = case.copy()
+        for attribute, (_, new) in self.values.items():
+            if new is None:
+                if attribute in cf.attributes:
+                    cf.attributes.remove(attribute)
+                    object.__delattr__(cf, attribute)
+            else:
+                cf.set_attribute(attribute, _copy(new))
+
+        groups = dict(list(self.changes.groupby("attribute", sort=False)))
+        attributes = dict.fromkeys(
+            [
+                *groups,
+                *self.added,
+                *self.removed,
+                *self.removed_columns,
+                *self.added_columns,
+                *self.layout,
+            ]
+        )
+        for attribute in attributes:
+            df = self._apply_table(attribute, getattr(cf, attribute), groups)
+            cf.set_attribute(attribute, df)
+        return cf
+
+    def _apply_table(self, attribute, df, groups):
+        if attribute in self.removed:
+            df = df.drop(index=self.removed[attribute])
+        if attribute in self.removed_columns:
+            df = df.drop(columns=self.removed_columns[attribute])
+        else:
+            df = df.copy(deep=False)
+        added_columns = self.added_columns.get(attribute, {})
+        for column, dtype in added_columns.items():
+            df[column] = _missing_column(df.index, dtype)
+        if attribute in groups:
+            _set_cells(df, groups[attribute], self.dtypes.get(attribute, {}))
+        if attribute in self.added:
+            df = pd.concat([df, self.added[attribute][df.columns]])
+            for column, dtype in added_columns.items():
+                if df[column].dtype != dtype and df[column].notna().all():
+                    df[column] = df[column].astype(dtype)
+        index, columns = self.layout.get(attribute, (None, None))
+        if index is not None:
+            df = df.loc[index]
+        if columns is not None:
+            df = df[columns]
+        return df
+
+    def __repr__(self):
+        parts = [f"{len(self.changes)} cells"]
+        parts += [f"{k}: +{len(v)} rows" for k, v in self.added.items()]
+        parts += [f"{k}: -{len(v)} rows" for k, v in self.removed.items()]
+        parts += [f"{k}: +{len(v)} columns" for k, v in self.added_columns.items()]
+        if self.values:
+            parts.append(f"values: {list(self.values)}")
+        return f"{self.__class__.__name__}({', '.join(parts)})"
+
+
+def _copy(value):
+    if isinstance(value, (pd.DataFrame, BaseStruct)):
+        return value.copy()
+    return value
+
+
+def diff_cases(case, other, attributes=None):
+    """
+    Compare two cases, aligning the rows of each table by index label.
+
+    The comparison is vectorized column by column. Values are equal when they
+    compare equal or are both missing; dtypes alone are not changes.
+
+
+    Args:
+        case (CaseFrames):
+            Old case.
+        other (CaseFrames):
+            New case.
+        attributes (list | None):
+            Attributes to compare. Defaults to the attributes of both cases.
+
+
+    Returns:
+        CaseDiff: Differences from case into other.
+
+
+    Raises:
+        ValueError: If a table index has duplicate labels.
+    """
+    if attributes is None:
+        attributes = list(dict.fromkeys([*case.attributes, *other.attributes]))
+    pieces = []
+    added, removed, removed_columns, values, dtypes = {}, {}, {}, {}, {}
+    layout, added_columns = {}, {}
+    for attribute in attributes:
+        old = getattr(case, attribute) if attribute in case.attributes else None
+        new = getattr(other, attribute) if attribute in other.attributes else None
+        if not (isinstance(old, pd.DataFrame) and isinstance(new, pd.DataFrame)):
+            if not _same_value(old, new):
+                values[attribute] = (old, new)
+            continue
+        table_pieces, *results, table_layout, new_columns = _table_diff(
+            attribute, old, new
+        )
+        pieces.extend((attribute, *piece) for piece in table_pieces)
+        for result, value in zip((added, removed, removed_columns, dtypes), results):
+            if len(value):
+                result[attribute] = value
+        if any(order is not None for order in table_layout):
+            layout[attribute] = table_layout
+        if new_columns:
+            added_columns[attribute] = new_columns
+    return CaseDiff(
+        _change_set(pieces),
+        added,
+        removed,
+        removed_columns,
+        values,
+        dtypes,
+        layout,
+        added_columns,
+    )
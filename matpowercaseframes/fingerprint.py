@@ -0,0 +1,136 @@
+import hashlib
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# bytes of every digest
+DIGEST_SIZE = 16
+
+
+def _mix(values):
+    """Mix uint64 values in place with the splitmix64 finalizer, a bijection."""
+    values ^= values >> np.uint64(30)
+    values *= np.uint64(0xBF58476D1CE4E5B9)
+    values ^= values >> np.uint64(27)
+    values *= np.uint64(0x94D049BB133111EB)
+    values ^= values >> np.uint64(31)
+    return values
+
+
+@lru_cache(maxsize=16)
+def _row_weights(n_rows):
+    """Odd pseudo-random weight of each row position, fixed across sessions."""
+    weights = _mix(np.arange(n_rows, dtype=np.uint64) + np.uint64(0x9E3779B97F4A7C15))
+    weights |= np.uint64(1)
+    weights.flags.writeable = False
+    return weights
+
+
+def _row_hashes(values, normalize_dtypes):
+    """
+    New uint64 array with one hash per value, of the same shape, and a dtype tag.
+    """
+    if not isinstance(values, np.ndarray) or values.dtype.kind not in "biufc":
+        # strings and other objects, hashed element-wise with a fixed key
+        values = np.asarray(values, dtype=object)
+        hashes = pd.util.hash_array(values.ravel(order="K")).reshape(values.shape)
+        return hashes, "object"
+    if values.dtype.kind == "c":
+        real = _row_hashes(values.real, normalize_dtypes)[0]
+        imag = _row_hashes(values.imag, normalize_dtypes)[0]
+        return real ^ _mix(imag), "c" if normalize_dtypes else values.dtype.str
+    if normalize_dtypes:
+        values = values.astype(np.float64, copy=False) + 0.0  # -0.0 into 0.0
+        nan = np.isnan(values)
+        if nan.any():
+            values[nan] = np.nan  # a single NaN payload
+        return _mix(values.view(np.uint64)), "f"
+    tag = values.dtype.str
+    if values.dtype.itemsize == 8:
+        hashes = values.view(np.uint64).copy()
+    else:
+        hashes = values.view(f"u{values.dtype.itemsize}").astype(np.uint64)
+    return _mix(hashes), tag
+
+
+def _column_sums(hashes):
+    """
+    Weighted sums modulo 2**64 of the value hashes down each column: a change of
+    any single value always changes the sum of its column.
+    """
+    hashes *= _row_weights(len(hashes)).reshape((-1,) + (1,) * (hashes.ndim - 1))
+    return hashes.sum(axis=0, dtype=np.uint64)
+
+
+def table_digest(df, normalize_dtypes=True, ignore_columns=(), index=False):
+    """
+    Digest of the data of a table, from vectorized hashes of its values.
+
+    Each value is mixed into 64 bits and the values of each column are summed with
+    odd weights of their row positions, modulo 2**64, all in NumPy without
+    per-row Python code. The column sums, names, and dtype tags are then hashed
+    with BLAKE2b, so the digest is stable across platforms and sessions. Column
+    names and order, row order, and values are covered; it is not meant to be
+    cryptographically secure. Tables of numeric columns are hashed as one 2-D
+    array.
+
+
+    Args:
+        df (pd.DataFrame):
+            Table to hash.
+        normalize_dtypes (bool):
+            Whether to hash numeric columns as float64, so that e.g. integer and
+            float columns of equal values, -0.0 and 0.0, or NaNs, hash equal.
+        ignore_columns (list):
+            Columns to skip. Missing columns are ignored.
+        index (bool):
+            Whether to include the index labels.
+
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    if any(column in df.columns for column in ignore_columns):
+        df = df.drop(columns=[c for c in ignore_columns if c in df.columns])
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    hasher.update(str(len(df)).encode())
+    if index:
+        hashes = pd.util.hash_array(np.asarray(df.index, dtype=object))
+        hasher.update(_column_sums(hashes).astype("<u8").tobytes())
+    kinds = {dtype.kind if isinstance(dtype, np.dtype) else "O" for dtype in df.dtypes}
+    uniform = len(set(df.dtypes)) == 1 and kinds <= set("biufc")
+    if len(df.columns) and (uniform or (normalize_dtypes and kinds <= set("biuf"))):
+        # a single block is returned as a (transposed) view, without copies
+        hashes, tag = _row_hashes(df.to_numpy(), normalize_dtypes)
+        hasher.update("\0".join(f"{column}\0{tag}" for column in df.columns).encode())
+        hasher.update(_column_sums(hashes).astype("<u8").tobytes())
+        return hasher.hexdigest()
+    for i, column in enumerate(df.columns):
+        hashes, tag = _row_hashes(df.iloc[:, i].to_numpy(), normalize_dtypes)
+        hasher.update(f"\0{column}\0{tag}\0".encode())
+        hasher.update(_column_sums(hashes).astype("<u8").tobytes())
+    return hasher.hexdigest()
+
+
+def combine_digests(digests, baseMVA=None):
+    """
+    Combine table digests into one fingerprint, independent of the table order.
+
+
+    Args:
+        digests (dict):
+            {name: digest} of the tables.
+        baseMVA (float | None):
+            System MVA base, included when given.
+
+
+    Returns:
+        str: Hexadecimal digest.
+    """
+    hasher = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    if baseMVA is not None:
+        hasher.update(repr(float(baseMVA)).encode())
+    for name in sorted(digests):
+        hasher.update(f"\0{name}\0{digests[name]}".encode())
+    return hasher.hexdigest()
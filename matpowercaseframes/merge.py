@@ -0,0 +1,315 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .constants import ATTRIBUTES
+from .idx.cost import COST
+from .subnetwork import BUS_COLUMNS, COST_TABLES, NAME_ATTRIBUTES, _has_table
+
+# columns of a tie-line naming the source case of each end, see `concat_cases`
+TIE_COLUMNS = ["F_CASE", "F_BUS", "T_CASE", "T_BUS"]
+# branch values of tie-lines when not given, 0 otherwise
+TIE_DEFAULTS = {"BR_STATUS": 1, "ANGMIN": -360, "ANGMAX": 360}
+
+Merge = namedtuple("Merge", ["case", "mappings"])
+Merge.__doc__ = """
+Result of `concat_cases`: the merged case, and the mappings dict of Series by
+attribute ('bus', 'branch', 'gen', and 'dcline'), indexed by (source, label) and
+valued by the label in the merged case. Bus mappings use bus numbers (BUS_I),
+the others use row labels.
+"""
+
+
+def bus_offsets(cases, offsets=None):
+    """
+    Bus number offset of each case.
+
+
+    Args:
+        cases (list):
+            Cases to merge.
+        offsets (int | list | None):
+            An int for a fixed block of bus numbers per case (case k starts at
+            k * offsets), a list of offsets, or None to shift each case past the
+            largest bus number of the previous ones.
+
+
+    Returns:
+        np.ndarray: Offset of each case.
+
+
+    Raises:
+        ValueError: If a list of offsets does not have one offset per case.
+    """
+    if offsets is None:
+        largest = [case.bus["BUS_I"].max() if len(case.bus) else 0 for case in cases]
+        return np.r_[0, np.cumsum(largest)[:-1]].astype(np.int64)
+    if np.ndim(offsets) == 0:
+        return np.arange(len(cases), dtype=np.int64) * int(offsets)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets.shape != (len(cases),):
+        raise ValueError(f"Got {offsets.size} bus offsets for {len(cases)} cases.")
+    return offsets
+
+
+def _concat(frames):
+    """Concatenated tables with a fresh RangeIndex, keeping the first index name."""
+    df = pd.concat(frames, ignore_index=True)
+    df.index.name = frames[0].index.name
+    return df
+
+
+def _source_index(keys, labels):
+    """(source, label) index of the concatenated rows of the sources."""
+    sources = np.repeat(np.asarray(keys, dtype=object), [len(x) for x in labels])
+    old = np.concatenate([np.asarray(x) for x in labels])
+    return pd.MultiIndex.from_arrays([sources, old], names=["source", "label"])
+
+
+def _concat_costs(merged, attribute, costs, n_rows):
+    """Cost tables of the sources, active rows first, then reactive rows if any."""
+    reactive = [len(df) == 2 * n and n > 0 for df, n in zip(costs, n_rows)]
+    if any(reactive) and not all(r or n == 0 for r, n in zip(reactive, n_rows)):
+        raise ValueError(f"Only some '{attribute}' tables have reactive cost rows.")
+    for df, n in zip(costs, n_rows):
+        if len(df) not in (n, 2 * n):
+            raise ValueError(
+                f"'{attribute}' has {len(df)} rows, expected {n} or {2 * n}."
+            )
+
+    # parameters are padded with zeros, ignored beyond NCOST
+    width = max(df.shape[1] for df in costs)
+    values = [
+        np.pad(df.to_numpy(dtype=float), ((0, 0), (0, width - df.shape[1])))
+        for df in costs
+    ]
+    if any(reactive):
+        values = [v[:n] for v, n in zip(values, n_rows)] + [
+            v[n:] for v, n in zip(values, n_rows)
+        ]
+    values = np.concatenate(values) if values else np.zeros((0, COST))
+    df = merged._get_dataframe(attribute, values)
+    df.index.name = costs[0].index.name
+    return df
+
+
+def _dedup_names(names, keys):
+    """Names of the sources, suffixing duplicates with their source key."""
+    sizes = [len(n) for n in names]
+    sources = np.repeat(np.asarray([str(k) for k in keys], dtype=object), sizes)
+    names = np.concatenate([np.asarray(n, dtype=object) for n in names])
+    duplicated = pd.Index(names).duplicated(keep=False)
+    names[duplicated] = names[duplicated] + "_" + sources[duplicated]
+    if pd.Index(names).has_duplicates:
+        raise ValueError("Names are still duplicated after adding source keys.")
+    return names
+
+
+def _concat_reserves(merged, cases, gen_sizes):
+    """Block-diagonal reserve zones of the sources, with generators renumbered."""
+    gen_offsets = np.r_[0, np.cumsum(gen_sizes)[:-1]]
+    sources = [
+        (case.reserves, offset)
+        for case, offset in zip(cases, gen_offsets)
+        if "reserves" in case.attributes
+    ]
+    n_zones = sum(len(reserves.zones) for reserves, _ in sources)
+    zones = np.zeros((n_zones, sum(gen_sizes)))
+    row = 0
+    tables = {"req": [], "cost": [], "qty": []}
+    for reserves, offset in sources:
+        block = reserves.zones.to_numpy()
+        zones[row : row + len(block), offset : offset + block.shape[1]] = block
+        row += len(block)
+        for attribute in tables:
+            if attribute in reserves.attributes:
+                df = getattr(reserves, attribute)
+                if attribute != "req":
+                    # gen labels follow the columns of the zones, from 1
+                    positions = reserves.zones.columns.get_indexer(df.index)
+                    df = df.set_axis(pd.Index(positions + offset + 1, name="gen"))
+                tables[attribute].append(df)
+
+    reserves = sources[0][0].copy()
+    reserves.set_attribute(
+        "zones",
+        pd.DataFrame(
+            zones,
+            index=pd.RangeIndex(1, n_zones + 1, name="zone"),
+            columns=pd.RangeIndex(1, zones.shape[1] + 1, name="gen"),
+        ),
+    )
+    for attribute, frames in tables.items():
+        if frames:
+            df = pd.concat(frames)
+            if attribute == "req":
+                df.index = pd.RangeIndex(1, n_zones + 1, name="zone")
+            reserves.set_attribute(attribute, df)
+    merged.set_attribute("reserves", reserves)
+
+
+def _tie_rows(ties, bus_mapping, columns):
+    """Branch rows of tie-lines, with bus numbers of the merged case."""
+    missing = [c for c in TIE_COLUMNS if c not in ties.columns]
+    if missing:
+        raise ValueError(f"Tie-lines are missing columns {missing}.")
+    rows = pd.DataFrame(
+        {c: ties[c] if c in ties.columns else TIE_DEFAULTS.get(c, 0) for c in columns},
+        columns=columns,
+    ).reset_index(drop=True)
+    for end in ("F", "T"):
+        keys = pd.MultiIndex.from_arrays(
+            [ties[f"{end}_CASE"].to_numpy(), ties[f"{end}_BUS"].to_numpy()]
+        )
+        positions = bus_mapping.index.get_indexer(keys)
+        if (positions < 0).any():
+            raise ValueError(
+                f"Tie-lines reference buses not found: {keys[positions < 0][:10]}"
+            )
+        rows[f"{end}_BUS"] = bus_mapping.to_numpy()[positions]
+    return rows
+
+
+def _concat_tables(merged, cases, offsets):
+    """Tables with bus columns of the sources, concatenated with shifted buses."""
+    frames = {}
+    for attribute, columns in BUS_COLUMNS.items():
+        present = [_has_table(case, attribute) for case in cases]
+        if not any(present):
+            continue
+        empty = getattr(cases[present.index(True)], attribute).iloc[:0]
+        frames[attribute] = [
+            getattr(case, attribute) if has else empty
+            for case, has in zip(cases, present)
+        ]
+        df = _concat(frames[attribute])
+        shift = np.repeat(offsets, [len(frame) for frame in frames[attribute]])
+        for column in columns:
+            df[column] = (df[column].to_numpy() + shift).astype(df[column].dtype)
+        merged.set_attribute(attribute, df)
+    return frames
+
+
+def _concat_cost_tables(merged, cases, frames):
+    """Cost tables of the sources, following the concatenated tables."""
+    for attribute, owner in COST_TABLES.items():
+        has_costs = [_has_table(case, attribute) for case in cases]
+        if not any(has_costs):
+            continue
+        n_rows = [len(frame) for frame in frames.get(owner, [])]
+        if not all(has or n == 0 for has, n in zip(has_costs, n_rows)):
+            raise ValueError(f"Only some cases have '{attribute}'.")
+        costs = [getattr(case, attribute) for case, has in zip(cases, has_costs) if has]
+        n_rows = [n for has, n in zip(has_costs, n_rows) if has]
+        merged.set_attribute(attribute, _concat_costs(merged, attribute, costs, n_rows))
+
+
+def _concat_names(merged, cases, keys, frames):
+    """Name indexes present in all sources, with names of tie-lines if any."""
+    for attribute, name in NAME_ATTRIBUTES.items():
+        if attribute not in frames or not all(name in c.attributes for c in cases):
+            continue
+        names = [getattr(case, name) for case in cases]
+        sources = list(keys)
+        n_ties = len(getattr(merged, attribute)) - sum(len(n) for n in names)
+        if n_ties:
+            names.append([f"tie_{i}" for i in range(1, n_ties + 1)])
+            sources.append("tie")
+        names = _dedup_names(names, sources)
+        merged.set_attribute(name, pd.Index(names, name=name))
+
+
+def _source_keys(cases, keys):
+    """Cases as a list, and their source keys."""
+    if isinstance(cases, dict):
+        keys = list(cases) if keys is None else keys
+        cases = list(cases.values())
+    keys = list(range(len(cases))) if keys is None else list(keys)
+    if not cases:
+        raise ValueError("No cases to merge.")
+    if len(keys) != len(cases) or len(set(keys)) != len(keys):
+        raise ValueError("Keys must be unique, one per case.")
+    return cases, keys
+
+
+def concat_cases(cases, keys=None, ties=None, offsets=None):
+    """
+    Merge cases into one, such as regional cases into an interconnection.
+
+    Bus numbers of each case are shifted by an offset, and tables are concatenated
+    in one pass each: bus, branch, gen, their cost tables (with the reactive cost
+    rows of all sources after the active ones), dcline and dclinecost, the name
+    indexes (suffixing names duplicated across sources with their source key),
+    and reserves, with block-diagonal zones. Tie-lines are appended to the branch
+    table. Row labels are then set like for a read case, see `_update_index`.
+    Other attributes are not merged.
+
+
+    Args:
+        cases (list | dict):
+            Cases to merge, or a dict of cases by source key.
+        keys (list | None):
+            Source key of each case, used in mappings, tie-lines, and
+            deduplicated names. Defaults to the dict keys, or 0, 1, ...
+        ties (pd.DataFrame | None):
+            Tie-lines, with F_CASE, F_BUS, T_CASE, T_BUS (source keys and source
+            bus numbers of both ends) and optional branch columns. Missing branch
+            columns are 0, except BR_STATUS 1 and ANGMIN, ANGMAX at -360, 360.
+        offsets (int | list | None):
+            Bus number offsets, see `bus_offsets`.
+
+
+    Returns:
+        Merge: Merged case and per-source mappings of bus numbers and row labels.
+
+
+    Raises:
+        ValueError: If bus numbers collide after offsets, baseMVA differ, cost
+            tables are inconsistent, or a tie-line references a missing bus.
+    """
+    cases, keys = _source_keys(cases, keys)
+    base_mva = {case.baseMVA for case in cases if "baseMVA" in case.attributes}
+    if len(base_mva) > 1:
+        raise ValueError(f"Cases have different baseMVA {sorted(base_mva)}.")
+
+    first = cases[0]
+    merged = first.__class__(columns_templates=first.columns_templates)
+    merged.name = "+".join(str(getattr(case, "name", "")) for case in cases)
+    for attribute in ("version", "baseMVA"):
+        if attribute in first.attributes:
+            merged.set_attribute(attribute, getattr(first, attribute))
+
+    offsets = bus_offsets(cases, offsets)
+    frames = _concat_tables(merged, cases, offsets)
+
+    numbers = pd.Index(merged.bus["BUS_I"].to_numpy())
+    if numbers.has_duplicates:
+        raise ValueError(
+            "Bus numbers collide after offsets: "
+            f"{numbers[numbers.duplicated()].unique().tolist()[:10]}"
+        )
+    index = _source_index(keys, [frame["BUS_I"] for frame in frames["bus"]])
+    mappings = {"bus": pd.Series(numbers.to_numpy(), index=index, name="bus")}
+
+    if ties is not None and len(ties):
+        columns = list(merged.branch.columns)
+        rows = _tie_rows(ties, mappings["bus"], columns)
+        branch = pd.concat([merged.branch, rows.astype(merged.branch.dtypes)])
+        branch.index = pd.RangeIndex(len(branch), name=merged.branch.index.name)
+        merged.set_attribute("branch", branch)
+
+    _concat_cost_tables(merged, cases, frames)
+    _concat_names(merged, cases, keys, frames)
+    if any("reserves" in case.attributes for case in cases):
+        _concat_reserves(merged, cases, [len(frame) for frame in frames["gen"]])
+
+    merged.attributes.sort(key=ATTRIBUTES.index)
+    merged._update_index()
+    for attribute in ("branch", "gen", "dcline"):
+        if attribute in frames:
+            index = _source_index(keys, [frame.index for frame in frames[attribute]])
+            new = getattr(merged, attribute).index[: len(index)]
+            mappings[attribute] = pd.Series(new, index=index, name=attribute)
+
+    return Merge(merged, mappings)
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+
+from .utils import index_positions
+
+try:
+    import scipy.sparse as sp
+except ImportError as e:
+    raise ImportError(
+        "scipy is required for network matrices. "
+        "Install it with `pip install matpowercaseframes[scipy]`."
+    ) from e
+
+# columns used to build the admittance matrices
+YBUS_INPUTS = {
+    "bus": ["BUS_I", "GS", "BS"],
+    "branch": ["F_BUS", "T_BUS", "BR_R", "BR_X", "BR_B", "TAP", "SHIFT", "BR_STATUS"],
+}
+BDC_INPUTS = {
+    "bus": ["BUS_I"],
+    "branch": ["F_BUS", "T_BUS", "BR_X", "TAP", "SHIFT", "BR_STATUS"],
+}
+
+
+def bus_positions(bus, bus_numbers, attribute="branch"):
+    """
+    Map external bus numbers into 0-based row positions of the bus table.
+
+
+    Args:
+        bus (pd.DataFrame):
+            Bus table with BUS_I column.
+        bus_numbers (array_like):
+            External bus numbers to map.
+        attribute (str):
+            Name of the referencing table, used in the error message.
+
+
+    Returns:
+        np.ndarray: Row positions in the bus table.
+
+
+    Raises:
+        ValueError: If a bus number is not found in the bus table.
+    """
+    return index_positions(pd.Index(bus["BUS_I"].to_numpy()), bus_numbers, attribute)
+
+
+def branch_admittances(branch):
+    """
+    Compute the two-port admittance parameters of each branch.
+
+
+    Args:
+        branch (pd.DataFrame):
+            Branch table.
+
+
+    Returns:
+        tuple: (Yff, Yft, Ytf, Ytt) as complex np.ndarray of length nl.
+    """
+    stat = branch["BR_STATUS"].to_numpy(dtype=float)
+    r = branch["BR_R"].to_numpy(dtype=float)
+    x = branch["BR_X"].to_numpy(dtype=float)
+
+    # series admittance, zero for out-of-service branches
+    z = r + 1j * x
+    Ys = np.divide(stat, z, out=np.zeros(len(branch), dtype=complex), where=stat != 0)
+    Bc = stat * branch["BR_B"].to_numpy(dtype=float)
+
+    tap = branch["TAP"].to_numpy(dtype=float)
+    tap = np.where(tap == 0, 1.0, tap)
+    tap = tap * np.exp(1j * np.pi / 180 * branch["SHIFT"].to_numpy(dtype=float))
+
+    Ytt = Ys + 1j * Bc / 2
+    Yff = Ytt / (tap * np.conj(tap))
+    Yft = -Ys / np.conj(tap)
+    Ytf = -Ys / tap
+    return Yff, Yft, Ytf, Ytt
+
+
+def make_ybus(baseMVA, bus, branch):
+    """
+    Build the bus admittance matrix and branch admittance matrices.
+
+    Equivalent to MATPOWER `makeYbus`, with buses numbered by their row position in
+    the bus table.
+
+
+    Args:
+        baseMVA (float):
+            System MVA base.
+        bus (pd.DataFrame):
+            Bus table.
+        branch (pd.DataFrame):
+            Branch table.
+
+
+    Returns:
+        tuple: (Ybus, Yf, Yt) as scipy.sparse.csr_matrix with shapes (nb, nb),
+            (nl, nb), and (nl, nb).
+    """
+    nb = len(bus)
+    nl = len(branch)
+
+    f = bus_positions(bus, branch["F_BUS"])
+    t = bus_positions(bus, branch["T_BUS"])
+    Yff, Yft, Ytf, Ytt = branch_admittances(branch)
+
+    i = np.r_[np.arange(nl), np.arange(nl)]
+    j = np.r_[f, t]
+    Yf = sp.csr_matrix((np.r_[Yff, Yft], (i, j)), shape=(nl, nb))
+    Yt = sp.csr_matrix((np.r_[Ytf, Ytt], (i, j)), shape=(nl, nb))
+
+    Ysh = (bus["GS"].to_numpy(dtype=float) + 1j * bus["BS"].to_numpy(dtype=float)) / (
+        baseMVA
+    )
+    rows = np.r_[f, f, t, t, np.arange(nb)]
+    cols = np.r_[f, t, f, t, np.arange(nb)]
+    data = np.r_[Yff, Yft, Ytf, Ytt, Ysh]
+    Ybus = sp.csr_matrix((data, (rows, cols)), shape=(nb, nb))
+    return Ybus, Yf, Yt
+
+
+def make_bdc(baseMVA, bus, branch):
+    """
+    Build the B matrices and phase shift injections for the DC power flow.
+
+    Equivalent to MATPOWER `makeBdc`, with buses numbered by their row position in
+    the bus table. Injections are in p.u., matching the matrices.
+
+
+    Args:
+        baseMVA (float):
+            System MVA base.
+        bus (pd.DataFrame):
+            Bus table.
+        branch (pd.DataFrame):
+            Branch table.
+
+
+    Returns:
+        tuple: (Bbus, Bf, Pbusinj, Pfinj), where Bbus (nb, nb) and Bf (nl, nb) are
+            scipy.sparse.csr_matrix and Pbusinj (nb,) and Pfinj (nl,) are
+            np.ndarray.
+    """
+    nb = len(bus)
+    nl = len(branch)
+
+    f = bus_positions(bus, branch["F_BUS"])
+    t = bus_positions(bus, branch["T_BUS"])
+
+    # series susceptance, zero for out-of-service branches
+    stat = branch["BR_STATUS"].to_numpy(dtype=float)
+    x = branch["BR_X"].to_numpy(dtype=float)
+    b = np.divide(stat, x, out=np.zeros(nl), where=stat != 0)
+    tap = branch["TAP"].to_numpy(dtype=float)
+    b = b / np.where(tap == 0, 1.0, tap)
+
+    i = np.r_[np.arange(nl), np.arange(nl)]
+    j = np.r_[f, t]
+    Cft = sp.csr_matrix((np.r_[np.ones(nl), -np.ones(nl)], (i, j)), shape=(nl, nb))
+    Bf = sp.csr_matrix((np.r_[b, -b], (i, j)), shape=(nl, nb))
+    Bbus = (Cft.T @ Bf).tocsr()
+
+    Pfinj = b * (-branch["SHIFT"].to_numpy(dtype=float) * np.pi / 180)
+    Pbusinj = Cft.T @ Pfinj
+    return Bbus, Bf, Pbusinj, Pfinj
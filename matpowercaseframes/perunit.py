@@ -0,0 +1,250 @@
+import numpy as np
+
+from .constants import COST_MODELS, PU_COLUMNS, PU_COST_ATTRIBUTES
+from .idx.cost import COST, MODEL, NCOST
+from .utils import changed_columns, copy_on_write, data_token, lazy_copy
+
+
+def pu_factor(unit, baseMVA):
+    """
+    Multiplier converting a column of the given physical unit into p.u. and rad.
+
+
+    Args:
+        unit (str):
+            Unit group from PU_COLUMNS, one of 'MW', 'u/MW', 'deg', or 'u/deg'.
+        baseMVA (float):
+            System MVA base.
+
+
+    Returns:
+        float: Conversion factor.
+    """
+    if unit == "MW":
+        return 1 / baseMVA
+    elif unit == "u/MW":
+        return baseMVA
+    elif unit == "deg":
+        return np.pi / 180
+    elif unit == "u/deg":
+        return 180 / np.pi
+    raise ValueError(f"Unknown unit {unit!r}.")
+
+
+def cost_pu_factors(values, baseMVA):
+    """
+    Multipliers converting cost parameters into p.u. power, row by row.
+
+    Polynomial coefficient of power k is multiplied by baseMVA**k, so the cost at
+    p.u. power equals the cost at physical power. Piecewise linear breakpoints X are
+    divided by baseMVA while costs Y are kept.
+
+
+    Args:
+        values (np.ndarray):
+            Cost table in MATPOWER layout (MODEL, STARTUP, SHUTDOWN, NCOST, ...).
+        baseMVA (float):
+            System MVA base.
+
+
+    Returns:
+        np.ndarray: Factors for the parameter columns (columns from COST onwards).
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    n_params = values.shape[1] - COST
+    if n_params <= 0:
+        return np.ones((values.shape[0], 0))
+
+    model = values[:, [MODEL]]
+    ncost = np.nan_to_num(values[:, [NCOST]]).astype(int)
+    j = np.arange(n_params)[None, :]
+
+    factors = np.ones((values.shape[0], n_params))
+
+    # polynomial: parameter j of n coefficients is for power n - 1 - j
+    power = ncost - 1 - j
+    is_poly = (model == COST_MODELS["POLYNOMIAL"]) & (power >= 0)
+    factors = np.where(is_poly, float(baseMVA) ** np.maximum(power, 0), factors)
+
+    # piecewise linear: even parameters are X breakpoints
+    is_x = (model == COST_MODELS["PW_LINEAR"]) & (j % 2 == 0) & (j < 2 * ncost)
+    factors = np.where(is_x, 1 / baseMVA, factors)
+    return factors
+
+
+def rescale_columns(df, columns, factor):
+    """
+    Multiply existing columns of df by factor, replacing each column.
+
+    Assigning whole columns (instead of writing into the existing values) keeps
+    columns shared with a shallow copy untouched.
+
+
+    Args:
+        df (pd.DataFrame):
+            Table to be modified.
+        columns (list):
+            Column names, missing columns are skipped.
+        factor (float | np.ndarray):
+            Multiplier.
+    """
+    for column in columns:
+        if column in df.columns:
+            df[column] = df[column] * factor
+
+
+def rescale_table(df, attribute, baseMVA, inverse=False):
+    """
+    Convert a table between physical units and p.u., replacing only changed columns.
+
+
+    Args:
+        df (pd.DataFrame):
+            Table to be modified.
+        attribute (str):
+            Attribute name of the table, e.g. 'bus' or 'gencost'.
+        baseMVA (float):
+            System MVA base.
+        inverse (bool):
+            If True, convert from p.u. back to physical units.
+    """
+    if attribute in PU_COLUMNS:
+        for unit, columns in PU_COLUMNS[attribute].items():
+            factor = pu_factor(unit, baseMVA)
+            rescale_columns(df, columns, 1 / factor if inverse else factor)
+    elif attribute in PU_COST_ATTRIBUTES:
+        if df.shape[1] <= COST or df.empty:
+            return
+        factors = cost_pu_factors(df.to_numpy(dtype=float), baseMVA)
+        if inverse:
+            factors = 1 / factors
+        for j, column in enumerate(df.columns[COST:]):
+            if np.any(factors[:, j] != 1):
+                df[column] = df[column] * factors[:, j]
+
+
+def is_pu_table(attribute):
+    """Whether the attribute holds a table rescaled by per-unit conversion."""
+    return attribute in PU_COLUMNS or attribute in PU_COST_ATTRIBUTES
+
+
+def convert_pu(case, inverse=False):
+    """
+    Convert a CaseFrames between physical units and p.u.
+
+
+    Args:
+        case (CaseFrames):
+            Source case, not modified.
+        inverse (bool):
+            If True, convert from p.u. back to physical units.
+
+
+    Returns:
+        CaseFrames: Shallow copy of case with rescaled columns.
+    """
+    cf = case.copy()
+    for attribute in cf.attributes:
+        if is_pu_table(attribute):
+            rescale_table(getattr(cf, attribute), attribute, cf.baseMVA, inverse)
+    return cf
+
+
+class PerUnitView:
+    """
+    Lazy per-unit view of a CaseFrames.
+
+    Attributes are read from the underlying CaseFrames. Tables with physical units
+    are rescaled on first access and cached until the underlying table changes,
+    either by replacing the attribute or by writing into it. Without pandas
+    Copy-on-Write, changes are found by comparing values with a snapshot.
+    """
+
+    def __init__(self, case):
+        """
+        Initialize the view.
+
+
+        Args:
+            case (CaseFrames):
+                Case in physical units.
+        """
+        self._case = case
+        self._cache = {}
+
+    @property
+    def case(self):
+        """CaseFrames: Underlying case in physical units."""
+        return self._case
+
+    @property
+    def attributes(self):
+        """list: List of attribute names of the underlying case."""
+        return self._case.attributes
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = getattr(self._case, name)
+        if name in self._case.attributes and is_pu_table(name):
+            return self._get_table(name, value)
+        return value
+
+    def _get_table(self, name, df):
+        token = (id(df), data_token(df), self._case.baseMVA)
+        cached = self._cache.get(name)
+        if cached is not None and self._is_current(cached, df, token):
+            return cached[2]
+
+        df_pu = self._case._table_copy(name)
+        rescale_table(df_pu, name, self._case.baseMVA)
+
+        # keep a shallow snapshot so writes into `df` trigger a copy-on-write (a
+        # deep one without Copy-on-Write), frozen tables cannot be written into
+        snapshot = df if self._case.frozen else lazy_copy(df)
+        self._cache[name] = (snapshot, token, df_pu)
+        return df_pu
+
+    def _is_current(self, cached, df, token):
+        """Whether a cached table was rescaled from the current data of df."""
+        snapshot, old_token, _ = cached
+        if self._case.frozen or copy_on_write():
+            return old_token == token
+        # writes in place keep the data pointers, compare values instead
+        return (
+            old_token[2] == token[2]
+            and snapshot.index.equals(df.index)
+            and not changed_columns(snapshot, df)
+        )
+
+    def invalidate(self, name=None):
+        """
+        Drop cached per-unit tables.
+
+
+        Args:
+            name (str | None):
+                Attribute to drop. If None, drop all.
+        """
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
+
+    def to_case(self):
+        """
+        Materialize the view as a CaseFrames in p.u.
+
+
+        Returns:
+            CaseFrames: Shallow copy of the underlying case with per-unit tables.
+        """
+        cf = self._case.copy()
+        for attribute in cf.attributes:
+            if is_pu_table(attribute):
+                cf.set_attribute(attribute, lazy_copy(getattr(self, attribute)))
+        return cf
+
+    def __repr__(self):
+        attrs = ", ".join(self._case.attributes)
+        return f"{self.__class__.__name__}(attributes=[{attrs}])"
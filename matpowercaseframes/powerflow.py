@@ -0,0 +1,956 @@
+import time
+
+import numpy as np
+
+from .constants import BUS_TYPES
+from .network import BDC_INPUTS, bus_positions
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse.linalg import splu
+except ImportError as e:
+    raise ImportError(
+        "scipy is required for power flow. "
+        "Install it with `pip install matpowercaseframes[scipy]`."
+    ) from e
+
+# columns used to set up the DC power flow solver, on top of BDC_INPUTS
+DCPF_INPUTS = {
+    "bus": BDC_INPUTS["bus"] + ["BUS_TYPE", "VA"],
+    "branch": BDC_INPUTS["branch"],
+    "gen": ["GEN_BUS", "GEN_STATUS"],
+}
+
+# tolerance on generator Q limits, as MATPOWER opf.violation
+QLIM_VIOLATION = 5e-6
+
+
+def bus_types(bus, gen):
+    """
+    Build index lists of each type of bus (REF, PV, PQ).
+
+    Equivalent to MATPOWER `bustypes`: PV and REF buses without in-service generators
+    are treated as PQ buses and, if there is no REF bus, the first PV bus is used.
+    Isolated buses (type NONE) are excluded from all lists.
+
+
+    Args:
+        bus (pd.DataFrame):
+            Bus table.
+        gen (pd.DataFrame):
+            Generator table.
+
+
+    Returns:
+        tuple: (ref, pv, pq) as np.ndarray of bus row positions.
+    """
+    on = gen["GEN_STATUS"].to_numpy(dtype=float) > 0
+    gbus = bus_positions(bus, gen["GEN_BUS"].to_numpy()[on], attribute="gen")
+    return _bus_types(bus["BUS_TYPE"].to_numpy(dtype=float), gbus)
+
+
+def _bus_types(bus_type, gbus):
+    """
+    Array version of `bus_types`, with gbus the bus positions of in-service gens.
+    """
+    has_gen = np.bincount(gbus, minlength=len(bus_type)) > 0
+    isolated = bus_type == BUS_TYPES["NONE"]
+    ref = np.flatnonzero((bus_type == BUS_TYPES["REF"]) & has_gen)
+    pv = np.flatnonzero((bus_type == BUS_TYPES["PV"]) & has_gen)
+    pq = np.flatnonzero(((bus_type == BUS_TYPES["PQ"]) | ~has_gen) & ~isolated)
+    if len(ref) == 0:
+        if len(pv) == 0:
+            raise ValueError("No reference bus and no PV bus with generators.")
+        ref, pv = pv[:1], pv[1:]
+    return ref, pv, pq
+
+
+def make_sbus(baseMVA, bus, gen):
+    """
+    Build the vector of complex bus power injections (generation - load) in p.u.
+
+    Equivalent to MATPOWER `makeSbus` without voltage-dependent loads.
+
+
+    Args:
+        baseMVA (float):
+            System MVA base.
+        bus (pd.DataFrame):
+            Bus table.
+        gen (pd.DataFrame):
+            Generator table.
+
+
+    Returns:
+        np.ndarray: Complex injections of length nb.
+    """
+    nb = len(bus)
+    on = gen["GEN_STATUS"].to_numpy(dtype=float) > 0
+    gbus = bus_positions(bus, gen["GEN_BUS"].to_numpy()[on], attribute="gen")
+    Sg = gen["PG"].to_numpy(dtype=float)[on] + 1j * gen["QG"].to_numpy(dtype=float)[on]
+    Sd = bus["PD"].to_numpy(dtype=float) + 1j * bus["QD"].to_numpy(dtype=float)
+    Sbus = np.bincount(gbus, Sg.real, nb) + 1j * np.bincount(gbus, Sg.imag, nb) - Sd
+    return Sbus / baseMVA
+
+
+def slack_gens(bus, gen, ref):
+    """
+    Find the first in-service generator at each reference bus.
+
+
+    Args:
+        bus (pd.DataFrame):
+            Bus table.
+        gen (pd.DataFrame):
+            Generator table.
+        ref (np.ndarray):
+            Reference bus row positions.
+
+
+    Returns:
+        np.ndarray: Generator row positions, one per reference bus.
+    """
+    on = np.flatnonzero(gen["GEN_STATUS"].to_numpy(dtype=float) > 0)
+    gbus = bus_positions(bus, gen["GEN_BUS"].to_numpy()[on], attribute="gen")
+    # first occurrence of each bus in the in-service generator list
+    buses, first = np.unique(gbus, return_index=True)
+    return on[first[np.searchsorted(buses, ref)]]
+
+
+def add_result_columns(df, columns_template, columns):
+    """
+    Make sure result columns exist, padding the table as MATPOWER does.
+
+    Missing columns from the template, up to the last requested column, are appended
+    with zeros.
+
+
+    Args:
+        df (pd.DataFrame):
+            Table to be modified.
+        columns_template (list):
+            Full MATPOWER column list of the table.
+        columns (list):
+            Result columns to be written.
+    """
+    last = max(columns_template.index(column) for column in columns)
+    for column in columns_template[: last + 1]:
+        if column not in df.columns:
+            df[column] = 0.0
+
+
+class DCPowerFlow:
+    """
+    Factorized DC power flow of a CaseFrames.
+
+    The reduced Bbus matrix is factorized once, after which `solve` is a pair of
+    sparse triangular solves, so many injection vectors can be solved cheaply.
+    Branches connected to isolated buses (type NONE) are out of service, as MATPOWER
+    `ext2int` does.
+    """
+
+    def __init__(self, case):
+        """
+        Build and factorize the DC power flow equations.
+
+
+        Args:
+            case (CaseFrames):
+                Case with bus, branch, and gen tables.
+        """
+        self.baseMVA = case.baseMVA
+        bus, branch = case.bus, case.branch
+        self.isolated = bus["BUS_TYPE"].to_numpy(dtype=float) == BUS_TYPES["NONE"]
+
+        # branches to isolated buses are out of service
+        f = bus_positions(bus, branch["F_BUS"])
+        t = bus_positions(bus, branch["T_BUS"])
+        status = branch["BR_STATUS"].to_numpy(dtype=float) != 0
+        self.br_on = status & ~(self.isolated[f] | self.isolated[t])
+        if np.array_equal(self.br_on, status):
+            self.Bbus, self.Bf, self.Pbusinj, self.Pfinj = case.make_bdc()
+        else:
+            from .network import make_bdc
+
+            branch_on = branch.copy(deep=False)
+            branch_on["BR_STATUS"] = self.br_on.astype(float)
+            self.Bbus, self.Bf, self.Pbusinj, self.Pfinj = make_bdc(
+                self.baseMVA, bus, branch_on
+            )
+        self.ref, self.pv, self.pq = bus_types(bus, case.gen)
+        self.pvpq = np.r_[self.pv, self.pq]
+        self.Va0 = case.bus["VA"].to_numpy(dtype=float) * np.pi / 180
+
+        Bbus_pvpq = self.Bbus[self.pvpq]
+        self._B_ref = Bbus_pvpq[:, self.ref]
+        try:
+            self._lu = splu(Bbus_pvpq[:, self.pvpq].tocsc())
+        except RuntimeError as e:
+            raise ValueError(
+                "DC power flow matrix is singular, check for islands without a"
+                " reference bus."
+            ) from e
+
+    def solve(self, Pbus):
+        """
+        Solve bus voltage angles for given net injections.
+
+
+        Args:
+            Pbus (np.ndarray):
+                Net real power injections in p.u. (generation - load - shunt -
+                Pbusinj), of shape (nb,) or (n_scenarios, nb).
+
+
+        Returns:
+            np.ndarray: Voltage angles in rad, same shape as Pbus.
+        """
+        Pbus = np.asarray(Pbus, dtype=float)
+        Va = np.broadcast_to(self.Va0, Pbus.shape).copy()
+        Va_ref = self.Va0[self.ref]
+        rhs = Pbus[..., self.pvpq] - self._B_ref @ Va_ref
+        Va[..., self.pvpq] = self._lu.solve(np.ascontiguousarray(rhs.T)).T
+        return Va
+
+    def branch_flows(self, Va):
+        """
+        Compute branch real power flows at the from end.
+
+
+        Args:
+            Va (np.ndarray):
+                Voltage angles in rad, of shape (nb,) or (n_scenarios, nb).
+
+
+        Returns:
+            np.ndarray: Branch flows in p.u., of shape (nl,) or (n_scenarios, nl),
+                zero for out-of-service branches.
+        """
+        Pf = (self.Bf @ np.asarray(Va).T).T + self.Pfinj
+        return np.where(self.br_on, Pf, 0)
+
+    def injections(self, case):
+        """
+        Compute the net real power injections of a case, as used by `solve`.
+
+
+        Args:
+            case (CaseFrames):
+                Case with the same buses as the factorized case.
+
+
+        Returns:
+            np.ndarray: Net injections in p.u. of length nb.
+        """
+        return (
+            make_sbus(self.baseMVA, case.bus, case.gen).real
+            - self.Pbusinj
+            - case.bus["GS"].to_numpy(dtype=float) / self.baseMVA
+        )
+
+
+def run_dcpf(case):
+    """
+    Run a DC power flow, equivalent to MATPOWER `rundcpf`.
+
+
+    Args:
+        case (CaseFrames):
+            Case in MATPOWER units.
+
+
+    Returns:
+        CaseFrames: Shallow copy of case with VM, VA in bus, PF, QF, PT, QT in branch,
+            the slack generator PG updated, and `success` and `et` attributes.
+    """
+    t0 = time.perf_counter()
+    solver = case.dcpf_solver()
+    Pbus = solver.injections(case)
+    Va = solver.solve(Pbus)
+    Pf = solver.branch_flows(Va) * case.baseMVA
+
+    cf = case.copy()
+    add_result_columns(
+        cf.branch, cf.columns_templates["branch"], ["PF", "QF", "PT", "QT"]
+    )
+    cf.branch["PF"] = Pf
+    cf.branch["QF"] = 0.0
+    cf.branch["PT"] = -Pf
+    cf.branch["QT"] = 0.0
+    isolated = solver.isolated
+    cf.bus["VM"] = np.where(isolated, case.bus["VM"], 1.0)
+    cf.bus["VA"] = np.where(isolated, case.bus["VA"], Va * 180 / np.pi)
+
+    # update slack generators, other generators at reference buses are in Pbus
+    ref = solver.ref
+    refgen = slack_gens(cf.bus, cf.gen, ref)
+    pg = cf.gen["PG"].to_numpy(dtype=float, copy=True)
+    pg[refgen] += (solver.Bbus[ref] @ Va - Pbus[ref]) * case.baseMVA
+    cf.gen["PG"] = pg
+
+    cf.set_attribute("success", 1)
+    cf.set_attribute("et", time.perf_counter() - t0)
+    return cf
+
+
+class NewtonSolver:
+    """
+    Full Newton's method for the AC power flow of a fixed network and bus types.
+
+    The Jacobian is assembled directly from the nonzeros of Ybus, without forming
+    the full dS/dV matrices. Its sparsity pattern and fill-reducing column ordering
+    are computed once and shared by all later solves, so each iteration only repeats
+    the numeric factorization.
+    """
+
+    def __init__(self, Ybus, ref, pv, pq):
+        """
+        Set up the Jacobian structure.
+
+
+        Args:
+            Ybus (scipy.sparse.csr_matrix):
+                Bus admittance matrix.
+            ref, pv, pq (np.ndarray):
+                Bus row positions of each bus type.
+        """
+        self.Ybus = Ybus
+        self.ref, self.pv, self.pq = ref, pv, pq
+        self.pvpq = pvpq = np.r_[pv, pq]
+        npv = len(pv)
+        n = len(pvpq)
+        self.shape = (n + len(pq), n + len(pq))
+
+        # Ybus entries among pvpq buses plus the full diagonal
+        Ysub = Ybus[pvpq][:, pvpq].tocoo()
+        a = np.r_[Ysub.row, np.arange(n)]
+        b = np.r_[Ysub.col, np.arange(n)]
+        self._y = np.r_[Ysub.data, np.zeros(n)]
+        self._is_diag = np.r_[np.zeros(Ysub.nnz, dtype=bool), np.ones(n, dtype=bool)]
+        self._i, self._k = pvpq[a], pvpq[b]
+        self._col_pq = b >= npv
+        self._row_pq = a >= npv
+        both = self._row_pq & self._col_pq
+        self._rows = np.r_[
+            a, a[self._col_pq], n + a[self._row_pq] - npv, n + a[both] - npv
+        ]
+        self._cols = np.r_[
+            b, n + b[self._col_pq] - npv, b[self._row_pq], n + b[both] - npv
+        ]
+        self.perm = None
+
+    def jacobian(self, V, cols=None):
+        """
+        Build the power flow Jacobian at bus voltages V.
+
+
+        Args:
+            V (np.ndarray):
+                Complex bus voltages.
+            cols (np.ndarray | None):
+                Column positions of the Jacobian entries, to build a column-permuted
+                Jacobian. Defaults to the natural order.
+
+
+        Returns:
+            scipy.sparse.csc_matrix: Jacobian with columns [Va(pvpq), Vm(pq)] and
+                rows [P(pvpq), Q(pq)].
+        """
+        i, k, y, is_diag = self._i, self._k, self._y, self._is_diag
+        Ibus = self.Ybus @ V
+        Vnorm = V / np.abs(V)
+        dS_dVa = 1j * V[i] * np.conj(np.where(is_diag, Ibus[i], 0) - y * V[k])
+        dS_dVm = V[i] * np.conj(y * Vnorm[k]) + np.where(
+            is_diag, np.conj(Ibus[i]) * Vnorm[i], 0
+        )
+        data = np.r_[
+            dS_dVa.real,
+            dS_dVm[self._col_pq].real,
+            dS_dVa[self._row_pq].imag,
+            dS_dVm[self._row_pq & self._col_pq].imag,
+        ]
+        cols = self._cols if cols is None else cols
+        return sp.csc_matrix((data, (self._rows, cols)), shape=self.shape)
+
+    def analyze(self, V):
+        """
+        Compute the fill-reducing column ordering of the Jacobian at V.
+
+        Called by the first `solve`; call it explicitly before sending the solver
+        to worker processes so they share the ordering.
+
+
+        Args:
+            V (np.ndarray):
+                Complex bus voltages.
+
+
+        Returns:
+            scipy.sparse.linalg.SuperLU: Factorization of the Jacobian at V.
+        """
+        lu = splu(self.jacobian(V))
+        # column j of the Jacobian is at position perm[j] of the ordering
+        self.perm = lu.perm_c
+        self._cols_perm = self.perm[self._cols]
+        return lu
+
+    def _step(self, V, F):
+        if self.perm is None:
+            return -self.analyze(V).solve(F)
+
+        # reuse the column ordering of the first factorization
+        lu = splu(self.jacobian(V, self._cols_perm), permc_spec="NATURAL")
+        return -lu.solve(F)[self.perm]
+
+    def solve(self, Sbus, V0, tol=1e-8, max_it=10):
+        """
+        Solve the power flow equations, equivalent to MATPOWER `newtonpf`.
+
+
+        Args:
+            Sbus (np.ndarray):
+                Complex bus power injections (generation - load) in p.u.
+            V0 (np.ndarray):
+                Initial complex bus voltages.
+            tol (float):
+                Tolerance on the maximum P and Q mismatch in p.u.
+            max_it (int):
+                Maximum number of iterations.
+
+
+        Returns:
+            tuple: (V, success, iterations).
+        """
+        pvpq, pq = self.pvpq, self.pq
+        n = len(pvpq)
+
+        V = np.asarray(V0, dtype=complex).copy()
+        Va = np.angle(V)
+        Vm = np.abs(V)
+
+        def mismatch(V):
+            mis = V * np.conj(self.Ybus @ V) - Sbus
+            return np.r_[mis[pvpq].real, mis[pq].imag]
+
+        F = mismatch(V)
+        iterations = 0
+        converged = np.linalg.norm(F, np.inf) < tol
+        while not converged and iterations < max_it:
+            iterations += 1
+            try:
+                dx = self._step(V, F)
+            except RuntimeError:  # singular Jacobian
+                break
+
+            Va[pvpq] += dx[:n]
+            Vm[pq] += dx[n:]
+            V = Vm * np.exp(1j * Va)
+            # update Vm and Va again in case we wrapped around with a negative Vm
+            Vm = np.abs(V)
+            Va = np.angle(V)
+
+            F = mismatch(V)
+            converged = np.linalg.norm(F, np.inf) < tol
+
+        return V, bool(converged), iterations
+
+
+def newton_pf(Ybus, Sbus, V0, ref, pv, pq, tol=1e-8, max_it=10):
+    """
+    Solve the AC power flow using a full Newton's method in polar coordinates.
+
+    Equivalent to MATPOWER `newtonpf`, see `NewtonSolver`.
+
+
+    Args:
+        Ybus (scipy.sparse.csr_matrix):
+            Bus admittance matrix.
+        Sbus (np.ndarray):
+            Complex bus power injections (generation - load) in p.u.
+        V0 (np.ndarray):
+            Initial complex bus voltages.
+        ref, pv, pq (np.ndarray):
+            Bus row positions of each bus type.
+        tol (float):
+            Tolerance on the maximum P and Q mismatch in p.u.
+        max_it (int):
+            Maximum number of iterations.
+
+
+    Returns:
+        tuple: (V, success, iterations).
+    """
+    return NewtonSolver(Ybus, ref, pv, pq).solve(Sbus, V0, tol=tol, max_it=max_it)
+
+
+def _pf_solution(baseMVA, bus_type, pd, qd, gen, Ybus, V, ref):
+    """
+    Compute generator PG and QG consistent with a power flow solution.
+
+    Equivalent to the generator part of MATPOWER `pfsoln`: total reactive power at
+    each PV or REF bus is split among its generators in proportion to their reactive
+    ranges, and the first generator at each REF bus takes the real power balance.
+
+
+    Args:
+        baseMVA (float):
+            System MVA base.
+        bus_type (np.ndarray):
+            Bus types.
+        pd, qd (np.ndarray):
+            Real and reactive bus demand in MW and MVAr.
+        gen (dict):
+            Generator arrays 'bus' (positions), 'status', 'PG', 'QG', 'QMIN', 'QMAX',
+            where 'PG' and 'QG' are updated in place.
+        Ybus (scipy.sparse.csr_matrix):
+            Bus admittance matrix.
+        V (np.ndarray):
+            Complex bus voltages.
+        ref (np.ndarray):
+            Reference bus positions.
+    """
+    nb = len(bus_type)
+    status = gen["status"]
+    gen["QG"][~status] = 0
+
+    on = np.flatnonzero(status & (bus_type[gen["bus"]] != BUS_TYPES["PQ"]))
+    if len(on) == 0:
+        return
+    gbus = gen["bus"][on]
+    Sbus = V[gbus] * np.conj(Ybus[gbus] @ V)
+    qg = Sbus.imag * baseMVA + qd[gbus]
+
+    if len(on) > 1:
+        # split equally, then in proportion to the reactive range
+        ngg = np.bincount(gbus, minlength=nb)[gbus]
+        qg = qg / ngg
+
+        Qmin = gen["QMIN"][on].copy()
+        Qmax = gen["QMAX"][on].copy()
+        # finite proxy M for infinite limits
+        M = np.abs(qg)
+        M = M + np.where(np.isinf(Qmax), 0, np.abs(Qmax))
+        M = M + np.where(np.isinf(Qmin), 0, np.abs(Qmin))
+        M = np.bincount(gbus, M, nb)[gbus]
+        Qmin = np.where(Qmin == np.inf, M, np.where(Qmin == -np.inf, -M, Qmin))
+        Qmax = np.where(Qmax == np.inf, M, np.where(Qmax == -np.inf, -M, Qmax))
+
+        Qg_tot = np.bincount(gbus, qg, nb)
+        Qg_min = np.bincount(gbus, Qmin, nb)
+        Qg_max = np.bincount(gbus, Qmax, nb)
+        eps = np.finfo(float).eps
+        ratio = (Qg_tot - Qg_min) / (Qg_max - Qg_min + eps)
+        qg = Qmin + ratio[gbus] * (Qmax - Qmin)
+
+        # buses with zero reactive range share the mismatch equally
+        ig = Qg_min[gbus] == Qg_max[gbus]
+        if ig.any():
+            mis = (Qg_tot - Qg_min) / np.maximum(np.bincount(gbus, minlength=nb), 1)
+            qg[ig] = Qmin[ig] + mis[gbus[ig]]
+    gen["QG"][on] = qg
+
+    # slack generators, net of other generators at the same reference bus
+    for bus_ref in ref:
+        refgen = np.flatnonzero(gbus == bus_ref)
+        g = on[refgen[0]]
+        pg = Sbus[refgen[0]].real * baseMVA + pd[bus_ref]
+        gen["PG"][g] = pg - gen["PG"][on[refgen[1:]]].sum()
+
+
+class ACPowerFlow:
+    """
+    AC power flow setup of a CaseFrames.
+
+    Holds the admittance matrices, bus types, initial voltages, and a shared
+    `NewtonSolver`, so many injection scenarios can be solved on the same network.
+    Isolated buses (type NONE), together with branches and generators connected to
+    them, are excluded as MATPOWER `ext2int` does.
+    """
+
+    def __init__(self, case):
+        """
+        Build the admittance matrices and bus type lists.
+
+
+        Args:
+            case (CaseFrames):
+                Case with bus, branch, and gen tables.
+        """
+        self.baseMVA = case.baseMVA
+        bus, branch, gen = case.bus, case.branch, case.gen
+        nb = len(bus)
+
+        self.bus_type = bus["BUS_TYPE"].to_numpy(dtype=float)
+        self.isolated = self.bus_type == BUS_TYPES["NONE"]
+        self.gen_bus = bus_positions(bus, gen["GEN_BUS"], attribute="gen")
+        self.gen_on = (gen["GEN_STATUS"].to_numpy(dtype=float) > 0) & ~self.isolated[
+            self.gen_bus
+        ]
+        self.Cg = sp.csr_matrix(
+            (np.ones(len(gen)), (self.gen_bus, np.arange(len(gen)))),
+            shape=(nb, len(gen)),
+        )
+
+        # branches to isolated buses are out of service
+        self.f = bus_positions(bus, branch["F_BUS"])
+        self.t = bus_positions(bus, branch["T_BUS"])
+        status = branch["BR_STATUS"].to_numpy(dtype=float) != 0
+        self.br_on = status & ~(self.isolated[self.f] | self.isolated[self.t])
+        if np.array_equal(self.br_on, status):
+            self.Ybus, self.Yf, self.Yt = case.make_ybus()
+        else:
+            from .network import make_ybus
+
+            branch_on = branch.copy(deep=False)
+            branch_on["BR_STATUS"] = self.br_on.astype(float)
+            self.Ybus, self.Yf, self.Yt = make_ybus(self.baseMVA, bus, branch_on)
+
+        self.ref, self.pv, self.pq = _bus_types(
+            self.bus_type, self.gen_bus[self.gen_on]
+        )
+        self.newton = NewtonSolver(self.Ybus, self.ref, self.pv, self.pq)
+
+        # initial voltages, with generator set points at PV and REF buses
+        self.V0 = bus["VM"].to_numpy(dtype=float) * np.exp(
+            1j * np.pi / 180 * bus["VA"].to_numpy(dtype=float)
+        )
+        vcb = np.ones(nb, dtype=bool)
+        vcb[self.pq] = False
+        k = np.flatnonzero(self.gen_on & vcb[self.gen_bus])
+        gbus = self.gen_bus[k]
+        vg = gen["VG"].to_numpy(dtype=float)[k]
+        self.V0[gbus] = vg / np.abs(self.V0[gbus]) * self.V0[gbus]
+
+    def injections(self, pd, qd, pg, qg, gen_on=None):
+        """
+        Compute complex bus injections (generation - load) in p.u.
+
+
+        Args:
+            pd, qd (np.ndarray):
+                Bus demand in MW and MVAr, of shape (nb,) or (n_scenarios, nb).
+            pg, qg (np.ndarray):
+                Generator output in MW and MVAr, of shape (ng,) or (n_scenarios, ng).
+            gen_on (np.ndarray | None):
+                Generator status mask. Defaults to the status of the case.
+
+
+        Returns:
+            np.ndarray: Complex injections, of shape (nb,) or (n_scenarios, nb).
+        """
+        on = self.gen_on if gen_on is None else gen_on
+        Sg = np.where(on, np.asarray(pg) + 1j * np.asarray(qg), 0)
+        Sd = np.asarray(pd) + 1j * np.asarray(qd)
+        return ((self.Cg @ Sg.T).T - Sd) / self.baseMVA
+
+    def branch_flows(self, V):
+        """
+        Compute branch complex power flows at both ends in MVA.
+
+
+        Args:
+            V (np.ndarray):
+                Complex bus voltages, of shape (nb,) or (n_scenarios, nb).
+
+
+        Returns:
+            tuple: (Sf, St), of shape (nl,) or (n_scenarios, nl), zero for
+                out-of-service branches.
+        """
+        V = np.asarray(V)
+        Sf = V[..., self.f] * np.conj((self.Yf @ V.T).T) * self.baseMVA
+        St = V[..., self.t] * np.conj((self.Yt @ V.T).T) * self.baseMVA
+        return np.where(self.br_on, Sf, 0), np.where(self.br_on, St, 0)
+
+
+def run_pf(case, qlim=False, tol=1e-8, max_it=10):
+    """
+    Run an AC power flow with Newton's method, equivalent to MATPOWER `runpf`.
+
+
+    Args:
+        case (CaseFrames):
+            Case in MATPOWER units.
+        qlim (bool):
+            Whether to enforce generator reactive power limits by converting
+            violating generator buses to PQ buses, as MATPOWER `pf.enforce_q_lims`.
+        tol (float):
+            Tolerance on the maximum P and Q mismatch in p.u.
+        max_it (int):
+            Maximum number of Newton iterations.
+
+
+    Returns:
+        CaseFrames: Shallow copy of case with VM, VA in bus, PG, QG in gen, PF, QF,
+            PT, QT in branch, and `success` and `et` attributes.
+    """
+    t0 = time.perf_counter()
+    pf = ACPowerFlow(case)
+    baseMVA = pf.baseMVA
+    gen_bus = pf.gen_bus
+
+    bus_type = pf.bus_type.copy()
+    pd = case.bus["PD"].to_numpy(dtype=float, copy=True)
+    qd = case.bus["QD"].to_numpy(dtype=float, copy=True)
+    gen = {
+        "bus": gen_bus,
+        "status": pf.gen_on.copy(),
+        "PG": case.gen["PG"].to_numpy(dtype=float, copy=True),
+        "QG": case.gen["QG"].to_numpy(dtype=float, copy=True),
+        "QMIN": case.gen["QMIN"].to_numpy(dtype=float),
+        "QMAX": case.gen["QMAX"].to_numpy(dtype=float),
+    }
+
+    ref0 = ref = pf.ref
+    newton = pf.newton
+    V0 = pf.V0
+    limited = np.zeros(0, dtype=int)
+    fixed_qg = np.zeros(len(gen_bus))
+    while True:
+        Sbus = pf.injections(pd, qd, gen["PG"], gen["QG"], gen["status"])
+        V, success, _ = newton.solve(Sbus, V0, tol=tol, max_it=max_it)
+        _pf_solution(baseMVA, bus_type, pd, qd, gen, pf.Ybus, V, ref)
+        if not (success and qlim):
+            break
+
+        on = gen["status"]
+        mx = np.flatnonzero(on & (gen["QG"] > gen["QMAX"] + QLIM_VIOLATION))
+        mn = np.flatnonzero(on & (gen["QG"] < gen["QMIN"] - QLIM_VIOLATION))
+        if len(mx) == 0 and len(mn) == 0:
+            break
+
+        infeasible = np.union1d(mx, mn)
+        remaining = np.flatnonzero(
+            on
+            & (
+                (bus_type[gen_bus] == BUS_TYPES["PV"])
+                | (bus_type[gen_bus] == BUS_TYPES["REF"])
+            )
+        )
+        if np.array_equal(infeasible, remaining) and (len(mx) == 0 or len(mn) == 0):
+            # all remaining PV/REF generators violate the same limit
+            success = False
+            break
+
+        # fix violating generators at their limits and treat them as loads
+        fixed_qg[mx] = gen["QMAX"][mx]
+        fixed_qg[mn] = gen["QMIN"][mn]
+        mx = np.r_[mx, mn]
+        gen["QG"][mx] = fixed_qg[mx]
+        gen["status"][mx] = False
+        np.subtract.at(pd, gen_bus[mx], gen["PG"][mx])
+        np.subtract.at(qd, gen_bus[mx], gen["QG"][mx])
+        if len(ref) > 1 and (bus_type[gen_bus[mx]] == BUS_TYPES["REF"]).any():
+            raise ValueError(
+                "Cannot enforce Q limits for slack buses in systems with multiple"
+                " slacks."
+            )
+        bus_type[gen_bus[mx]] = BUS_TYPES["PQ"]
+        ref_temp = ref
+        ref, pv, pq = _bus_types(bus_type, gen_bus[gen["status"]])
+        if not np.array_equal(ref, ref_temp):
+            bus_type[ref] = BUS_TYPES["REF"]
+        newton = NewtonSolver(pf.Ybus, ref, pv, pq)
+        limited = np.r_[limited, mx]
+        V0 = V
+
+    Va = np.angle(V) * 180 / np.pi
+    if len(limited):
+        # restore limited generators and their loads
+        gen["QG"][limited] = fixed_qg[limited]
+        np.add.at(pd, gen_bus[limited], gen["PG"][limited])
+        np.add.at(qd, gen_bus[limited], gen["QG"][limited])
+        gen["status"][limited] = True
+        if not np.array_equal(ref, ref0):
+            Va = Va - Va[ref0] + case.bus["VA"].to_numpy(dtype=float)[ref0]
+
+    Sf, St = pf.branch_flows(V)
+
+    cf = case.copy()
+    bus = case.bus
+    isolated = pf.isolated
+    cf.bus["BUS_TYPE"] = np.where(isolated, bus["BUS_TYPE"], bus_type)
+    cf.bus["VM"] = np.where(isolated, bus["VM"], np.abs(V))
+    cf.bus["VA"] = np.where(isolated, bus["VA"], Va)
+    cf.gen["PG"] = gen["PG"]
+    cf.gen["QG"] = gen["QG"]
+    add_result_columns(
+        cf.branch, cf.columns_templates["branch"], ["PF", "QF", "PT", "QT"]
+    )
+    cf.branch["PF"] = Sf.real
+    cf.branch["QF"] = Sf.imag
+    cf.branch["PT"] = St.real
+    cf.branch["QT"] = St.imag
+
+    cf.set_attribute("success", int(success))
+    cf.set_attribute("et", time.perf_counter() - t0)
+    return cf
+
+
+def _solve_scenarios(newton, Sbus, V0, tol, max_it):
+    """
+    Solve a stack of injection scenarios one by one with a shared NewtonSolver.
+    """
+    V = np.empty(Sbus.shape, dtype=complex)
+    success = np.zeros(len(Sbus), dtype=bool)
+    iterations = np.zeros(len(Sbus), dtype=int)
+    for s in range(len(Sbus)):
+        V[s], success[s], iterations[s] = newton.solve(
+            Sbus[s], V0, tol=tol, max_it=max_it
+        )
+    return V, success, iterations
+
+
+def _scenario_array(values, default, name):
+    if values is None:
+        return default[None, :]
+    values = np.atleast_2d(np.asarray(values, dtype=float))
+    if values.shape[1] != len(default):
+        raise ValueError(
+            f"{name} scenarios must have {len(default)} columns, got {values.shape[1]}."
+        )
+    return values
+
+
+def run_pf_batch(
+    case, PD=None, QD=None, PG=None, dc=False, tol=1e-8, max_it=10, processes=None
+):
+    """
+    Run power flows of one network under many load and generation scenarios.
+
+    All scenarios share the admittance matrices, bus types, and Jacobian ordering
+    (AC) or the factorized B matrix (DC, solved in a single call). Columns not given
+    are taken from case. Generator Q limits are not enforced.
+
+
+    Args:
+        case (CaseFrames):
+            Case in MATPOWER units.
+        PD, QD (array_like | None):
+            Bus demand in MW and MVAr, of shape (n_scenarios, nb).
+        PG (array_like | None):
+            Generator real power in MW, of shape (n_scenarios, ng).
+        dc (bool):
+            Whether to run DC instead of AC power flows.
+        tol (float):
+            Tolerance on the maximum P and Q mismatch in p.u. (AC only).
+        max_it (int):
+            Maximum number of Newton iterations (AC only).
+        processes (int | None):
+            Number of worker processes for AC scenarios. If None, solve in the
+            current process.
+
+
+    Returns:
+        dict: Arrays 'VM', 'VA' (degrees) of shape (n_scenarios, nb), 'PF', 'QF',
+            'PT', 'QT' of shape (n_scenarios, nl), 'PG', 'QG' of shape
+            (n_scenarios, ng), 'success' and 'iterations' of length n_scenarios.
+    """
+    bus, gen = case.bus, case.gen
+    PD = _scenario_array(PD, bus["PD"].to_numpy(dtype=float), "PD")
+    QD = _scenario_array(QD, bus["QD"].to_numpy(dtype=float), "QD")
+    PG = _scenario_array(PG, gen["PG"].to_numpy(dtype=float), "PG")
+    n_scenarios = max(len(PD), len(QD), len(PG))
+    try:
+        PD, QD, PG = (
+            np.broadcast_to(x, (n_scenarios, x.shape[1])) for x in (PD, QD, PG)
+        )
+    except ValueError as e:
+        raise ValueError(
+            "PD, QD, and PG must have the same number of scenarios."
+        ) from e
+    QG = np.broadcast_to(gen["QG"].to_numpy(dtype=float), PG.shape)
+
+    if dc:
+        return _run_dcpf_batch(case, PD, PG)
+
+    pf = ACPowerFlow(case)
+    Sbus = pf.injections(PD, QD, PG, QG)
+    if processes is None or processes <= 1 or n_scenarios == 1:
+        V, success, iterations = _solve_scenarios(pf.newton, Sbus, pf.V0, tol, max_it)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            pf.newton.analyze(pf.V0)
+        except RuntimeError:  # singular at the initial point, order per worker
+            pass
+        chunks = np.array_split(Sbus, min(processes, n_scenarios))
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_solve_scenarios, pf.newton, chunk, pf.V0, tol, max_it)
+                for chunk in chunks
+            ]
+            V, success, iterations = (
+                np.concatenate(x) for x in zip(*(f.result() for f in futures))
+            )
+
+    # generator outputs, as in run_pf
+    PG_out = PG.copy()
+    QG_out = QG.copy()
+    gen_out = {
+        "bus": pf.gen_bus,
+        "status": pf.gen_on,
+        "QMIN": gen["QMIN"].to_numpy(dtype=float),
+        "QMAX": gen["QMAX"].to_numpy(dtype=float),
+    }
+    for s in range(n_scenarios):
+        gen_out["PG"], gen_out["QG"] = PG_out[s], QG_out[s]
+        _pf_solution(
+            pf.baseMVA, pf.bus_type, PD[s], QD[s], gen_out, pf.Ybus, V[s], pf.ref
+        )
+
+    Sf, St = pf.branch_flows(V)
+    Va = np.angle(V) * 180 / np.pi
+    isolated = pf.isolated
+    return {
+        "VM": np.where(isolated, bus["VM"].to_numpy(dtype=float), np.abs(V)),
+        "VA": np.where(isolated, bus["VA"].to_numpy(dtype=float), Va),
+        "PF": Sf.real,
+        "QF": Sf.imag,
+        "PT": St.real,
+        "QT": St.imag,
+        "PG": PG_out,
+        "QG": QG_out,
+        "success": success,
+        "iterations": iterations,
+    }
+
+
+def _run_dcpf_batch(case, PD, PG):
+    solver = case.dcpf_solver()
+    baseMVA = case.baseMVA
+    bus, gen = case.bus, case.gen
+    on = gen["GEN_STATUS"].to_numpy(dtype=float) > 0
+    gbus = bus_positions(bus, gen["GEN_BUS"], attribute="gen")
+    Cg = sp.csr_matrix(
+        (on.astype(float), (gbus, np.arange(len(gen)))), shape=(len(bus), len(gen))
+    )
+    Pbus = (
+        (Cg @ PG.T).T - PD - bus["GS"].to_numpy(dtype=float)
+    ) / baseMVA - solver.Pbusinj
+    Va = solver.solve(Pbus)
+    Pf = solver.branch_flows(Va) * baseMVA
+
+    # update slack generators, other generators at reference buses are in Pbus
+    ref = solver.ref
+    PG = PG.copy()
+    refgen = slack_gens(bus, gen, ref)
+    PG[:, refgen] += ((solver.Bbus[ref] @ Va.T).T - Pbus[:, ref]) * baseMVA
+
+    n_scenarios = len(Pbus)
+    isolated = solver.isolated
+    return {
+        "VM": np.broadcast_to(
+            np.where(isolated, bus["VM"].to_numpy(dtype=float), 1.0), Va.shape
+        ).copy(),
+        "VA": np.where(isolated, bus["VA"].to_numpy(dtype=float), Va * 180 / np.pi),
+        "PF": Pf,
+        "QF": np.zeros(Pf.shape),
+        "PT": -Pf,
+        "QT": np.zeros(Pf.shape),
+        "PG": PG,
+        "QG": np.broadcast_to(gen["QG"].to_numpy(dtype=float), PG.shape).copy(),
+        "success": np.ones(n_scenarios, dtype=bool),
+        "iterations": np.ones(n_scenarios, dtype=int),
+    }
@@ -0,0 +1,681 @@
+import numpy as np
+import pandas as pd
+
+from .changes import (
+    CT_LOAD_OPTIONS,
+    CT_TABLES,
+    _change_rows,
+    _column_name,
+)
+from .constants import BUS_TYPES
+from .costs import modcost
+from .idx.ct import (
+    CT_MODCOST_F,
+    CT_MODCOST_X,
+    CT_TAREALOAD,
+    CT_TBRCH,
+    CT_TBUS,
+    CT_TGEN,
+    CT_TLOAD,
+)
+from .idx.profile import (
+    PR_ADD,
+    PR_CHGTYPES,
+    PR_REL,
+    PR_REP,
+    PR_TCTD,
+    PR_TMPCD,
+    PR_TSTGD,
+    PR_TXGD,
+    PR_TYPES,
+)
+from .utils import get_attr
+
+# valid tables of each profile type
+PR_TABLES = {
+    "mpcData": PR_TMPCD,
+    "xGenData": PR_TXGD,
+    "ContingencyData": PR_TCTD,
+    "StorageData": PR_TSTGD,
+}
+
+
+class Profile:
+    """
+    A MOST profile, modifying case or xGenData values across time periods and
+    scenarios. Fields follow the MOST Profile struct, see
+    `matpowercaseframes.idx.profile`.
+    """
+
+    def __init__(self, type, table, rows=0, col=0, chgtype=PR_REP, values=0):
+        """
+        Initialize and validate a profile.
+
+
+        Args:
+            type (str):
+                'mpcData', 'xGenData', 'ContingencyData', or 'StorageData'.
+            table (int | str):
+                Modified table, a CT_T* constant for 'mpcData' or a field name
+                otherwise.
+            rows (int | array_like):
+                1-based rows (or areas for area-wide changes) to modify, 0 meaning
+                all rows.
+            col (int):
+                1-based column, or load modification code, for 'mpcData'. Ignored
+                for other types.
+            chgtype (int):
+                PR_REP, PR_REL, or PR_ADD.
+            values (array_like):
+                Values of shape (nt, nj, n_rows), where any dimension may be 1 to
+                apply to all. Missing trailing dimensions are taken as 1, as in
+                MATLAB.
+        """
+        if type not in PR_TYPES:
+            raise ValueError(f"Profile type '{type}' not supported, use {PR_TYPES}.")
+        if table not in PR_TABLES[type]:
+            raise ValueError(f"Table {table!r} cannot be modified by a {type} profile.")
+        if chgtype not in PR_CHGTYPES:
+            raise ValueError(f"Profile chgtype {chgtype} not supported.")
+        rows = np.array(rows, ndmin=1).reshape(-1).astype(int)
+        if len(rows) > 1 and (rows == 0).any():
+            raise ValueError("Profile rows must not mix 0 with other rows.")
+        values = np.asarray(values, dtype=float)
+        if values.ndim > 3:
+            raise ValueError("Profile values must have no more than 3 dimensions.")
+        values = values.reshape(values.shape + (1,) * (3 - values.ndim))
+        if values.shape[2] not in (1, len(rows)):
+            raise ValueError(
+                f"Third dimension of profile values ({values.shape[2]}) must be 1 or"
+                f" the number of rows ({len(rows)})."
+            )
+
+        self.type = type
+        self.table = table
+        self.rows = rows
+        self.col = int(col)
+        self.chgtype = chgtype
+        self.values = values
+
+    @classmethod
+    def from_dict(cls, profile):
+        """
+        Create a profile from a MOST Profile struct.
+
+
+        Args:
+            profile (dict | oct2py.io.Struct):
+                Struct with fields type, table, rows, col, chgtype, and values.
+
+
+        Returns:
+            Profile: The profile.
+        """
+        table = get_attr(profile, "table")
+        if not isinstance(table, str):
+            table = int(np.asarray(table).reshape(-1)[0])
+        col = get_attr(profile, "col")
+        return cls(
+            type=get_attr(profile, "type"),
+            table=table,
+            rows=get_attr(profile, "rows"),
+            col=0 if col is None else int(np.asarray(col).reshape(-1)[0]),
+            chgtype=int(np.asarray(get_attr(profile, "chgtype")).reshape(-1)[0]),
+            values=get_attr(profile, "values"),
+        )
+
+    def to_dict(self):
+        """
+        Convert to a MOST Profile struct.
+
+
+        Returns:
+            dict: Struct with fields type, table, rows (as column vector), col,
+                chgtype, and values (as 3-D array).
+        """
+        return {
+            "type": self.type,
+            "table": self.table,
+            "rows": self.rows.reshape(-1, 1).astype(float),
+            "col": self.col,
+            "chgtype": self.chgtype,
+            "values": self.values,
+        }
+
+    @property
+    def nt(self):
+        """int: Number of time periods of the values, 1 meaning all."""
+        return self.values.shape[0]
+
+    @property
+    def nj(self):
+        """int: Number of scenarios of the values, 1 meaning all."""
+        return self.values.shape[1]
+
+    def expand(self, nt, nj):
+        """
+        Expand values to full time and scenario dimensions, as MOST `loadmd`.
+
+        The time dimension may be longer than nt, in which case it is truncated.
+
+
+        Args:
+            nt (int):
+                Number of time periods.
+            nj (int):
+                Number of scenarios.
+
+
+        Returns:
+            np.ndarray: Read-only view of shape (nt, nj, n), where n is 1 or the
+                number of rows.
+        """
+        values = self.values
+        if values.shape[0] != 1 and values.shape[0] < nt:
+            raise ValueError(
+                f"Time dimension of profile values ({values.shape[0]}) must be 1 or"
+                f" >= nt = {nt}."
+            )
+        if values.shape[1] not in (1, nj):
+            raise ValueError(
+                f"Scenario dimension of profile values ({values.shape[1]}) must be 1"
+                f" or nj = {nj}."
+            )
+        return np.broadcast_to(values[:nt], (nt, nj, values.shape[2]))
+
+    def to_changes(self, nt, nj):
+        """
+        Changes table rows of each time period and scenario, as MOST
+        `apply_profile`. Only for 'mpcData' profiles.
+
+
+        Args:
+            nt (int):
+                Number of time periods.
+            nj (int):
+                Number of scenarios.
+
+
+        Returns:
+            np.ndarray: Changes of shape (nt, nj, n_rows, 7), with label and
+                probability 0.
+        """
+        if self.type != "mpcData":
+            raise ValueError("Only mpcData profiles can be converted to changes.")
+        n = len(self.rows)
+        changes = np.zeros((nt, nj, n, 7))
+        changes[..., 2:6] = [self.table, 0, self.col, self.chgtype]
+        changes[..., 3] = self.rows
+        changes[..., 6] = self.expand(nt, nj)
+        return changes
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(type={self.type!r}, table={self.table!r},"
+            f" rows={self.rows.tolist()}, col={self.col}, chgtype={self.chgtype},"
+            f" values.shape={self.values.shape})"
+        )
+
+
+def load_profiles(profiles):
+    """
+    Normalize profiles into a list of Profile.
+
+
+    Args:
+        profiles (Profile | dict | list):
+            A profile, a MOST Profile struct (dict or oct2py Struct), or a sequence
+            of them.
+
+
+    Returns:
+        list: List of Profile.
+    """
+    if isinstance(profiles, (Profile, dict)):
+        profiles = [profiles]
+    return [p if isinstance(p, Profile) else Profile.from_dict(p) for p in profiles]
+
+
+def profiles_to_most(profiles):
+    """
+    Export profiles in the MOST Profile struct format, for `loadmd`.
+
+    oct2py passes the list as a cell array, turned into a struct array in Octave
+    with `[profiles{:}]`.
+
+
+    Args:
+        profiles (Profile | dict | list):
+            Profiles.
+
+
+    Returns:
+        list: List of MOST Profile structs as dict.
+    """
+    return [profile.to_dict() for profile in load_profiles(profiles)]
+
+
+def profiles_to_changes(profiles, nt=None, nj=None):
+    """
+    Build the changes table of each time period and scenario from the 'mpcData'
+    profiles, as the `OpCondSched` tables built by MOST `loadmd`.
+
+
+    Args:
+        profiles (Profile | dict | list):
+            Profiles. Profiles of other types are skipped.
+        nt (int | None):
+            Number of time periods. Defaults to the longest profile.
+        nj (int | None):
+            Number of scenarios. Defaults to the largest profile.
+
+
+    Returns:
+        list: Nested list [t][j] of changes tables, all with label 0.
+    """
+    profiles = [p for p in load_profiles(profiles) if p.type == "mpcData"]
+    nt, nj = profile_dims(profiles, nt, nj)
+    changes = [p.to_changes(nt, nj) for p in profiles] or [np.zeros((nt, nj, 0, 7))]
+    changes = np.concatenate(changes, axis=2)
+    return [[changes[t, j] for j in range(nj)] for t in range(nt)]
+
+
+def profile_dims(profiles, nt=None, nj=None):
+    """
+    Number of time periods and scenarios of a set of profiles.
+
+
+    Args:
+        profiles (list):
+            List of Profile.
+        nt (int | None):
+            Number of time periods. Defaults to the longest profile.
+        nj (int | None):
+            Number of scenarios. Defaults to the largest profile.
+
+
+    Returns:
+        tuple: (nt, nj).
+    """
+    if nt is None:
+        nt = max([p.nt for p in profiles], default=1)
+    if nj is None:
+        nj = max([p.nj for p in profiles], default=1)
+    return int(nt), int(nj)
+
+
+class _ScenarioEdits:
+    """
+    Columns modified by profiles, as (n_scenarios, n_rows) float arrays.
+
+    Columns are copied on first modification, untouched columns are read-only
+    broadcast views of the base case.
+    """
+
+    def __init__(self, case, n_scenarios, xgd=None):
+        self.case = case
+        self.xgd = xgd
+        self.n_scenarios = n_scenarios
+        self.columns = {}
+        self.tables = {}
+
+    def frame(self, attribute):
+        if attribute == "xgd":
+            if self.xgd is None:
+                raise ValueError("xGenData profiles require xgd.")
+            return self.xgd.df
+        return getattr(self.case, attribute)
+
+    def peek(self, attribute, column):
+        """Current values of a column, without copying."""
+        if column in self.columns.get(attribute, {}):
+            return self.columns[attribute][column]
+        values = self.frame(attribute)[column].to_numpy(dtype=float)
+        return np.broadcast_to(values, (self.n_scenarios, len(values)))
+
+    def get(self, attribute, column):
+        """Writable values of a column."""
+        columns = self.columns.setdefault(attribute, {})
+        if column not in columns:
+            columns[column] = np.array(self.peek(attribute, column))
+        return columns[column]
+
+    def table(self, attribute):
+        """Writable values of a whole table, of shape (n_scenarios, n_rows, n_cols)."""
+        if attribute not in self.tables:
+            df = self.frame(attribute)
+            self.tables[attribute] = np.stack(
+                [self.peek(attribute, column) for column in df.columns], axis=2
+            )
+        return self.tables[attribute]
+
+    def items(self):
+        """Iterate over (attribute, column, values) of modified columns."""
+        for attribute, columns in self.columns.items():
+            yield from ((attribute, column, v) for column, v in columns.items())
+        for attribute, values in self.tables.items():
+            for j, column in enumerate(self.frame(attribute).columns):
+                current = self.peek(attribute, column)
+                if not np.array_equal(values[..., j], current, equal_nan=True):
+                    yield attribute, column, values[..., j]
+
+
+def _modify(values, rows, chgtype, val):
+    """Modify columns rows of (n_scenarios, n_rows) values by (n_scenarios, n)."""
+    if chgtype == PR_REP:
+        values[:, rows] = val
+    elif chgtype == PR_REL:
+        values[:, rows] = val * values[:, rows]
+    else:
+        values[:, rows] = val + values[:, rows]
+
+
+def _profile_rows(profile, n_rows, attribute):
+    """Row positions of a profile, or a slice of all rows for row 0."""
+    rows = profile.rows
+    if len(rows) == 1 and rows[0] == 0:
+        return slice(None)
+    if (rows < 1).any() or (rows > n_rows).any():
+        raise ValueError(f"Profile rows out of range for {attribute} table.")
+    return rows - 1
+
+
+def _apply_mpc_profile(edits, profile, values):
+    """Apply an 'mpcData' profile given (n_scenarios, n) values."""
+    tbl, col, chgtype = profile.table, profile.col, profile.chgtype
+    if tbl in (CT_TLOAD, CT_TAREALOAD):
+        for i, row in enumerate(profile.rows):
+            _apply_load_profile(edits, tbl, row, col, chgtype, values[:, i])
+        return
+
+    attribute = CT_TABLES[tbl]
+    if attribute == "gencost":
+        _apply_gencost_profile(edits, profile, values)
+        return
+
+    column = _column_name(attribute, col)
+    array = edits.get(attribute, column)
+    if tbl in (CT_TBUS, CT_TGEN, CT_TBRCH):
+        rows = _profile_rows(profile, array.shape[1], attribute)
+        if isinstance(rows, slice) or len(np.unique(rows)) == len(rows):
+            _modify(array, rows, chgtype, values)
+            return
+    for i, row in enumerate(profile.rows):
+        rows = _change_rows(edits.case, tbl, row, attribute)
+        if isinstance(rows, int):
+            rows = [rows]
+        _modify(array, rows, chgtype, values[:, [i]])
+
+
+def _apply_gencost_profile(edits, profile, values):
+    tbl, col, chgtype = profile.table, profile.col, profile.chgtype
+    table = edits.table("gencost")
+    for i, row in enumerate(profile.rows):
+        rows = _change_rows(edits.case, tbl, row, "gencost")
+        sub = table[:, rows].reshape(len(table), -1, table.shape[2])
+        val = values[:, [i]]
+        if col in (CT_MODCOST_F, CT_MODCOST_X):
+            if chgtype == PR_REP:
+                raise ValueError(
+                    "Unsupported modification type PR_REP for gencost table"
+                    " CT_MODCOST_F/X modification."
+                )
+            modtype = ("SCALE_" if chgtype == PR_REL else "SHIFT_") + (
+                "F" if col == CT_MODCOST_F else "X"
+            )
+            alpha = np.broadcast_to(val, sub.shape[:2]).reshape(-1)
+            sub = modcost(sub.reshape(-1, sub.shape[2]), alpha, modtype)
+        else:
+            if col < 1 or col > table.shape[2]:
+                raise ValueError(
+                    f"Modification to column {col} of gencost table not supported."
+                )
+            _modify(sub[..., col - 1], slice(None), chgtype, val)
+        table[:, rows] = sub.reshape(table[:, rows].shape)
+
+
+def _apply_load_profile(edits, tbl, row, col, chgtype, val):
+    """Load change of one bus or area in every scenario, as `_apply_load_change`."""
+    case = edits.case
+    if abs(col) not in CT_LOAD_OPTIONS:
+        raise ValueError(f"Column {col} for load modifications is not supported.")
+    which, pq = CT_LOAD_OPTIONS[abs(col)]
+    if tbl == CT_TLOAD:
+        zone = np.zeros(len(case.bus), dtype=bool)
+        zone[_change_rows(case, CT_TBUS, row, "bus")] = True
+    else:
+        zone = case.bus["BUS_AREA"].to_numpy() == row
+    index = pd.Index(case.bus["BUS_I"].to_numpy())
+    gen_bus = index.get_indexer(case.gen["GEN_BUS"].to_numpy())
+    ld = (
+        (edits.peek("gen", "PMIN") < 0)
+        & (edits.peek("gen", "PMAX") == 0)
+        & (edits.peek("gen", "GEN_STATUS") > 0)
+        & zone[gen_bus]
+    )
+
+    scale = _load_profile_scale(edits, zone, ld, gen_bus, chgtype, val, which)
+    if which != "DISPATCHABLE" and zone.any():
+        for column in ("PD", "QD") if pq else ("PD",):
+            edits.get("bus", column)[:, zone] *= scale[:, None]
+    if which != "FIXED" and ld.any():
+        factors = np.where(ld, scale[:, None], 1.0)
+        for column in ("PG", "PMIN", "QG", "QMIN", "QMAX") if pq else ("PG", "PMIN"):
+            edits.get("gen", column)[:] *= factors
+        if col < 0 and "gencost" in case.attributes:
+            table = edits.table("gencost")
+            ng = len(case.gen)
+            if pq and table.shape[1] == 2 * ng:
+                ld = np.hstack([ld, ld])
+            elif table.shape[1] != ng:
+                ld = np.hstack([ld, np.zeros((len(ld), table.shape[1] - ng), bool)])
+            alpha = np.broadcast_to(scale[:, None], ld.shape)[ld]
+            table[ld] = modcost(modcost(table[ld], alpha, "SCALE_F"), alpha, "SCALE_X")
+
+
+def _load_profile_scale(edits, zone, ld, gen_bus, chgtype, val, which):
+    """Scale factor of a load change in every scenario, as `_load_change_scale`."""
+    if chgtype == PR_REL:
+        return np.asarray(val, dtype=float)
+
+    pd_ = edits.peek("bus", "PD")
+    pmin = edits.peek("gen", "PMIN")
+    dmd = np.asarray(val, dtype=float)
+    if chgtype == PR_ADD:
+        on = edits.case.bus["BUS_TYPE"].to_numpy() != BUS_TYPES["NONE"]
+        ld_on = ld & on[gen_bus]
+        pg = edits.peek("gen", "PG")
+        dmd = dmd + pd_[:, zone & on].sum(1) - np.where(ld_on, pg, 0).sum(1)
+    fixed = pd_[:, zone].sum(1)
+    dispatchable = -np.where(ld, pmin, 0).sum(1)
+    if which == "BOTH":
+        base, other = fixed + dispatchable, np.zeros_like(fixed)
+    elif which == "FIXED":
+        base, other = fixed, dispatchable
+    else:
+        base, other = dispatchable, fixed
+    if ((base == 0) & (dmd != other)).any():
+        raise ValueError(
+            f"Impossible to make zone load equal the profile by scaling non-existent"
+            f" {which.lower()} load."
+        )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(base != 0, (dmd - other) / base, 1.0)
+
+
+def _apply_xgd_profile(edits, profile, values):
+    """Apply an 'xGenData' profile given (n_scenarios, n) values."""
+    field = profile.table
+    df = edits.frame("xgd")
+    if field not in df.columns:
+        if profile.chgtype != PR_REP or profile.rows[0] != 0:
+            raise ValueError(
+                f"xgd field '{field}' is missing, only PR_REP of all rows is possible."
+            )
+        n_rows = len(edits.case.gen)
+        edits.columns.setdefault("xgd", {})[field] = np.empty(
+            (edits.n_scenarios, n_rows)
+        )
+    array = edits.get("xgd", field)
+    rows = _profile_rows(profile, array.shape[1], "xgd")
+    if not isinstance(rows, slice) and len(np.unique(rows)) != len(rows):
+        raise ValueError("Profile rows of xGenData profiles must be unique.")
+    _modify(array, rows, profile.chgtype, values)
+
+
+class ExpandedProfiles:
+    """
+    Profiles applied to a base case and xGenData across time periods and scenarios.
+
+    Modified columns are stored as dense arrays in a CaseBatch with one scenario per
+    (t, j) pair, t-major, so scenario s = t * nj + j. Arrays are returned with shape
+    (nt, nj, n_rows).
+    """
+
+    def __init__(self, batch, nt, nj, xgd=None, xgd_values=None):
+        """
+        Initialize from expanded arrays, see `expand_profiles`.
+
+
+        Args:
+            batch (CaseBatch):
+                Batch of nt * nj scenarios.
+            nt (int):
+                Number of time periods.
+            nj (int):
+                Number of scenarios.
+            xgd (xGenDataTableFrames | None):
+                Base xGenData.
+            xgd_values (dict | None):
+                Modified xGenData fields as {field: (nt * nj, ng) array}.
+        """
+        self.batch = batch
+        self.nt = nt
+        self.nj = nj
+        self.xgd = xgd
+        self._xgd_values = xgd_values or {}
+
+    @property
+    def varying(self):
+        """dict: Modified columns, as {attribute: [columns]}, including 'xgd'."""
+        varying = self.batch.varying
+        if self._xgd_values:
+            varying["xgd"] = list(self._xgd_values)
+        return varying
+
+    def get(self, attribute, column):
+        """
+        Get the values of a case column in every period and scenario.
+
+
+        Args:
+            attribute (str):
+                Table name, e.g. 'bus'.
+            column (str):
+                Column name, e.g. 'PD'.
+
+
+        Returns:
+            np.ndarray: Values of shape (nt, nj, n_rows). Unmodified columns are
+                returned as a read-only broadcast view.
+        """
+        values = self.batch.get(attribute, column)
+        return values.reshape(self.nt, self.nj, values.shape[1])
+
+    def get_xgd(self, field):
+        """
+        Get the values of an xGenData field in every period and scenario.
+
+
+        Args:
+            field (str):
+                Field name, e.g. 'CommitKey'.
+
+
+        Returns:
+            np.ndarray: Values of shape (nt, nj, ng).
+        """
+        if field in self._xgd_values:
+            values = self._xgd_values[field]
+        elif self.xgd is not None and field in self.xgd.df.columns:
+            values = self.xgd.df[field].to_numpy()
+            values = np.broadcast_to(values, (self.nt * self.nj, len(values)))
+        else:
+            raise KeyError(f"xgd field '{field}' not found.")
+        return values.reshape(self.nt, self.nj, values.shape[1])
+
+    def case(self, t, j=0, copy=False):
+        """
+        Materialize the case of one period and scenario, see `CaseBatch.scenario`.
+
+
+        Args:
+            t (int):
+                Time period position.
+            j (int):
+                Scenario position. Defaults to 0.
+            copy (bool):
+                Whether to copy modified columns, allowing in-place edits.
+
+
+        Returns:
+            CaseFrames: Case of period t and scenario j.
+        """
+        t = range(self.nt)[t]
+        j = range(self.nj)[j]
+        return self.batch.scenario(t * self.nj + j, copy=copy)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(nt={self.nt}, nj={self.nj})"
+
+
+def expand_profiles(case, profiles, nt=None, nj=None, xgd=None):
+    """
+    Apply 'mpcData' and 'xGenData' profiles to a base case and xGenData.
+
+    Equivalent to applying, for each period and scenario, the changes built by MOST
+    `loadmd` and `apply_profile`, but vectorized across periods and scenarios
+    without building a case per period. 'StorageData' and 'ContingencyData'
+    profiles are only supported by MOST, see `profiles_to_most`.
+
+
+    Args:
+        case (CaseFrames):
+            Base case, not changed.
+        profiles (Profile | dict | list):
+            Profiles, applied in order.
+        nt (int | None):
+            Number of time periods. Defaults to the longest profile.
+        nj (int | None):
+            Number of scenarios. Defaults to the largest profile.
+        xgd (xGenDataTableFrames | None):
+            Base xGenData, required by 'xGenData' profiles.
+
+
+    Returns:
+        ExpandedProfiles: Expanded profiles.
+    """
+    from .batch import CaseBatch
+
+    profiles = load_profiles(profiles)
+    nt, nj = profile_dims(profiles, nt, nj)
+    edits = _ScenarioEdits(case, nt * nj, xgd=xgd)
+    for profile in profiles:
+        values = profile.expand(nt, nj).reshape(nt * nj, -1)
+        if profile.type == "mpcData":
+            _apply_mpc_profile(edits, profile, values)
+        elif profile.type == "xGenData":
+            _apply_xgd_profile(edits, profile, values)
+        else:
+            raise ValueError(
+                f"{profile.type} profiles are not supported by expand_profiles."
+            )
+
+    batch = CaseBatch(case, n_scenarios=nt * nj)
+    xgd_values = {}
+    for attribute, column, values in edits.items():
+        if attribute == "xgd":
+            xgd_values[column] = values
+        else:
+            batch.set(attribute, column, values)
+    return ExpandedProfiles(batch, nt, nj, xgd=xgd, xgd_values=xgd_values)
@@ -0,0 +1,183 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+try:
+    from multiprocessing import shared_memory
+except ImportError as e:  # Python 3.7
+    raise ImportError("Shared memory support requires Python 3.8 or later.") from e
+
+# byte alignment of every column in the shared block
+ALIGNMENT = 64
+
+
+def _is_shareable(df):
+    """Whether every column of a table has a fixed-size numeric dtype."""
+    return isinstance(df, pd.DataFrame) and all(
+        dtype.kind in "biufc" for dtype in df.dtypes
+    )
+
+
+def _attach(name):
+    """Attach to an existing block, leaving its cleanup to the owner."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # before Python 3.13, attaching registers the block with the resource tracker,
+    # which is shared with the owner by processes it starts, so it is a no-op there
+    return shared_memory.SharedMemory(name=name)
+
+
+class SharedCaseDescriptor:
+    """
+    Small picklable description of a CaseFrames held in shared memory.
+
+    Send it to worker processes instead of the case and call `attach` there.
+    """
+
+    def __init__(self, name, layout, skeleton):
+        """
+        Initialize the descriptor, see `SharedCaseFrames`.
+
+
+        Args:
+            name (str):
+                Name of the shared memory block.
+            layout (list):
+                (attribute, index, [(column, dtype, offset)]) of each shared table.
+            skeleton (CaseFrames):
+                Case without the shared tables.
+        """
+        self.name = name
+        self.layout = layout
+        self.skeleton = skeleton
+
+    def attach(self):
+        """
+        Rebuild the case over the shared buffers, without copying table data.
+
+        Shared columns are read-only: writing into them raises an error, while
+        copies of the case (`CaseFrames.copy`) can be modified freely.
+
+
+        Returns:
+            CaseFrames: Frozen case, see `CaseFrames.freeze`. The shared memory
+                stays attached as long as the case or its copies are referenced.
+        """
+        shm = _attach(self.name)
+        case = self.skeleton.copy()
+        for attribute, index, columns in self.layout:
+            data = {}
+            for column, dtype, offset in columns:
+                values = np.ndarray(
+                    len(index), dtype=np.dtype(dtype), buffer=shm.buf, offset=offset
+                )
+                values.flags.writeable = False
+                data[column] = values
+            object.__setattr__(
+                case, attribute, pd.DataFrame(data, index=index, copy=False)
+            )
+        object.__setattr__(case, "_shared_memory", shm)
+        return case.freeze()
+
+    def __repr__(self):
+        tables = ", ".join(attribute for attribute, _, _ in self.layout)
+        return f"{self.__class__.__name__}(name={self.name!r}, tables=[{tables}])"
+
+
+class SharedCaseFrames:
+    """
+    Owner of a shared memory block holding the numeric tables of a CaseFrames.
+
+    Worker processes receive the small `descriptor` and rebuild a read-only case
+    over the shared buffers with `descriptor.attach()`. The owner controls the
+    lifetime of the block: call `close` (or use it as a context manager) once the
+    workers are done, which unlinks the block.
+
+    Example:
+        >>> with SharedCaseFrames(cf) as shared:
+        ...     with ProcessPoolExecutor(
+        ...         initializer=init, initargs=(shared.descriptor,)
+        ...     ) as executor:
+        ...         ...
+    """
+
+    def __init__(self, case):
+        """
+        Copy the numeric tables of a case into a new shared memory block.
+
+        Tables with non-numeric columns and other attributes are kept in the
+        descriptor and pickled with it.
+
+
+        Args:
+            case (CaseFrames):
+                Case to share, not changed.
+        """
+        layout = []
+        arrays = []
+        size = 0
+        for attribute in case.attributes:
+            df = getattr(case, attribute)
+            if not _is_shareable(df):
+                continue
+            columns = []
+            for column in df.columns:
+                values = np.ascontiguousarray(df[column].to_numpy())
+                size = -(-size // ALIGNMENT) * ALIGNMENT
+                columns.append((column, values.dtype.str, size))
+                arrays.append((size, values))
+                size += values.nbytes
+            layout.append((attribute, df.index, columns))
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for offset, values in arrays:
+            view = np.ndarray(
+                values.shape, dtype=values.dtype, buffer=self._shm.buf, offset=offset
+            )
+            view[:] = values
+            del view
+
+        skeleton = case.copy()
+        for attribute, _, _ in layout:
+            object.__setattr__(skeleton, attribute, None)
+        if "_cache" in skeleton.__dict__:
+            object.__setattr__(skeleton, "_cache", {})
+        self.descriptor = SharedCaseDescriptor(self._shm.name, layout, skeleton)
+
+    @property
+    def name(self):
+        """str: Name of the shared memory block."""
+        return self.descriptor.name
+
+    @property
+    def size(self):
+        """int: Size of the shared memory block in bytes."""
+        return self._shm.size
+
+    def attach(self):
+        """Rebuild the shared case in this process, see `SharedCaseDescriptor`."""
+        return self.descriptor.attach()
+
+    def close(self):
+        """
+        Release and unlink the shared memory block.
+
+        Cases attached in this process must not be used afterwards; workers that
+        are still attached keep their mapping until they release it.
+        """
+        if self._shm is None:
+            return
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        state = "closed" if self._shm is None else f"{self.size} bytes"
+        return f"{self.__class__.__name__}(name={self.name!r}, {state})"
@@ -0,0 +1,251 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .utils import index_positions, lazy_copy
+
+# bus columns of the tables whose rows follow the buses
+BUS_COLUMNS = {
+    "bus": ["BUS_I"],
+    "branch": ["F_BUS", "T_BUS"],
+    "gen": ["GEN_BUS"],
+    "dcline": ["F_BUS", "T_BUS"],
+}
+# cost tables and the table their rows follow
+COST_TABLES = {"gencost": "gen", "dclinecost": "dcline"}
+# name indexes of the tables
+NAME_ATTRIBUTES = {"bus": "bus_name", "branch": "branch_name", "gen": "gen_name"}
+
+Extraction = namedtuple("Extraction", ["case", "ties", "bus_map"])
+Extraction.__doc__ = """
+Result of `extract`: the subnetwork case, the boundary tie-lines as a dict of
+'branch' (and 'dcline') rows of the source case with one end inside, and the
+bus_map Series from source to subnetwork bus numbers.
+"""
+
+
+def _has_table(case, attribute):
+    return attribute in case.attributes and isinstance(
+        getattr(case, attribute), pd.DataFrame
+    )
+
+
+def bus_mask(case, buses):
+    """
+    Boolean mask over the bus rows of a case.
+
+
+    Args:
+        case (CaseFrames):
+            Case with a bus table.
+        buses (array_like | pd.Series):
+            Boolean mask over the bus rows (a boolean Series is aligned on the bus
+            index), or bus numbers (BUS_I).
+
+
+    Returns:
+        np.ndarray: Mask of the selected bus rows.
+
+
+    Raises:
+        ValueError: If a mask has the wrong length or a bus number is not found.
+    """
+    bus = case.bus
+    if isinstance(buses, pd.Series) and buses.dtype == bool:
+        return buses.reindex(bus.index, fill_value=False).to_numpy()
+    buses = np.asarray(buses)
+    if buses.dtype == bool:
+        if buses.shape != (len(bus),):
+            raise ValueError(
+                f"Bus mask has {buses.size} values for {len(bus)} bus rows."
+            )
+        return buses
+    mask = np.zeros(len(bus), dtype=bool)
+    bus_numbers = pd.Index(bus["BUS_I"].to_numpy())
+    mask[index_positions(bus_numbers, np.atleast_1d(buses), "buses")] = True
+    return mask
+
+
+def row_masks(case, mask):
+    """
+    Rows of each table with all their buses in a bus mask, and boundary rows with
+    only some of them.
+
+
+    Args:
+        case (CaseFrames):
+            Case, not changed.
+        mask (np.ndarray):
+            Mask over the bus rows, see `bus_mask`.
+
+
+    Returns:
+        tuple: Dicts of row masks by attribute, (inside, boundary), inside over
+            bus, branch, gen, and dcline when present, boundary over branch and
+            dcline.
+
+
+    Raises:
+        ValueError: If a table references a missing bus.
+    """
+    bus_numbers = pd.Index(case.bus["BUS_I"].to_numpy())
+    inside, boundary = {"bus": mask}, {}
+    for attribute, columns in BUS_COLUMNS.items():
+        if attribute == "bus" or not _has_table(case, attribute):
+            continue
+        df = getattr(case, attribute)
+        ends = np.column_stack(
+            [
+                mask[index_positions(bus_numbers, df[c].to_numpy(), attribute)]
+                for c in columns
+            ]
+        )
+        inside[attribute] = ends.all(axis=1)
+        if len(columns) > 1:
+            boundary[attribute] = ends.any(axis=1) & ~inside[attribute]
+    return inside, boundary
+
+
+def cost_rows(costs, n_rows, mask, attribute="gencost"):
+    """
+    Rows of a cost table following a mask over the rows of its table, with the
+    reactive cost rows (if any) after the active ones.
+
+
+    Args:
+        costs (pd.DataFrame):
+            Cost table.
+        n_rows (int):
+            Number of rows of the table it follows.
+        mask (np.ndarray):
+            Mask over the rows of the table it follows.
+        attribute (str):
+            Name of the cost table, used in the error message.
+
+
+    Returns:
+        np.ndarray: Mask over the cost rows.
+
+
+    Raises:
+        ValueError: If the cost table does not have n_rows or 2 * n_rows rows.
+    """
+    if len(costs) == n_rows:
+        return mask
+    if len(costs) == 2 * n_rows:
+        return np.r_[mask, mask]
+    raise ValueError(
+        f"'{attribute}' has {len(costs)} rows, expected {n_rows} or {2 * n_rows}."
+    )
+
+
+def renumber_buses(case, bus_map):
+    """
+    Replace bus numbers in the bus columns of a case, in place.
+
+    If the bus table is indexed by its bus numbers, its index is replaced too.
+
+
+    Args:
+        case (CaseFrames):
+            Case to modify.
+        bus_map (pd.Series):
+            New bus numbers, indexed by the current ones, covering every
+            referenced bus.
+    """
+    old = pd.Index(bus_map.index)
+    new = bus_map.to_numpy()
+    by_number = np.array_equal(case.bus.index.to_numpy(), case.bus["BUS_I"].to_numpy())
+    for attribute, columns in BUS_COLUMNS.items():
+        if not _has_table(case, attribute):
+            continue
+        df = getattr(case, attribute)
+        for column in columns:
+            positions = index_positions(old, df[column].to_numpy(), attribute)
+            df[column] = new[positions].astype(df[column].dtype)
+    if by_number:
+        case.bus.index = pd.Index(
+            case.bus["BUS_I"].to_numpy().astype(int), name=case.bus.index.name
+        )
+
+
+def _extract_reserves(reserves, gen_mask):
+    """Reserves of the kept generators, dropping zones left without any."""
+    reserves = reserves.copy()
+    zones = reserves.zones.iloc[:, gen_mask]
+    keep = (zones.to_numpy() != 0).any(axis=1)
+    reserves.set_attribute("zones", zones.iloc[keep])
+    if "req" in reserves.attributes:
+        reserves.set_attribute("req", reserves.req.iloc[keep])
+    for attribute in ("cost", "qty"):
+        if attribute in reserves.attributes:
+            df = getattr(reserves, attribute)
+            reserves.set_attribute(attribute, df[df.index.isin(zones.columns)])
+    return reserves
+
+
+def extract(case, buses, renumber=False):
+    """
+    Extract the subnetwork of a set of buses.
+
+    Every dependent table is filtered with vectorized masks: branches and DC lines
+    with both ends kept, generators on kept buses, their cost rows (including
+    reactive cost rows), the name indexes, and the generator columns of
+    reserves.zones, dropping zones left without generators. Row labels are kept,
+    so the tables stay aligned with the source case. Other attributes are copied
+    unchanged.
+
+
+    Args:
+        case (CaseFrames):
+            Source case, not changed.
+        buses (array_like | pd.Series):
+            Boolean mask over the bus rows, or bus numbers (BUS_I), see `bus_mask`.
+        renumber (bool):
+            Whether to renumber the kept buses compactly, from 1 (or from 0 if the
+            source buses are numbered from 0 like after `reset_index`), in row
+            order.
+
+
+    Returns:
+        Extraction: Subnetwork case, boundary tie-lines, and bus map.
+
+
+    Raises:
+        ValueError: If a table references a missing bus, or a cost table does not
+            have one (or two) rows per row of its table.
+    """
+    mask = bus_mask(case, buses)
+    inside, boundary = row_masks(case, mask)
+
+    sub = case.copy()
+    sub.cache_clear()
+    for attribute, rows in inside.items():
+        sub.set_attribute(attribute, lazy_copy(getattr(case, attribute).iloc[rows]))
+        name = NAME_ATTRIBUTES.get(attribute)
+        if name in case.attributes:
+            sub.set_attribute(name, getattr(case, name)[rows])
+    for attribute, owner in COST_TABLES.items():
+        if _has_table(case, attribute) and owner in inside:
+            costs = getattr(case, attribute)
+            rows = cost_rows(costs, len(inside[owner]), inside[owner], attribute)
+            sub.set_attribute(attribute, lazy_copy(costs.iloc[rows]))
+    if "reserves" in case.attributes and "gen" in inside:
+        sub.set_attribute("reserves", _extract_reserves(case.reserves, inside["gen"]))
+
+    numbers = case.bus["BUS_I"].to_numpy()
+    kept = numbers[mask]
+    if renumber:
+        start = 0 if np.array_equal(numbers, np.arange(len(numbers))) else 1
+        new = np.arange(start, start + len(kept))
+    else:
+        new = kept
+    bus_map = pd.Series(
+        new, index=pd.Index(kept, name="BUS_I"), name="BUS_I", dtype=kept.dtype
+    )
+    if renumber:
+        renumber_buses(sub, bus_map)
+
+    ties = {a: getattr(case, a).iloc[rows] for a, rows in boundary.items()}
+    return Extraction(sub, ties, bus_map)
@@ -1,7 +1,13 @@
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal, assert_index_equal
 
-from .core import DataFramesStruct
+from .core import BaseStruct
+from .utils import data_token
+
+# columns of the mismatch summary and of the listed offending cells
+MISMATCH_COLUMNS = ["attribute", "column", "count", "max_abs_diff"]
+CELL_COLUMNS = ["attribute", "index", "column", "left", "right"]
 
 
 def assert_attributes_equal(struct1, struct2):
@@ -62,8 +68,8 @@ def assert_frames_struct_equal(struct1, struct2):
                         f"Index '{attribute}' mismatch:\n{str(e)}"
                     ) from e
 
-            elif isinstance(value1, DataFramesStruct):
-                # recursive for DataFramesStruct objects, for example ReservesFrames
+            elif isinstance(value1, BaseStruct):
+                # recursive for nested structs, for example ReservesFrames
                 try:
                     assert_frames_struct_equal(value1, value2)
                 except AssertionError as e:
@@ -86,3 +92,310 @@ def assert_frames_struct_equal(struct1, struct2):
         except Exception as e:
             print(f"  ✗ Error comparing attribute '{attribute}': {e}")
             raise
+
+
+class CaseComparison:
+    """
+    Result of `compare_cases`.
+
+    Mismatching columns are counted in `mismatches`, with the largest absolute
+    difference of numeric columns. Only the first offending cells are kept, in
+    `cells`, so large cases give short reports. Differences of structure
+    (attributes, columns, rows, dtypes) and of other values are listed in
+    `messages`.
+    """
+
+    def __init__(self, mismatches, cells, messages):
+        """
+        Initialize the result, see `compare_cases`.
+
+
+        Args:
+            mismatches (pd.DataFrame):
+                Mismatch counts per column, with MISMATCH_COLUMNS.
+            cells (pd.DataFrame):
+                First offending cells, with CELL_COLUMNS.
+            messages (list):
+                Descriptions of the other differences.
+        """
+        self.mismatches = mismatches
+        self.cells = cells
+        self.messages = messages
+
+    @property
+    def equal(self):
+        """bool: Whether the cases are equal within the tolerances."""
+        return self.mismatches.empty and not self.messages
+
+    def __bool__(self):
+        return self.equal
+
+    def report(self):
+        """
+        Describe the differences.
+
+
+        Returns:
+            str: Multi-line report, of bounded length.
+        """
+        if self.equal:
+            return "Cases are equal."
+        lines = [f"  {message}" for message in self.messages]
+        if not self.mismatches.empty:
+            total = self.mismatches["count"].sum()
+            lines.append(f"  {total} cells differ:")
+            lines.append(self.mismatches.to_string(index=False))
+            lines.append(f"  first {len(self.cells)} cells:")
+            lines.append(self.cells.to_string(index=False))
+        return "Cases differ:\n" + "\n".join(lines)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(equal={self.equal},"
+            f" cells={int(self.mismatches['count'].sum())},"
+            f" messages={len(self.messages)})"
+        )
+
+
+def _tables(struct, prefix=""):
+    """Flatten the attributes of a struct, naming nested ones like 'reserves.zones'."""
+    values = {}
+    for attribute in struct.attributes:
+        value = getattr(struct, attribute)
+        if isinstance(value, BaseStruct):
+            values.update(_tables(value, f"{prefix}{attribute}."))
+        else:
+            values[f"{prefix}{attribute}"] = value
+    return values
+
+
+def _digests(struct):
+    """Cached table digests of a CaseFrames, hashing int and float alike."""
+    if not hasattr(struct, "table_digests"):
+        return {}
+    return struct.table_digests(normalize_dtypes=True, ignore_results=False, index=True)
+
+
+def _not_close(left, right, rtol, atol):
+    """Mask of cells differing beyond the tolerances, NaNs being equal."""
+    if left.dtype.kind in "biufc" and right.dtype.kind in "biufc":
+        if left.dtype.kind == "c" or right.dtype.kind == "c":
+            return ~np.isclose(left, right, rtol, atol, equal_nan=True)
+        left = left.astype(float, copy=False)
+        right = right.astype(float, copy=False)
+        return ~np.isclose(left, right, rtol, atol, equal_nan=True)
+    left = np.asarray(left, dtype=object)
+    right = np.asarray(right, dtype=object)
+    return ~((left == right) | (pd.isna(left) & pd.isna(right)))
+
+
+def _align(name, left, right, check_index, messages):
+    """Row positions of left and right to compare, noting unmatched rows."""
+    if left.index.equals(right.index) or (not check_index and len(left) == len(right)):
+        return slice(None), slice(None), left.index
+    if not check_index:
+        messages.append(f"{name}: {len(left)} rows != {len(right)} rows")
+        n = min(len(left), len(right))
+        return slice(0, n), slice(0, n), left.index[:n]
+    common = left.index.intersection(right.index, sort=False)
+    if not (left.index.is_unique and right.index.is_unique):
+        messages.append(f"{name}: index has duplicate labels")
+        return None
+    only_left = len(left) - len(common)
+    only_right = len(right) - len(common)
+    if only_left or only_right:
+        messages.append(
+            f"{name}: {only_left} rows only in left, {only_right} rows only in right"
+        )
+    elif not left.index.equals(common):
+        messages.append(f"{name}: rows are in a different order")
+    return left.index.get_indexer(common), right.index.get_indexer(common), common
+
+
+def _compare_table(name, left, right, tolerances, options, results):
+    """Compare two tables column by column, adding to the results."""
+    rtol, atol = tolerances
+    check_dtype, check_index, max_cells = options
+    mismatches, cells, messages = results
+    only_left = [c for c in left.columns if c not in right.columns]
+    only_right = [c for c in right.columns if c not in left.columns]
+    if only_left or only_right:
+        messages.append(
+            f"{name}: columns only in left {only_left}, only in right {only_right}"
+        )
+    aligned = _align(name, left, right, check_index, messages)
+    if aligned is None:
+        return
+    left_rows, right_rows, labels = aligned
+
+    # columns sharing their data, e.g. with copy-on-write copies, are equal
+    shared = set()
+    if isinstance(left_rows, slice) and left_rows == right_rows == slice(None):
+        pointers = dict(zip(left.columns, data_token(left)[2]))
+        shared = {
+            column
+            for column, pointer in zip(right.columns, data_token(right)[2])
+            if pointers.get(column) == pointer
+        }
+    for column in left.columns:
+        if column in only_left or column in shared:
+            continue
+        if check_dtype and left[column].dtype != right[column].dtype:
+            messages.append(
+                f"{name}.{column}: dtype {left[column].dtype} != {right[column].dtype}"
+            )
+        old = left[column].to_numpy()[left_rows]
+        new = right[column].to_numpy()[right_rows]
+        changed = np.flatnonzero(_not_close(old, new, rtol, atol))
+        if len(changed) == 0:
+            continue
+        max_abs_diff = np.nan
+        if old.dtype.kind in "biuf" and new.dtype.kind in "biuf":
+            diff = np.abs(old[changed].astype(float) - new[changed].astype(float))
+            max_abs_diff = np.nanmax(diff) if not np.isnan(diff).all() else np.nan
+        mismatches.append((name, column, len(changed), max_abs_diff))
+        n = max_cells - sum(len(piece[1]) for piece in cells)
+        if n > 0:
+            changed = changed[:n]
+            cells.append((name, labels[changed], column, old[changed], new[changed]))
+
+
+def _compare_value(name, left, right, rtol, atol, messages):
+    if isinstance(left, pd.Index) and isinstance(right, pd.Index):
+        if not left.equals(right):
+            messages.append(f"{name}: index values differ")
+        return
+    try:
+        equal = bool(np.all(np.isclose(left, right, rtol, atol, equal_nan=True)))
+    except (TypeError, ValueError):
+        try:
+            equal = bool(np.all(left == right))
+        except (TypeError, ValueError):
+            equal = False
+    if not equal:
+        messages.append(f"{name}: {left!r} != {right!r}")
+
+
+def _cell_table(cells):
+    if not cells:
+        return pd.DataFrame({column: [] for column in CELL_COLUMNS})
+    sizes = [len(piece[1]) for piece in cells]
+    return pd.DataFrame(
+        {
+            "attribute": np.repeat([piece[0] for piece in cells], sizes),
+            "index": np.concatenate([np.asarray(p[1], dtype=object) for p in cells]),
+            "column": np.repeat([piece[2] for piece in cells], sizes),
+            "left": np.concatenate([np.asarray(p[3], dtype=object) for p in cells]),
+            "right": np.concatenate([np.asarray(p[4], dtype=object) for p in cells]),
+        }
+    )
+
+
+def compare_cases(
+    left,
+    right,
+    rtol=1e-5,
+    atol=1e-8,
+    check_dtype=False,
+    check_index=True,
+    max_cells=10,
+    use_hash=True,
+):
+    """
+    Compare two cases within tolerances, without stopping at the first mismatch.
+
+    Numeric values are compared with `np.isclose` and NaNs are equal. Integer and
+    float columns of close values are equal unless check_dtype. Tables sharing
+    their data, e.g. copy-on-write copies, are skipped without reading it, and with
+    use_hash so are tables of equal digests (see `CaseFrames.table_digests`, cached
+    per case), so comparing many cases against one reference case is cheap.
+
+
+    Args:
+        left (BaseStruct):
+            First case, e.g. a CaseFrames.
+        right (BaseStruct):
+            Second case.
+        rtol (float):
+            Relative tolerance.
+        atol (float):
+            Absolute tolerance.
+        check_dtype (bool):
+            Whether to report columns whose dtypes differ.
+        check_index (bool):
+            Whether to align rows by index label. Otherwise rows are aligned by
+            position and index labels are ignored.
+        max_cells (int):
+            Number of offending cells to list.
+        use_hash (bool):
+            Whether to skip tables of equal digests.
+
+
+    Returns:
+        CaseComparison: Mismatch summary.
+    """
+    left_values = _tables(left)
+    right_values = _tables(right)
+    messages = []
+    only_left = [name for name in left_values if name not in right_values]
+    only_right = [name for name in right_values if name not in left_values]
+    if only_left or only_right:
+        messages.append(
+            f"attributes only in left {only_left}, only in right {only_right}"
+        )
+    left_digests = right_digests = {}
+    if use_hash:
+        left_digests, right_digests = _digests(left), _digests(right)
+
+    mismatches, cells = [], []
+    for name, value in left_values.items():
+        if name not in right_values:
+            continue
+        other = right_values[name]
+        if not (isinstance(value, pd.DataFrame) and isinstance(other, pd.DataFrame)):
+            _compare_value(name, value, other, rtol, atol, messages)
+            continue
+        if value is other or (
+            name in left_digests
+            and left_digests[name] == right_digests.get(name)
+            and (not check_dtype or value.dtypes.equals(other.dtypes))
+        ):
+            continue
+        _compare_table(
+            name,
+            value,
+            other,
+            (rtol, atol),
+            (check_dtype, check_index, max_cells),
+            (mismatches, cells, messages),
+        )
+    return CaseComparison(
+        pd.DataFrame(mismatches, columns=MISMATCH_COLUMNS),
+        _cell_table(cells),
+        messages,
+    )
+
+
+def assert_cases_close(left, right, **kwargs):
+    """
+    Assert that two cases are equal within tolerances, see `compare_cases`.
+
+    The error message lists mismatch counts and the first offending cells, never
+    whole tables.
+
+
+    Args:
+        left (BaseStruct):
+            First case.
+        right (BaseStruct):
+            Second case.
+        **kwargs:
+            Passed to `compare_cases`.
+
+
+    Raises:
+        AssertionError: If the cases differ.
+    """
+    comparison = compare_cases(left, right, **kwargs)
+    if not comparison.equal:
+        raise AssertionError(comparison.report())
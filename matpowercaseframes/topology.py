@@ -0,0 +1,249 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import scipy.sparse as sp
+    from scipy.sparse import csgraph
+except ImportError as e:
+    raise ImportError(
+        "scipy is required for network topology. "
+        "Install it with `pip install matpowercaseframes[scipy]`."
+    ) from e
+
+# columns used to build the topology, dcline only if present
+TOPOLOGY_INPUTS = {
+    "bus": ["BUS_I"],
+    "branch": ["F_BUS", "T_BUS", "BR_STATUS"],
+    "dcline": ["F_BUS", "T_BUS", "BR_STATUS"],
+}
+
+
+def _edges(case, attribute, index):
+    """Bus positions of the in-service ends of a table, and their row positions."""
+    df = getattr(case, attribute)
+    on = np.flatnonzero(df["BR_STATUS"].to_numpy() > 0)
+    f = index.get_indexer(df["F_BUS"].to_numpy()[on])
+    t = index.get_indexer(df["T_BUS"].to_numpy()[on])
+    if (f < 0).any() or (t < 0).any():
+        raise ValueError(f"'{attribute}' references buses not found in BUS_I.")
+    return f, t, on
+
+
+class Topology:
+    """
+    Bus graph of the in-service branches (and DC lines) of a case.
+
+    The graph is kept as a symmetric sparse adjacency matrix in CSR layout, whose
+    values count parallel connections. Islands, bridges, radial branches, and
+    neighbourhoods are computed from it with SciPy's sparse graph routines, once
+    per topology, see `CaseFrames.topology`.
+    """
+
+    def __init__(self, case, dcline=True):
+        """
+        Build the topology of a case.
+
+
+        Args:
+            case (CaseFrames):
+                Case with bus and branch tables.
+            dcline (bool):
+                Whether in-service DC lines connect their buses.
+
+
+        Raises:
+            ValueError: If a branch or DC line references a missing bus.
+        """
+        self.bus_numbers = pd.Index(case.bus["BUS_I"].to_numpy())
+        self.n_bus = len(self.bus_numbers)
+        self.n_rows = {"branch": len(case.branch)}
+        self._edges = {"branch": _edges(case, "branch", self.bus_numbers)}
+        if dcline and "dcline" in case.attributes:
+            self.n_rows["dcline"] = len(case.dcline)
+            self._edges["dcline"] = _edges(case, "dcline", self.bus_numbers)
+        f = np.concatenate([f for f, _, _ in self._edges.values()])
+        t = np.concatenate([t for _, t, _ in self._edges.values()])
+        self.loop = f == t
+        self.f, self.t = f, t
+
+        # undirected edges without self loops, stored in both directions
+        f, t = f[~self.loop], t[~self.loop]
+        data = np.ones(2 * len(f), dtype=np.int64)
+        self.adjacency = sp.csr_matrix(
+            (data, (np.r_[f, t], np.r_[t, f])), shape=(self.n_bus, self.n_bus)
+        )
+        self.adjacency.sum_duplicates()
+        self._components = csgraph.connected_components(self.adjacency, directed=False)
+        self._bridge_keys = None
+
+    def _rows(self, attribute, edge_mask):
+        """Row mask of a table from a mask over the concatenated edges."""
+        if attribute not in self.n_rows:
+            raise ValueError(f"'{attribute}' is not part of the topology.")
+        start = 0
+        for name, (f, _, _) in self._edges.items():
+            if name == attribute:
+                break
+            start += len(f)
+        on = self._edges[attribute][2]
+        mask = np.zeros(self.n_rows[attribute], dtype=bool)
+        mask[on] = edge_mask[start : start + len(on)]
+        return mask
+
+    @property
+    def n_islands(self):
+        """int: Number of islands, counting isolated buses."""
+        return int(self._components[0])
+
+    @property
+    def labels(self):
+        """np.ndarray: Island of each bus (0-based), in bus row order."""
+        return self._components[1]
+
+    def island_sizes(self):
+        """
+        Count the buses of each island.
+
+
+        Returns:
+            np.ndarray: Number of buses, indexed by island label.
+        """
+        return np.bincount(self.labels, minlength=self.n_islands)
+
+    def degree(self):
+        """
+        Count the in-service connections of each bus, without self loops.
+
+
+        Returns:
+            np.ndarray: Degree of each bus, in bus row order.
+        """
+        return np.asarray(self.adjacency.sum(axis=1)).ravel()
+
+    def radial_branches(self, attribute="branch"):
+        """
+        Find in-service rows connecting a bus with no other in-service connection,
+        whose outage isolates that bus.
+
+
+        Args:
+            attribute (str):
+                'branch' or 'dcline'.
+
+
+        Returns:
+            np.ndarray: Boolean mask over the rows.
+        """
+        degree = self.degree()
+        radial = ((degree[self.f] == 1) | (degree[self.t] == 1)) & ~self.loop
+        return self._rows(attribute, radial)
+
+    def _bridge_pairs(self):
+        """Keys (lower * n_bus + upper position) of the bus pairs joined by bridges."""
+        if self._bridge_keys is not None:
+            return self._bridge_keys
+        n = self.n_bus
+        coo = sp.triu(self.adjacency, k=1).tocoo()
+        u, w = coo.row.astype(np.int64), coo.col.astype(np.int64)
+
+        # breadth-first spanning tree, from a virtual root joined to each island
+        first = np.unique(self.labels, return_index=True)[1]
+        heads = np.r_[u, first]
+        tails = np.r_[w, np.full(len(first), n)]
+        graph = sp.csr_matrix(
+            (np.ones(len(heads)), (heads, tails)), shape=(n + 1, n + 1)
+        )
+        _, parent = csgraph.breadth_first_order(
+            graph, n, directed=False, return_predecessors=True
+        )
+        depth = csgraph.shortest_path(graph, indices=n, unweighted=True, directed=False)
+        tree = (parent[u] == w) | (parent[w] == u)
+
+        # number the tree in depth-first preorder, so each subtree is an interval
+        nodes = np.arange(n)
+        tree_graph = sp.csr_matrix(
+            (np.ones(n), (parent[nodes], nodes)), shape=(n + 1, n + 1)
+        )
+        order = csgraph.depth_first_order(tree_graph, n, return_predecessors=False)
+        pre = np.empty(n + 1, dtype=np.int64)
+        pre[order] = np.arange(n + 1)
+
+        # lowest and highest preorder number reached from each subtree through
+        # non-tree edges, and subtree sizes, reduced from the deepest level up
+        low, high = pre.copy(), pre.copy()
+        for a, b in ((u[~tree], w[~tree]), (w[~tree], u[~tree])):
+            np.minimum.at(low, a, pre[b])
+            np.maximum.at(high, a, pre[b])
+        size = np.ones(n + 1, dtype=np.int64)
+        by_depth = np.argsort(-depth[:n], kind="stable")
+        levels = np.split(by_depth, np.flatnonzero(np.diff(depth[by_depth])) + 1)
+        for level in levels:
+            np.add.at(size, parent[level], size[level])
+            np.minimum.at(low, parent[level], low[level])
+            np.maximum.at(high, parent[level], high[level])
+
+        # the tree edge above a subtree is a bridge if no other edge leaves it,
+        # and parallel connections are never bridges
+        child = np.where(parent[u] == w, u, w)
+        inside = (low[child] >= pre[child]) & (high[child] < pre[child] + size[child])
+        bridge = tree & inside & (coo.data == 1)
+        self._bridge_keys = np.minimum(u, w)[bridge] * n + np.maximum(u, w)[bridge]
+        return self._bridge_keys
+
+    def bridges(self, attribute="branch"):
+        """
+        Find in-service rows whose outage splits their island in two.
+
+        Parallel connections are never bridges. Uses one breadth-first spanning
+        tree of all islands, numbered in depth-first preorder, and vectorized
+        reductions over its depth levels (Tarjan and Vishkin), deterministic and
+        exact.
+
+
+        Args:
+            attribute (str):
+                'branch' or 'dcline'.
+
+
+        Returns:
+            np.ndarray: Boolean mask over the rows.
+        """
+        keys = np.minimum(self.f, self.t) * self.n_bus + np.maximum(self.f, self.t)
+        return self._rows(attribute, np.isin(keys, self._bridge_pairs()) & ~self.loop)
+
+    def neighbors(self, buses, hops=1):
+        """
+        Find the buses within a number of connections of given buses.
+
+
+        Args:
+            buses (array_like):
+                External bus numbers (BUS_I).
+            hops (int):
+                Number of connections.
+
+
+        Returns:
+            pd.Index: Bus numbers within hops of any of the buses, including them,
+                in bus row order.
+
+
+        Raises:
+            ValueError: If a bus number is not found.
+        """
+        from .utils import index_positions
+
+        reached = np.zeros(self.n_bus, dtype=bool)
+        reached[index_positions(self.bus_numbers, np.atleast_1d(buses), "buses")] = True
+        for _ in range(hops):
+            frontier = self.adjacency @ reached.astype(np.int64) > 0
+            if not (frontier & ~reached).any():
+                break
+            reached |= frontier
+        return self.bus_numbers[reached]
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(buses={self.n_bus},"
+            f" edges={self.adjacency.nnz // 2}, islands={self.n_islands})"
+        )
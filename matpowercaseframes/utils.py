@@ -1,3 +1,10 @@
+import numpy as np
+import pandas as pd
+
+# pandas 3.0 always copies on write, pandas 2 only when enabled
+_PANDAS_3 = int(pd.__version__.split(".")[0]) >= 3
+
+
 def int_else_float_except_string(s):
     try:
         f = float(s.replace(",", "."))
@@ -25,3 +32,174 @@ def has_attr(obj, key):
         return key in obj
     else:
         return hasattr(obj, key)
+
+
+def copy_on_write():
+    """
+    Whether pandas Copy-on-Write is active: always since pandas 3.0, and with older
+    pandas only if enabled with `pd.options.mode.copy_on_write = True`.
+
+
+    Returns:
+        bool: Whether Copy-on-Write is active.
+    """
+    if _PANDAS_3:
+        return True
+    try:
+        return pd.get_option("mode.copy_on_write") is True
+    except KeyError:  # before pandas 1.5
+        return False
+
+
+def lazy_copy(obj):
+    """
+    Copy of a DataFrame or Series that can be written into without changing obj.
+
+    Under Copy-on-Write the copy is shallow, sharing data with obj until either is
+    written into. Otherwise shallow copies would share writes, so it is deep.
+
+
+    Args:
+        obj (pd.DataFrame | pd.Series):
+            Object to copy.
+
+
+    Returns:
+        pd.DataFrame | pd.Series: Independent copy.
+    """
+    return obj.copy(deep=not copy_on_write())
+
+
+def data_token(df, columns=None):
+    """
+    Identify the current data of DataFrame columns without reading the values.
+
+    The token is made of the shape, column names, and data pointers of the columns.
+    Under pandas Copy-on-Write, writing into data that is still referenced elsewhere
+    (for example by a shallow copy kept as snapshot) reallocates it, so the token
+    changes whenever the data changes. Without Copy-on-Write, writes in place keep
+    the pointers, so an equal token only means unchanged data for read-only
+    tables, see `copy_on_write`. Equal pointers always mean equal data.
+
+
+    Args:
+        df (pd.DataFrame):
+            Table to identify.
+        columns (list | None):
+            Columns to include. Missing columns are skipped. Defaults to all columns.
+
+
+    Returns:
+        tuple: Hashable token.
+    """
+    if columns is None:
+        columns = df.columns
+    else:
+        columns = [column for column in columns if column in df.columns]
+    pointers = _column_pointers(df)
+    if pointers is not None and df.columns.is_unique:
+        positions = df.columns.get_indexer(columns)
+        return (len(df), tuple(columns), tuple(pointers[positions].tolist()))
+    pointers = []
+    for column in columns:
+        values = df[column].to_numpy()
+        pointers.append(values.__array_interface__["data"][0])
+    return (len(df), tuple(columns), tuple(pointers))
+
+
+def _column_pointers(df):
+    """
+    Data pointers of all columns, read from the blocks of the DataFrame, which is
+    much faster than selecting each column. None if the internals are unknown.
+    """
+    try:
+        blocks = df._mgr.blocks
+        pointers = np.zeros(df.shape[1], dtype=np.int64)
+        for block in blocks:
+            values = block.values
+            locs = block.mgr_locs.as_array
+            if isinstance(values, np.ndarray) and values.ndim == 2:
+                start = values.__array_interface__["data"][0]
+                pointers[locs] = start + np.arange(len(locs)) * values.strides[0]
+            else:
+                # extension arrays, identified by the object kept by the snapshots
+                pointers[locs] = id(values)
+        return pointers
+    except AttributeError:
+        return None
+
+
+def changed_columns(old, new, columns=None):
+    """
+    Find the columns whose data differ between two versions of a table.
+
+    Columns still pointing to the same data are skipped without reading values,
+    see `data_token`; others are compared by value, so rewriting a column with
+    equal values is not a change. old must not share data written into since, see
+    `lazy_copy`. Columns added or removed are changed, and so are
+    all columns if the index changed.
+
+
+    Args:
+        old (pd.DataFrame):
+            Previous version, e.g. a shallow copy kept as snapshot.
+        new (pd.DataFrame):
+            Current version.
+        columns (list | None):
+            Columns to check. Defaults to the columns of both versions.
+
+
+    Returns:
+        list: Changed columns.
+    """
+    if columns is None:
+        columns = old.columns.union(new.columns, sort=False)
+    same_index = old.index is new.index or old.index.equals(new.index)
+    old_pointers = dict(zip(old.columns, data_token(old)[2]))
+    new_pointers = dict(zip(new.columns, data_token(new)[2]))
+    changed = []
+    for column in columns:
+        if column not in old_pointers or column not in new_pointers:
+            if column in old_pointers or column in new_pointers:
+                changed.append(column)
+            continue
+        if not same_index:
+            changed.append(column)
+            continue
+        if old_pointers[column] == new_pointers[column]:
+            continue
+        if not old[column].equals(new[column]):
+            changed.append(column)
+    return changed
+
+
+def index_positions(index, bus_numbers, attribute="branch"):
+    """
+    Map external bus numbers into 0-based positions of an index of bus numbers.
+
+
+    Args:
+        index (pd.Index):
+            Bus numbers of the bus table, in row order.
+        bus_numbers (array_like):
+            External bus numbers to map.
+        attribute (str):
+            Name of the referencing table, used in the error message.
+
+
+    Returns:
+        np.ndarray: Row positions in the bus table.
+
+
+    Raises:
+        ValueError: If a bus number is not found in the bus table.
+    """
+    bus_numbers = np.asarray(bus_numbers)
+    positions = index.get_indexer(bus_numbers)
+    if (positions < 0).any():
+        missing = np.unique(bus_numbers[positions < 0])
+        raise ValueError(
+            f"{attribute} references buses not found in bus table: "
+            f"{missing.tolist()[:10]}"
+        )
+    return positions
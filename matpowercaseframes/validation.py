@@ -0,0 +1,361 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .constants import BUS_TYPES, COST_MODELS
+from .idx.cost import COST
+
+# columns of the issues table of a ValidationReport
+ISSUE_COLUMNS = ["check", "severity", "attribute", "index", "message"]
+SEVERITIES = ("error", "warning")
+
+Check = namedtuple("Check", ["name", "func", "severity", "description"])
+Check.__doc__ = """
+Registered validation check: name, function of a case, severity of its findings,
+and description.
+"""
+
+# registry of checks, in order of registration
+CHECKS = {}
+
+
+def register_check(name, severity="error"):
+    """
+    Register a validation check, used as a decorator.
+
+    The check is a function of a case returning findings, as a list of
+    (attribute, mask, message) tuples, where mask is a boolean array over the rows
+    of the table (or None for an issue of the whole table). Checks must skip
+    tables that are missing.
+
+
+    Args:
+        name (str):
+            Check name, replacing a registered check of the same name.
+        severity (str):
+            'error' or 'warning'.
+
+
+    Returns:
+        callable: Decorator registering the function.
+
+
+    Example:
+        >>> @register_check("gen_pg_negative", severity="warning")
+        ... def check_pg(case):
+        ...     return [("gen", case.gen["PG"].to_numpy() < 0, "negative PG")]
+    """
+    if severity not in SEVERITIES:
+        raise ValueError(f"Unknown severity '{severity}', use {list(SEVERITIES)}.")
+
+    def decorator(func):
+        description = (func.__doc__ or "").strip().split("\n")[0]
+        CHECKS[name] = Check(name, func, severity, description)
+        return func
+
+    return decorator
+
+
+def _table(case, attribute, columns=()):
+    """Table of a case with the given columns, or None if missing."""
+    df = getattr(case, attribute, None) if attribute in case.attributes else None
+    if not isinstance(df, pd.DataFrame) or not all(c in df.columns for c in columns):
+        return None
+    return df
+
+
+def _values(df, column):
+    return df[column].to_numpy()
+
+
+def _missing_buses(case, attribute, columns):
+    bus = _table(case, "bus", ["BUS_I"])
+    df = _table(case, attribute, columns)
+    if bus is None or df is None:
+        return []
+    bus_numbers = _values(bus, "BUS_I")
+    findings = []
+    for column in columns:
+        missing = ~pd.Index(_values(df, column)).isin(bus_numbers)
+        findings.append((attribute, missing, f"{column} not found in bus BUS_I"))
+    return findings
+
+
+@register_check("bus_duplicate")
+def check_bus_duplicate(case):
+    """Bus numbers (BUS_I) are unique."""
+    bus = _table(case, "bus", ["BUS_I"])
+    if bus is None:
+        return []
+    duplicated = pd.Index(_values(bus, "BUS_I")).duplicated(keep="first")
+    return [("bus", duplicated, "duplicate BUS_I")]
+
+
+@register_check("bus_type")
+def check_bus_type(case):
+    """Bus types are PQ, PV, REF, or NONE."""
+    bus = _table(case, "bus", ["BUS_TYPE"])
+    if bus is None:
+        return []
+    valid = np.isin(_values(bus, "BUS_TYPE"), list(BUS_TYPES.values()))
+    return [("bus", ~valid, "unknown BUS_TYPE")]
+
+
+@register_check("ref_missing")
+def check_ref_missing(case):
+    """The case has a reference bus."""
+    bus = _table(case, "bus", ["BUS_TYPE"])
+    if bus is None or (_values(bus, "BUS_TYPE") == BUS_TYPES["REF"]).any():
+        return []
+    return [("bus", None, "no reference bus (BUS_TYPE 3)")]
+
+
+@register_check("ref_duplicate", severity="warning")
+def check_ref_duplicate(case):
+    """The case has one reference bus, several are only expected with islands."""
+    bus = _table(case, "bus", ["BUS_TYPE"])
+    if bus is None:
+        return []
+    ref = _values(bus, "BUS_TYPE") == BUS_TYPES["REF"]
+    if ref.sum() <= 1:
+        return []
+    return [("bus", ref, "more than one reference bus")]
+
+
+@register_check("ref_without_gen", severity="warning")
+def check_ref_without_gen(case):
+    """Reference buses have an in-service generator."""
+    bus = _table(case, "bus", ["BUS_I", "BUS_TYPE"])
+    gen = _table(case, "gen", ["GEN_BUS", "GEN_STATUS"])
+    if bus is None or gen is None:
+        return []
+    on = _values(gen, "GEN_BUS")[_values(gen, "GEN_STATUS") > 0]
+    ref = _values(bus, "BUS_TYPE") == BUS_TYPES["REF"]
+    no_gen = ref & ~pd.Index(_values(bus, "BUS_I")).isin(on)
+    return [("bus", no_gen, "reference bus without in-service generator")]
+
+
+@register_check("voltage_limits")
+def check_voltage_limits(case):
+    """Bus voltage limits satisfy VMIN <= VMAX."""
+    bus = _table(case, "bus", ["VMIN", "VMAX"])
+    if bus is None:
+        return []
+    return [("bus", _values(bus, "VMIN") > _values(bus, "VMAX"), "VMIN > VMAX")]
+
+
+@register_check("gen_bus")
+def check_gen_bus(case):
+    """Generators are connected to existing buses."""
+    return _missing_buses(case, "gen", ["GEN_BUS"])
+
+
+@register_check("gen_limits")
+def check_gen_limits(case):
+    """Generator limits satisfy PMIN <= PMAX and QMIN <= QMAX."""
+    findings = []
+    for low, high in (("PMIN", "PMAX"), ("QMIN", "QMAX")):
+        gen = _table(case, "gen", [low, high])
+        if gen is not None:
+            invalid = _values(gen, low) > _values(gen, high)
+            findings.append(("gen", invalid, f"{low} > {high}"))
+    return findings
+
+
+@register_check("branch_bus")
+def check_branch_bus(case):
+    """Branches are connected to existing buses."""
+    return _missing_buses(case, "branch", ["F_BUS", "T_BUS"])
+
+
+@register_check("branch_impedance", severity="warning")
+def check_branch_impedance(case):
+    """Branches have a nonzero impedance."""
+    branch = _table(case, "branch", ["BR_R", "BR_X"])
+    if branch is None:
+        return []
+    zero = (_values(branch, "BR_R") == 0) & (_values(branch, "BR_X") == 0)
+    return [("branch", zero, "zero impedance, BR_R = BR_X = 0")]
+
+
+@register_check("dcline_bus")
+def check_dcline_bus(case):
+    """DC lines are connected to existing buses."""
+    return _missing_buses(case, "dcline", ["F_BUS", "T_BUS"])
+
+
+def _cost_findings(case, attribute, owner):
+    """Findings of the rows and parameters of a cost table."""
+    costs = _table(case, attribute, ["MODEL", "NCOST"])
+    df = _table(case, owner)
+    if costs is None or df is None:
+        return []
+    findings = []
+    if len(costs) not in (len(df), 2 * len(df)):
+        findings.append(
+            (attribute, None, f"{len(costs)} rows for {len(df)} {owner} rows")
+        )
+    model = _values(costs, "MODEL")
+    ncost = _values(costs, "NCOST")
+    is_poly = model == COST_MODELS["POLYNOMIAL"]
+    is_pwl = model == COST_MODELS["PW_LINEAR"]
+    n_params = costs.shape[1] - COST
+    findings.append((attribute, ~(is_poly | is_pwl), "unknown MODEL"))
+    short = (is_poly & ~(ncost <= n_params)) | (is_pwl & ~(2 * ncost <= n_params))
+    findings.append((attribute, short, "NCOST exceeds the parameter columns"))
+    few = (is_poly & ~(ncost >= 1)) | (is_pwl & ~(ncost >= 2))
+    findings.append((attribute, few, "NCOST too small"))
+
+    # breakpoints of piecewise linear rows increase
+    x = costs.iloc[:, COST::2].to_numpy(dtype=float)
+    j = np.arange(x.shape[1] - 1)[None, :]
+    inner = is_pwl[:, None] & (j < ncost[:, None] - 1)
+    with np.errstate(invalid="ignore"):
+        decreasing = inner & ~(np.diff(x, axis=1) > 0)
+    findings.append((attribute, decreasing.any(axis=1), "breakpoints not increasing"))
+    return findings
+
+
+@register_check("gencost")
+def check_gencost(case):
+    """Generator costs have one (or two) rows per generator and valid NCOST."""
+    return _cost_findings(case, "gencost", "gen")
+
+
+@register_check("dclinecost")
+def check_dclinecost(case):
+    """DC line costs have one row per DC line and valid NCOST."""
+    return _cost_findings(case, "dclinecost", "dcline")
+
+
+class ValidationReport:
+    """
+    Result of `validate`.
+
+    Issues are listed in `issues`, one row per offending row of a table (or per
+    table), with columns check, severity, attribute, index (row label, None for the
+    whole table), and message.
+    """
+
+    def __init__(self, issues, checks):
+        """
+        Initialize the report, see `validate`.
+
+
+        Args:
+            issues (pd.DataFrame):
+                Issues, with ISSUE_COLUMNS.
+            checks (list):
+                Names of the checks that were run.
+        """
+        self.issues = issues
+        self.checks = checks
+
+    @property
+    def errors(self):
+        """pd.DataFrame: Issues of severity 'error'."""
+        return self.issues[self.issues["severity"] == "error"]
+
+    @property
+    def warnings(self):
+        """pd.DataFrame: Issues of severity 'warning'."""
+        return self.issues[self.issues["severity"] == "warning"]
+
+    @property
+    def ok(self):
+        """bool: Whether no errors were found, ignoring warnings."""
+        return not (self.issues["severity"] == "error").any()
+
+    def __bool__(self):
+        return self.ok
+
+    def summary(self):
+        """
+        Count the issues of each check and message.
+
+
+        Returns:
+            pd.DataFrame: Counts, with columns check, severity, attribute, message,
+                and count.
+        """
+        keys = ["check", "severity", "attribute", "message"]
+        return self.issues.groupby(keys, sort=False).size().reset_index(name="count")
+
+    def raise_for_errors(self):
+        """
+        Raise if errors were found.
+
+
+        Raises:
+            ValueError: With the summary of the errors.
+        """
+        if not self.ok:
+            summary = self.summary()
+            summary = summary[summary["severity"] == "error"]
+            raise ValueError(f"Invalid case:\n{summary.to_string(index=False)}")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(checks={len(self.checks)},"
+            f" errors={len(self.errors)}, warnings={len(self.warnings)})"
+        )
+
+
+def validate(case, checks=None, skip=()):
+    """
+    Run registered checks on a case, see `register_check`.
+
+    Checks are vectorized over the rows of each table, joining on the bus numbers
+    with hash lookups, so validating large cases takes milliseconds.
+
+
+    Args:
+        case (CaseFrames):
+            Case to validate, not changed.
+        checks (list | None):
+            Names of the checks to run. Defaults to all registered checks.
+        skip (list):
+            Names of checks not to run.
+
+
+    Returns:
+        ValidationReport: Found issues.
+
+
+    Raises:
+        ValueError: If a check name is not registered.
+    """
+    names = list(CHECKS) if checks is None else list(checks)
+    unknown = [name for name in [*names, *skip] if name not in CHECKS]
+    if unknown:
+        raise ValueError(f"Unknown checks {unknown}, use {list(CHECKS)}.")
+    names = [name for name in names if name not in skip]
+
+    pieces = []
+    for name in names:
+        check = CHECKS[name]
+        for attribute, mask, message in check.func(case):
+            if mask is None:
+                labels = [None]
+            else:
+                mask = np.asarray(mask, dtype=bool)
+                if not mask.any():
+                    continue
+                labels = getattr(case, attribute).index[mask]
+            pieces.append((name, check.severity, attribute, labels, message))
+
+    sizes = [len(piece[3]) for piece in pieces]
+    issues = pd.DataFrame(
+        {
+            "check": np.repeat([p[0] for p in pieces], sizes).astype(object),
+            "severity": np.repeat([p[1] for p in pieces], sizes).astype(object),
+            "attribute": np.repeat([p[2] for p in pieces], sizes).astype(object),
+            "index": np.concatenate(
+                [np.asarray(p[3], dtype=object) for p in pieces] or [[]]
+            ),
+            "message": np.repeat([p[4] for p in pieces], sizes).astype(object),
+        },
+        columns=ISSUE_COLUMNS,
+    )
+    return ValidationReport(issues, names)
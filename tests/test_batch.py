@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseBatch, CaseFrames
+from matpowercaseframes.utils import copy_on_write
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def test_case_batch_edits():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    batch = CaseBatch(cf, n_scenarios=10)
+    assert len(batch) == 10
+    assert batch.varying == {}
+
+    scales = np.linspace(0.5, 1.4, 10)[:, None]
+    batch.scale("bus", "PD", scales)
+    batch.set("branch", "BR_STATUS", 0, scenarios=[2, 3], rows=[4])
+    assert batch.varying == {"bus": ["PD"], "branch": ["BR_STATUS"]}
+    assert np.allclose(batch.get("bus", "PD"), scales * cf.bus["PD"].to_numpy())
+    assert batch.get("gen", "PG").shape == (10, len(cf.gen))
+
+    # base case is not modified
+    assert (cf.branch["BR_STATUS"] == 1).all()
+    with pytest.raises(KeyError):
+        batch.set("bus", "NOT_A_COLUMN", 0)
+
+
+def test_case_batch_scenario():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    batch = CaseBatch(cf, n_scenarios=4)
+    # rows are positions, bus index labels start at 1
+    batch.set("bus", "PD", [[10], [20], [30], [40]], rows=[4])
+
+    case = batch[2]
+    assert isinstance(case, CaseFrames)
+    assert case.bus.loc[5, "PD"] == 30
+    assert case.bus.loc[7, "PD"] == cf.bus.loc[7, "PD"]
+
+    # under Copy-on-Write, views are read-only and do not copy data
+    if copy_on_write():
+        assert np.shares_memory(case.bus["PD"].to_numpy(), batch.get("bus", "PD"))
+        with pytest.raises(ValueError):
+            case.bus.loc[5, "PD"] = 0
+    else:
+        case.bus.loc[5, "PD"] = 0
+        assert batch.get("bus", "PD")[2, 4] == 30
+
+    # copies are independent
+    case = batch.scenario(2, copy=True)
+    case.bus.loc[5, "PD"] = 0
+    assert batch.get("bus", "PD")[2, 4] == 30
+
+    cases = batch.to_cases()
+    assert [case.bus.loc[5, "PD"] for case in cases] == [10, 20, 30, 40]
+
+
+def test_case_batch_from_cases():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cases = []
+    for pg in [50, 60, 70]:
+        case = cf.copy()
+        case.gen.loc[2, "PG"] = pg
+        cases.append(case)
+
+    batch = CaseBatch.from_cases(cases)
+    assert batch.varying == {"gen": ["PG"]}
+    assert np.array_equal(batch.get("gen", "PG")[:, 1], [50, 60, 70])
+
+    results = batch.run_pf_batch()
+    for s, case in enumerate(cases):
+        assert np.allclose(results["VA"][s], case.run_pf().bus["VA"])
+
+    batch.set("branch", "BR_STATUS", 0, scenarios=0, rows=0)
+    with pytest.raises(ValueError, match="BR_STATUS"):
+        batch.run_pf_batch()
@@ -0,0 +1,165 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matpowercaseframes import CaseBatch, CaseFrames
+from matpowercaseframes.costs import modcost
+from matpowercaseframes.idx.ct import (
+    CT_ADD,
+    CT_LOAD_ALL_PQ,
+    CT_LOAD_DIS_P,
+    CT_LOAD_FIX_P,
+    CT_MODCOST_F,
+    CT_REL,
+    CT_REP,
+    CT_TAREABRCH,
+    CT_TAREABUS,
+    CT_TAREAGEN,
+    CT_TBRCH,
+    CT_TGEN,
+    CT_TGENCOST,
+    CT_TLOAD,
+)
+from matpowercaseframes.utils import copy_on_write
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def test_apply_changes_contingencies():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    chgtab = np.array(
+        [
+            [1, 0.1, CT_TBRCH, 2, 11, CT_REP, 0],
+            [2, 0.1, CT_TBRCH, 5, 11, CT_REP, 0],
+            [3, 0.1, CT_TGEN, 3, 8, CT_REP, 0],
+            [3, 0.1, CT_TBRCH, 2, 6, CT_REL, 0.5],
+        ]
+    )
+
+    case = cf.apply_changes(chgtab, label=3)
+    assert (case.gen["GEN_STATUS"].to_numpy() == [1, 1, 0]).all()
+    assert case.branch["RATE_A"].iloc[1] == cf.branch["RATE_A"].iloc[1] * 0.5
+    assert (cf.gen["GEN_STATUS"] == 1).all()
+
+    # under Copy-on-Write, unchanged tables are shared with the base case
+    shared = np.shares_memory(case.bus["PD"].to_numpy(), cf.bus["PD"].to_numpy())
+    assert shared == copy_on_write()
+
+    cases = dict(cf.apply_changes(chgtab))
+    assert list(cases) == [1, 2, 3]
+    assert cases[1].branch["BR_STATUS"].tolist() == [1, 0, 1, 1, 1, 1, 1, 1, 1]
+    assert cases[2].branch["BR_STATUS"].tolist() == [1, 1, 1, 1, 0, 1, 1, 1, 1]
+
+    labels, batch = cf.apply_changes(chgtab, batch=True)
+    assert isinstance(batch, CaseBatch)
+    assert labels.tolist() == [1, 2, 3]
+    assert sorted(batch.varying["branch"]) == ["BR_STATUS", "RATE_A"]
+    assert batch.varying["gen"] == ["GEN_STATUS"]
+    for s, label in enumerate(labels):
+        for attribute, columns in batch.varying.items():
+            for column in columns:
+                assert np.array_equal(
+                    getattr(batch[s], attribute)[column],
+                    getattr(cases[label], attribute)[column],
+                )
+
+
+def test_apply_changes_area():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cf.bus.loc[[3, 6, 9], "BUS_AREA"] = 2
+    chgtab = [
+        [1, 1, CT_TAREABUS, 2, 3, CT_REL, 2],
+        [1, 1, CT_TAREAGEN, 2, 9, CT_ADD, 10],
+        [1, 1, CT_TAREABRCH, 2, 6, CT_REP, 99],
+    ]
+    case = cf.apply_changes(chgtab, label=1)
+
+    in_area = (cf.bus["BUS_AREA"] == 2).to_numpy()
+    assert np.allclose(case.bus["PD"][in_area], 2 * cf.bus["PD"][in_area])
+    assert np.allclose(case.bus["PD"][~in_area], cf.bus["PD"][~in_area])
+    assert case.gen["PMAX"].tolist() == [250, 300, 280]
+    assert (case.branch["RATE_A"] == 99).sum() == 5  # branches touching 3, 6, 9
+
+    labels, batch = cf.apply_changes(chgtab, batch=True)
+    assert np.array_equal(batch[0].gen["PMAX"], case.gen["PMAX"])
+
+
+def test_apply_changes_loads():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    # dispatchable load of 20 MW at bus 9
+    gen = cf.gen.loc[[3]].set_axis([4])
+    gen.loc[4, ["GEN_BUS", "PG", "QG", "PMAX", "PMIN", "QMAX", "QMIN"]] = [
+        9,
+        -20,
+        -5,
+        0,
+        -20,
+        0,
+        -5,
+    ]
+    cf.set_attribute("gen", pd.concat([cf.gen, gen]))
+    cf.set_attribute("gencost", pd.concat([cf.gencost, cf.gencost.iloc[[2]]]))
+
+    # all loads, real and reactive, to a total of 335 MW
+    case = cf.apply_changes([[1, 1, CT_TLOAD, 0, CT_LOAD_ALL_PQ, CT_REP, 335]], label=1)
+    scale = 335 / (315 + 20)
+    assert np.isclose(case.bus["PD"].sum() - case.gen["PMIN"].iloc[3], 335)
+    assert np.allclose(case.bus["QD"], scale * cf.bus["QD"])
+    assert np.isclose(case.gen["QMIN"].iloc[3], -5 * scale)
+
+    # fixed loads only, shifted by 10 MW
+    case = cf.apply_changes([[1, 1, CT_TLOAD, 0, CT_LOAD_FIX_P, CT_ADD, 10]], label=1)
+    assert np.isclose(case.bus["PD"].sum(), 325)
+    assert (case.bus["QD"] == cf.bus["QD"]).all()
+    assert (case.gen["PMIN"] == cf.gen["PMIN"]).all()
+
+    # dispatchable load doubled, with its cost
+    case = cf.apply_changes([[1, 1, CT_TLOAD, 9, -CT_LOAD_DIS_P, CT_REL, 2]], label=1)
+    assert case.gen["PMIN"].iloc[3] == -40
+    assert (case.bus["PD"] == cf.bus["PD"]).all()
+    assert np.allclose(case.gencost.iloc[3, 4:], cf.gencost.iloc[3, 4:] * [1 / 2, 1, 2])
+
+
+def test_apply_changes_gencost():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    chgtab = [
+        [1, 1, CT_TGENCOST, 2, CT_MODCOST_F, CT_REL, 2],
+        [1, 1, CT_TGENCOST, 0, 6, CT_REP, 1],
+    ]
+    case = cf.apply_changes(chgtab, label=1)
+    assert np.allclose(case.gencost.iloc[1, 4:], [0.17, 1, 1200])
+    assert (case.gencost["C1"] == 1).all()
+
+    with pytest.raises(ValueError, match="not found"):
+        cf.apply_changes(chgtab, label=2)
+    with pytest.raises(ValueError, match="column 2 of branch"):
+        cf.apply_changes([[1, 1, CT_TBRCH, 1, 2, CT_REP, 0]], label=1)
+
+
+def test_modcost():
+    gencost = np.array(
+        [
+            [2, 0, 0, 3, 0.1, 5, 150, 0],
+            [1, 0, 0, 2, 0, 10, 100, 2000],
+        ]
+    )
+
+    def cost(gencost, x):
+        poly = np.polyval(gencost[0, 4:7], x[0])
+        pwl = np.interp(x[1], gencost[1, [4, 6]], gencost[1, [5, 7]])
+        return np.array([poly, pwl])
+
+    x = np.array([20.0, 40.0])
+    alpha = np.array([2.0, 3.0])
+    f = cost(gencost, x)
+    assert np.allclose(cost(modcost(gencost, alpha, "SCALE_F"), x), alpha * f)
+    assert np.allclose(cost(modcost(gencost, alpha, "SCALE_X"), alpha * x), f)
+    assert np.allclose(cost(modcost(gencost, alpha, "SHIFT_F"), x), alpha + f)
+    assert np.allclose(cost(modcost(gencost, alpha, "SHIFT_X"), alpha + x), f)
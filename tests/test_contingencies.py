@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.contingencies import (
+    Contingency,
+    _bridges_dfs,
+    bridges,
+    contingencies,
+    map_outages,
+    radial_branches,
+)
+from matpowercaseframes.utils import copy_on_write
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def _max_flow(case):
+    return np.abs(case.run_dcpf().branch["PF"].to_numpy()).max()
+
+
+def test_contingencies_filters():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    # buses 1, 2, and 3 are connected through single transformers
+    assert np.flatnonzero(radial_branches(cf)).tolist() == [0, 3, 6]
+    assert np.flatnonzero(bridges(cf)).tolist() == [0, 3, 6]
+
+    cf.branch.loc[2, "BR_STATUS"] = 0
+    assert np.flatnonzero(bridges(cf)).tolist() == [0, 2, 3, 4, 5, 6, 7, 8]
+    assert np.flatnonzero(radial_branches(cf)).tolist() == [0, 2, 3, 6]
+
+    outages = contingencies(cf)
+    assert len(outages) == 8 + 3
+    assert outages[0] == Contingency("branch", 1, 0)
+    assert outages[-1] == Contingency("gen", 3, 2)
+    assert len(contingencies(cf, elements=("branch",), skip_radial=True)) == 4
+    assert len(contingencies(cf, elements=("branch",), skip_bridges=True)) == 0
+    assert len(contingencies(cf, min_kv=345, max_kv=345)) == 11
+    assert contingencies(cf, min_kv=400) == []
+    with pytest.raises(ValueError):
+        contingencies(cf, elements=("bus",))
+
+    # missing buses are reported instead of indexing from the end
+    cf.branch.loc[4, "T_BUS"] = 99
+    cf.gen.loc[2, "GEN_BUS"] = 98
+    for check in (radial_branches, bridges, _bridges_dfs):
+        with pytest.raises(ValueError, match="not found"):
+            check(cf)
+    with pytest.raises(ValueError, match="98"):
+        contingencies(cf, elements=("gen",), min_kv=345)
+
+
+def test_iter_outages():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    count = 0
+    for contingency, variant in cf.iter_outages(skip_bridges=True):
+        df = getattr(variant, contingency.attribute)
+        column = "BR_STATUS" if contingency.attribute == "branch" else "GEN_STATUS"
+        assert df[column].iloc[contingency.position] == 0
+        assert df[column].sum() == len(df) - 1
+        # under Copy-on-Write, other tables and columns are shared with the base case
+        shared = np.shares_memory(variant.bus["PD"].to_numpy(), cf.bus["PD"].to_numpy())
+        assert shared == copy_on_write()
+        count += 1
+    assert count == 6 + 3
+    assert cf.branch["BR_STATUS"].sum() == 9
+    assert cf.gen["GEN_STATUS"].sum() == 3
+
+
+@pytest.mark.parametrize("processes", [None, 2])
+def test_map_outages(processes):
+    cf = CaseFrames(CASE_PATH_CASE9)
+    results = map_outages(
+        _max_flow, cf, processes=processes, chunksize=2, skip_bridges=True
+    )
+    assert list(results) == contingencies(cf, skip_bridges=True)
+    for contingency, result in results.items():
+        variant = cf.copy(deep=True)
+        if contingency.attribute == "branch":
+            variant.branch.loc[contingency.index, "BR_STATUS"] = 0
+        else:
+            variant.gen.loc[contingency.index, "GEN_STATUS"] = 0
+        assert np.isclose(result, _max_flow(variant))
@@ -1,12 +1,14 @@
 import os
+import pickle
 
 import numpy as np
 import pandas as pd
 import pytest
 
-from matpowercaseframes import CaseFrames
+from matpowercaseframes import CaseFrames, ReservesFrames, xGenDataTableFrames
 from matpowercaseframes.idx import BUS_I, BUS_TYPE
 from matpowercaseframes.testing import assert_frames_struct_equal
+from matpowercaseframes.utils import copy_on_write
 
 try:
     import matlab.engine  # noqa: F401
@@ -322,3 +324,178 @@ def test_reset_index_and_infer_numpy_case9():
 
     # gen has no named index column — round-trip resets to 1-based RangeIndex
     assert cf2_rt.gen.index.tolist() == list(range(1, len(cf2_rt.gen) + 1))
+
+
+def test_copy_is_independent():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cf_copy = cf.copy()
+
+    assert cf_copy is not cf
+    assert cf_copy.attributes == cf.attributes
+    assert cf_copy.attributes is not cf.attributes
+    assert_frames_struct_equal(cf, cf_copy)
+
+    # modifications in the copy must not leak into the original
+    cf_copy.bus.loc[5, "PD"] = 0
+    cf_copy.gen["PG"] = 1
+    cf_copy.update_columns_templates({"load": ["LD_ID"]})
+    assert cf.bus.loc[5, "PD"] == 90
+    assert (cf.gen["PG"] != 1).any()
+    assert "load" not in cf.columns_templates
+
+    cf_deep = cf.copy(deep=True)
+    assert_frames_struct_equal(cf, cf_deep)
+
+
+@pytest.mark.parametrize("protocol", [4, 5])
+def test_pickle(protocol):
+    cf = CaseFrames(CASE_PATH_CASE118)
+    cf.set_attribute(
+        "reserves",
+        ReservesFrames(
+            {
+                "zones": pd.DataFrame(np.ones((1, 3))),
+                "req": pd.DataFrame({"PREQ": [100.0]}),
+                "cost": pd.DataFrame({"C": [1.0, 2.0, 3.0]}),
+                "qty": pd.DataFrame({"PQTY": [10.0, 20.0, 30.0]}),
+            }
+        ),
+    )
+    cf.set_attribute("xgd_table", xGenDataTableFrames({"CommitKey": [1, 1, 2]}))
+    cf.make_ybus()
+
+    cf_rt = pickle.loads(pickle.dumps(cf, protocol=protocol))
+    assert_frames_struct_equal(cf, cf_rt)
+    assert cf_rt.xgd_table.df.equals(cf.xgd_table.df)
+    assert cf_rt.columns_templates == cf.columns_templates
+    cf_rt.bus.iloc[0, 2] = 0
+    assert cf.bus["PD"].iloc[0] == 51
+    if protocol == 5:
+        # derived caches are not pickled
+        assert cf_rt._cache == {}
+
+        # out-of-band buffers, one per numeric table
+        buffers = []
+        data = pickle.dumps(cf, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 4 + 4 + 1
+        assert len(data) < 8000  # bus names and metadata only
+        cf_rt = pickle.loads(data, buffers=[bytearray(b.raw()) for b in buffers])
+        assert_frames_struct_equal(cf, cf_rt)
+        cf_rt.bus.iloc[0, 2] = 0
+        cf_rt = pickle.loads(data, buffers=[bytes(b.raw()) for b in buffers])
+        cf_rt.bus.iloc[0, 2] = 0  # read-only buffers are copied
+
+        # one buffer per run of columns of one dtype, e.g. an integer status
+        cf.branch["BR_STATUS"] = cf.branch["BR_STATUS"].astype(int)
+        buffers = []
+        data = pickle.dumps(cf, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 4 + 4 + 1 + 2
+        assert len(data) < 8000
+        cf_rt = pickle.loads(data, buffers=[bytearray(b.raw()) for b in buffers])
+        assert_frames_struct_equal(cf, cf_rt)
+        assert cf_rt.branch["BR_STATUS"].dtype == cf.branch["BR_STATUS"].dtype
+
+        # frozen structs keep read-only buffers without copies
+        buffers = []
+        data = pickle.dumps(cf.freeze(), protocol=5, buffer_callback=buffers.append)
+        raw = [bytes(b.raw()) for b in buffers]
+        cf_rt = pickle.loads(data, buffers=raw)
+        assert cf_rt.frozen
+        assert any(
+            np.shares_memory(cf_rt.bus["PD"].to_numpy(), np.frombuffer(b, np.uint8))
+            for b in raw
+        )
+
+
+def test_freeze():
+    cf = CaseFrames(CASE_PATH_CASE9).freeze()
+    assert cf.frozen
+    assert not cf.bus["PD"].to_numpy().flags.writeable
+    with pytest.raises(ValueError):
+        cf.bus.loc[5, "PD"] = 0
+    with pytest.raises(AttributeError):
+        cf.baseMVA = 1
+
+    # derived results are cached
+    assert cf.make_ybus() is cf.make_ybus()
+    assert cf.content_hash() == CaseFrames(CASE_PATH_CASE9).content_hash()
+    assert cf.bus_index() is cf.bus_index()
+    assert cf.bus_positions([9, 1]).tolist() == [8, 0]
+
+    # copies are mutable and share data until written into
+    cf_thawed = cf.thaw()
+    cf_pf = cf.run_dcpf()
+    assert not cf_thawed.frozen
+    shared = np.shares_memory(cf_thawed.bus["PD"].to_numpy(), cf.bus["PD"].to_numpy())
+    assert shared == copy_on_write()
+    cf_thawed.bus.loc[5, "PD"] = 0
+    cf_copy = cf_thawed.copy()
+    cf_copy.bus.loc[5, "PD"] = 1
+    assert cf_thawed.bus.loc[5, "PD"] == 0
+    assert cf_thawed.content_hash() != cf.content_hash()
+    assert cf.bus.loc[5, "PD"] == 90
+    with pytest.raises(ValueError):
+        cf.bus.loc[5, "PD"] = 0
+    del cf, cf_pf
+    cf_thawed.bus.loc[7, "PD"] = 0
+    cf_copy.bus.loc[7, "PD"] = 0
+
+    cf = pickle.loads(pickle.dumps(CaseFrames(CASE_PATH_CASE9).freeze()))
+    assert cf.frozen
+    with pytest.raises(ValueError):
+        cf.gen.loc[1, "PG"] = 0
+
+
+def test_memoize_and_dirty_columns():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    calls = []
+
+    def n_on():
+        calls.append(1)
+        return int((cf.branch["BR_STATUS"] > 0).sum())
+
+    inputs = {"branch": ["BR_STATUS"]}
+    assert cf.memoize("n_on", inputs, n_on) == 9
+    assert cf.memoize("n_on", inputs, n_on) == 9
+    cf.branch.loc[1, "RATE_A"] = 100  # other column
+    cf.branch["BR_STATUS"] = cf.branch["BR_STATUS"].to_numpy().copy()  # equal values
+    assert cf.memoize("n_on", inputs, n_on) == 9
+    assert len(calls) == 1
+    cf.branch.loc[1, "BR_STATUS"] = 0
+    assert cf.memoize("n_on", inputs, n_on) == 8
+    assert cf.cache_info("n_on") == (2, 2, 1)
+    cf.cache_clear("n_on")
+    assert cf.cache_info("n_on") == (0, 0, 0)
+
+    assert set(cf.dirty_columns()) == set(cf.attributes) - {"version", "baseMVA"}
+    cf.mark_clean()
+    assert cf.dirty_columns() == {}
+    cf.bus.loc[5, "PD"] = 90  # equal value
+    cf.gen.loc[1, "PG"] = 0
+    cf.set_attribute("branch", cf.branch.drop(columns="RATE_C"))
+    cf.gencost = cf.gencost.copy()
+    assert cf.dirty_columns() == {"gen": ["PG"], "branch": ["RATE_C"]}
+    assert cf.is_dirty("gen", "PG")
+    assert not cf.is_dirty("gen", "QG")
+    assert not cf.is_dirty("bus")
+
+    cf_rt = pickle.loads(pickle.dumps(cf))
+    assert cf_rt.cache_info() == (0, 0, 0)
+    assert cf_rt.is_dirty()
+
+
+def test_to_pu():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    bus = cf.bus.copy(deep=True)
+    cf_pu = cf.to_pu()
+
+    # original is untouched
+    assert cf.bus.equals(bus)
+
+    assert np.allclose(cf_pu.bus["PD"], cf.bus["PD"] / cf.baseMVA)
+    assert np.allclose(cf_pu.bus["VA"], np.deg2rad(cf.bus["VA"]))
+    assert np.allclose(cf_pu.gen["PMAX"], cf.gen["PMAX"] / cf.baseMVA)
+    assert np.allclose(cf_pu.branch["RATE_A"], cf.branch["RATE_A"] / cf.baseMVA)
+    assert np.allclose(cf_pu.branch["ANGMIN"], np.deg2rad(cf.branch["ANGMIN"]))
+    assert np.allclose(cf_pu.gencost["C2"], cf.gencost["C2"] * cf.baseMVA**2)
+    assert np.allclose(cf_pu.gencost["C0"], cf.gencost["C0"])
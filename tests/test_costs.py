@@ -0,0 +1,165 @@
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.costs import (
+    CostCurves,
+    convex_hull,
+    cost_columns,
+    is_convex,
+    marginal_cost,
+    merge_breakpoints,
+    poly_to_pwl,
+    pwl_segments,
+    totcost,
+)
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+CASE_PATH_DCLINE = os.path.join(os.path.dirname(CURDIR), "data", "t_case9_dcline.m")
+
+
+def test_totcost_polynomial():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    c2, c1, c0 = cf.gencost[["C2", "C1", "C0"]].to_numpy().T
+    pg = cf.gen["PG"].to_numpy()
+    np.testing.assert_allclose(cf.total_cost(), c2 * pg**2 + c1 * pg + c0)
+    np.testing.assert_allclose(cf.marginal_cost(), 2 * c2 * pg + c1)
+    np.testing.assert_array_equal(cf.cost_segments(), [-1, -1, -1])
+
+    # batches of dispatch points, and NCOST per row
+    batch = np.array([pg, pg * 2, np.zeros(3)])
+    cost = cf.total_cost(batch)
+    assert cost.shape == (3, 3)
+    np.testing.assert_allclose(cost[2], c0)
+    gencost = cf.gencost.to_numpy(copy=True)
+    gencost[0, 3:] = [2, 2, 5, 0]  # linear, padded
+    np.testing.assert_allclose(totcost(gencost, [10, 0, 0])[0], 25)
+
+
+def test_costs_mixed_and_dcline():
+    cf = CaseFrames(CASE_PATH_DCLINE)
+    pg = np.array([[50, 250, 10], [150, 100, 20], [300, 350, 0]])
+    expected = [
+        [1250, 4000, 24.035 * 10 - 403.5],
+        [4000, 1500, 24.035 * 20 - 403.5],
+        [9000, 6000, -403.5],  # extrapolated past the last breakpoint
+    ]
+    np.testing.assert_allclose(cf.total_cost(pg), expected)
+    np.testing.assert_allclose(
+        cf.marginal_cost(pg), [[25, 20, 24.035], [30, 15, 24.035], [35, 20, 24.035]]
+    )
+    np.testing.assert_array_equal(
+        cf.cost_segments(pg), [[0, 1, -1], [1, 0, -1], [2, 1, -1]]
+    )
+    # at a breakpoint, the slope of the next segment
+    np.testing.assert_allclose(marginal_cost(cf.gencost, [200, 200, 0])[:2], [35, 20])
+
+    start, end, slope, intercept, mask = pwl_segments(cf.gencost)
+    np.testing.assert_array_equal(mask.sum(1), [3, 2, 0])
+    np.testing.assert_allclose(slope[0], [25, 30, 35])
+    np.testing.assert_allclose(intercept[1, :2], [0, -1000])
+
+    pf = cf.dcline["PF"].to_numpy()
+    np.testing.assert_allclose(
+        cf.total_cost(attribute="dclinecost"), [0, 0, 0, 7.3 * pf[3]]
+    )
+    with pytest.raises(ValueError, match="expected 6"):
+        cf.total_cost(reactive=True)
+    with pytest.raises(ValueError, match="not supported"):
+        cf.total_cost(attribute="gen")
+
+
+def test_cost_curves_mixed():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # mixed models are read without warning
+        cf = CaseFrames(CASE_PATH_DCLINE)
+    assert cf.gencost.columns[4:].tolist() == [f"COST{i}" for i in range(1, 9)]
+    assert cost_columns([1, 1], 5) == ["X1", "Y1", "X2", "Y2", "X3"]
+    assert cost_columns([2], 3) == ["C2", "C1", "C0"]
+
+    curves = cf.cost_curves()
+    assert cf.cost_curves() is curves
+    assert (curves.is_poly.tolist(), curves.ncost.tolist()) == (
+        [False, False, True],
+        [4, 3, 2],
+    )
+    coefs, coef_mask = curves.coefficients()
+    np.testing.assert_allclose(coefs[2], [-403.5, 24.035])
+    assert coef_mask.sum() == 2
+    x, y, mask = curves.breakpoints()
+    np.testing.assert_array_equal(mask.sum(1), [4, 3, 0])
+    np.testing.assert_allclose(x[1, :3], [0, 200, 300])
+    assert np.isnan(x[1, 3]) and np.isnan(y[2]).all()
+
+    pg = cf.gen["PG"].to_numpy()
+    np.testing.assert_allclose(curves.totcost(pg), cf.total_cost())
+    curves_pu = curves.to_pu(cf.baseMVA)
+    np.testing.assert_allclose(curves_pu.to_numpy(), cf.to_pu().gencost.to_numpy())
+    np.testing.assert_allclose(curves_pu.totcost(pg / cf.baseMVA), cf.total_cost())
+    np.testing.assert_allclose(
+        curves_pu.from_pu(cf.baseMVA).to_numpy(), cf.gencost.to_numpy()
+    )
+
+    # MATPOWER layout round trips, through CostCurves and to_dict
+    assert curves.to_frame().equals(cf.gencost)
+    cf_rt = CaseFrames(cf.to_dict())
+    assert cf_rt.gencost.columns.equals(cf.gencost.columns)
+    np.testing.assert_allclose(cf_rt.gencost.to_numpy(), cf.gencost.to_numpy())
+    with pytest.raises(ValueError, match="NCOST requires 8"):
+        CostCurves([1], [4], np.zeros((1, 6)))
+
+
+def test_poly_to_pwl_and_convexity():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    pmin, pmax = cf.gen["PMIN"], cf.gen["PMAX"]
+    pwl = poly_to_pwl(cf.gencost, pmin, pmax, n_segments=4)
+    assert pwl.columns[4:].tolist() == cost_columns([1], 10)
+    assert pwl["MODEL"].tolist() == [1, 1, 1] and pwl["NCOST"].tolist() == [5, 5, 5]
+    np.testing.assert_allclose(pwl["X1"], pmin)
+    np.testing.assert_allclose(pwl["X5"], pmax)
+    np.testing.assert_allclose(totcost(pwl, pmax), cf.total_cost(pmax))
+
+    pwl = poly_to_pwl(cf.gencost.to_numpy(), pmin, pmax, max_error=1.0)
+    pg = np.linspace(pmin, pmax, 1001)
+    error = np.abs(totcost(pwl, pg) - cf.total_cost(pg))
+    assert error.max() <= 1.0
+    assert (pwl[:, 3] < 60).all()
+    with pytest.raises(ValueError, match="exactly one"):
+        poly_to_pwl(cf.gencost, pmin, pmax)
+
+    # convexity and convex hull repair
+    assert is_convex(cf.gencost).all() and is_convex(pwl).all()
+    gencost = poly_to_pwl(cf.gencost, pmin, pmax, n_segments=4)
+    gencost.loc[1, "Y3"] += 500
+    assert is_convex(gencost).tolist() == [False, True, True]
+    hull = convex_hull(gencost)
+    assert is_convex(hull).all()
+    assert hull["NCOST"].tolist() == [4, 5, 5]
+    assert hull.loc[1, ["X1", "X2", "X3", "X4"]].tolist() == [10, 70, 190, 250]
+    quartic = np.array([[2, 0, 0, 5, -1, 0, 0, 0, 0]])
+    with pytest.raises(ValueError, match="required"):
+        is_convex(quartic)
+    assert not is_convex(quartic, 0, 1)[0]
+
+
+def test_merge_breakpoints():
+    gencost = np.array(
+        [
+            [1, 0, 0, 5, 0, 0, 10, 100, 20, 200, 30, 300, 40, 450],
+            [1, 0, 0, 4, 0, 0, 100, 2500, 200, 5500, 250, 7250, 0, 0],
+            [2, 0, 0, 3, 0.1, 20, 0, 0, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+    merged = merge_breakpoints(gencost)
+    np.testing.assert_array_equal(merged[0, 3:10], [3, 0, 0, 30, 300, 40, 450])
+    np.testing.assert_array_equal(merged[1:], gencost[1:])
+    merged = merge_breakpoints(gencost, min_width=60)
+    np.testing.assert_array_equal(merged[1, 3:10], [3, 0, 0, 100, 2500, 250, 7250])
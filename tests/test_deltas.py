@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames, DeltaStore
+from matpowercaseframes.testing import assert_frames_struct_equal
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def _scenarios(cf):
+    cases = []
+    for k in range(4):
+        case = cf.copy()
+        case.bus["PD"] = case.bus["PD"] * (1 + 0.1 * k)
+        status = case.branch["BR_STATUS"].to_numpy(copy=True)
+        status[k] = 0
+        case.branch["BR_STATUS"] = status
+        cases.append(case)
+    return cases
+
+
+def test_delta_store(tmp_path):
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cases = _scenarios(cf)
+    structural = cf.copy()
+    structural.gen = structural.gen.drop(index=[3])
+    structural.bus_name = structural.bus["BUS_I"].astype(str).to_frame("NAME")
+
+    store = DeltaStore(cf)
+    assert store.extend(cases) == range(4)
+    assert store.add(structural) == 4
+    assert len(store) == 5
+    # 3 loads and 1 status flip per scenario, none for the base case
+    cells = store.cells
+    assert cells.groupby("scenario").size().tolist() == [1, 4, 4, 4]
+    assert store.nbytes < 1000
+
+    for case, rebuilt in zip([*cases, structural], store):
+        assert_frames_struct_equal(rebuilt, case)
+    assert store[1].branch["BR_STATUS"].dtype == cf.branch["BR_STATUS"].dtype
+    assert store.diff(0).summary()["cells"].tolist() == [1]
+    rebuilt = store[2]
+    rebuilt.bus.loc[5, "PD"] = 0  # rebuilt cases are mutable
+    assert store[2].bus.loc[5, "PD"] == cases[2].bus.loc[5, "PD"]
+    assert store.base.frozen
+
+    batch = store.to_batch([3, 1])
+    assert batch.n_scenarios == 2
+    assert_frames_struct_equal(batch.scenario(0), cases[3])
+    assert_frames_struct_equal(batch.scenario(1), cases[1])
+    np.testing.assert_array_equal(batch.get("branch", "BR_STATUS")[:, :4].sum(1), 3)
+    with pytest.raises(ValueError, match="cannot be stacked"):
+        store.to_batch()
+
+    path = tmp_path / "store.pkl"
+    store.save(path)
+    loaded = DeltaStore.load(path)
+    assert len(loaded) == 5
+    assert_frames_struct_equal(loaded[4], structural)
+
+    # missing values mixed with numbers are packed too
+    partial = cf.copy()
+    partial.bus.loc[5, "PD"] = np.nan
+    partial.bus.loc[7, "PD"] = 1
+    store = DeltaStore(cf)
+    store.add(partial)
+    assert len(store.cells) == 2
+    assert_frames_struct_equal(store.to_batch().scenario(0), partial)
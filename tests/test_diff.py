@@ -0,0 +1,101 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.testing import assert_frames_struct_equal
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def _edited(cf):
+    other = cf.copy()
+    other.bus.loc[5, "PD"] = 100
+    other.bus["BUS_TYPE"] = other.bus["BUS_TYPE"].astype(float)  # equal values
+    other.gen.loc[2, "PMAX"] = 10.5
+    other.gen = pd.concat(
+        [other.gen, other.gen.loc[[1]].set_axis(pd.Index([10], name="gen"))]
+    )
+    other.branch = other.branch.drop(index=[3, 4], columns=["RATE_C"])
+    other.bus["LAM_P"] = 0.5
+    other.baseMVA = 200
+    return other
+
+
+def test_diff():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    other = _edited(cf)
+    diff = cf.diff(other)
+    assert not diff.empty
+    assert list(diff.changes.columns) == ["attribute", "index", "column", "old", "new"]
+    pd_change = diff.changes.query("column == 'PD'")
+    assert pd_change[["attribute", "index", "old", "new"]].values.tolist() == [
+        ["bus", 5, 90.0, 100.0]
+    ]
+    assert len(diff.changes.query("column == 'LAM_P'")) == 9
+    assert diff.added["gen"].index.tolist() == [10]
+    assert diff.removed["branch"].tolist() == [3, 4]
+    assert diff.removed_columns == {"branch": ["RATE_C"]}
+    assert diff.values == {"baseMVA": (100, 200)}
+    assert diff.modified["gen"].tolist() == [2]
+
+    summary = diff.summary()
+    assert summary.loc["gen"].tolist() == [1, 0, 1, 1]
+    assert summary.loc["branch"].tolist() == [0, 2, 0, 0]
+
+    # the diff is a patch
+    patched = diff.apply(cf)
+    assert_frames_struct_equal(patched, other)
+    assert cf.bus.loc[5, "PD"] == 90
+    assert patched.diff(other).empty
+    assert cf.diff(cf.copy()).empty
+    assert_frames_struct_equal(other.diff(cf).apply(other), cf)
+
+
+def test_diff_order_and_errors():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    other = cf.copy()
+    other.gen = other.gen.iloc[::-1]
+    other.bus = other.bus[list(reversed(other.bus.columns))]
+    diff = cf.diff(other)
+    assert diff.changes.empty
+    assert not diff.empty
+    assert set(diff.layout) == {"gen", "bus"}
+    assert_frames_struct_equal(diff.apply(cf), other)
+
+    other.branch = pd.concat([other.branch, other.branch.iloc[[0]]])
+    with pytest.raises(ValueError, match="duplicate"):
+        cf.diff(other)
+
+
+def test_diff_added_columns():
+    cf = CaseFrames(CASE_PATH_CASE9)
+
+    # a new column without values is still a change
+    other = cf.copy()
+    other.bus["ZONE_NAME"] = None
+    other.gen["MU_PMAX"] = np.nan
+    diff = cf.diff(other)
+    assert diff.changes.empty
+    assert not diff.empty
+    assert diff.added_columns["gen"] == {"MU_PMAX": np.dtype(float)}
+    assert_frames_struct_equal(diff.apply(cf), other)
+
+    # a new column set only on added rows
+    other = cf.copy()
+    other.gen["MU_PMAX"] = np.nan
+    row = other.gen.loc[[1]].set_axis(pd.Index([10], name="gen"))
+    row["MU_PMAX"] = 2.5
+    other.gen = pd.concat([other.gen, row])
+    diff = cf.diff(other)
+    assert diff.changes.empty
+    patched = diff.apply(cf)
+    assert_frames_struct_equal(patched, other)
+    assert patched.gen.loc[10, "MU_PMAX"] == 2.5
@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.fingerprint import table_digest
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def test_table_digest():
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [0.0, np.nan, 1.5]})
+    digest = table_digest(df)
+    assert len(digest) == 32
+    assert table_digest(df.astype(float)) == digest
+    assert table_digest(df.astype(float), normalize_dtypes=False) != table_digest(
+        df, normalize_dtypes=False
+    )
+    assert table_digest(df.set_axis([7, 8, 9])) == digest
+    assert table_digest(df.set_axis([7, 8, 9]), index=True) != digest
+    assert table_digest(df.assign(B=[-0.0, np.nan, 1.5])) == digest
+    assert table_digest(df.assign(B=[0.0, np.nan, 2.5])) != digest
+    assert table_digest(df.rename(columns={"B": "C"})) != digest
+    assert table_digest(df.assign(C=1), ignore_columns=["C"]) == digest
+    assert table_digest(df.iloc[[1, 0, 2]].set_axis(df.index)) != digest
+    big = pd.DataFrame(np.random.default_rng(0).random((1000, 4)))
+    changed = big.copy()
+    changed.iloc[500, 2] += 1e-12
+    assert table_digest(changed) != table_digest(big)
+
+    # non-numeric columns
+    names = df.assign(NAME=["a", "b", "c"])
+    assert table_digest(names) == table_digest(names.copy(deep=True))
+    assert table_digest(names) != table_digest(names.assign(NAME=["a", "b", "d"]))
+
+
+def test_fingerprint():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    digest, tables = cf.fingerprint(tables=True)
+    assert set(tables) == {"bus", "gen", "branch", "gencost"}
+    assert cf.fingerprint() == digest
+
+    # dtype details, index labels, and results are ignored
+    cf_copy = cf.copy()
+    cf_copy.bus["BUS_TYPE"] = cf_copy.bus["BUS_TYPE"].astype(float)
+    cf_copy.gen.index = cf_copy.gen.index + 100
+    cf_copy.branch["PF"] = 10.0
+    cf_copy.bus["LAM_P"] = 1.0
+    assert cf_copy.fingerprint() == digest
+    assert cf_copy.content_hash() != cf.content_hash()
+    assert cf_copy.fingerprint(ignore_results=False) != digest
+
+    # table digests are updated incrementally
+    cf_copy.gen.loc[cf_copy.gen.index[0], "PG"] += 1
+    new_digest, new_tables = cf_copy.fingerprint(tables=True)
+    assert new_digest != digest
+    assert [name for name in tables if tables[name] != new_tables[name]] == ["gen"]
+    assert cf_copy.cache_info("digest:bus:True:True:False").hits >= 1
+
+    # relabeling rows invalidates cached digests of the index
+    content_hash = cf_copy.content_hash()
+    cf_copy.gen.index = cf_copy.gen.index - 100
+    assert cf_copy.content_hash() != content_hash
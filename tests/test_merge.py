@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matpowercaseframes import CaseFrames, ReservesFrames
+from matpowercaseframes.core import reserves_data_to_dataframes
+from matpowercaseframes.merge import bus_offsets, concat_cases
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+CASE_PATH_DCLINE = os.path.join(os.path.dirname(CURDIR), "data", "t_case9_dcline.m")
+
+
+def test_concat_cases():
+    north, south = CaseFrames(CASE_PATH_CASE9), CaseFrames(CASE_PATH_DCLINE)
+    ties = pd.DataFrame(
+        {"F_CASE": ["north"], "F_BUS": [5], "T_CASE": ["south"], "T_BUS": [30]}
+    )
+    ties["BR_X"] = 0.1
+    merged, mappings = concat_cases({"north": north, "south": south}, ties=ties)
+
+    assert merged.bus["BUS_I"].tolist() == [*range(1, 10), 10, 11, 39, *range(13, 19)]
+    assert merged.bus.index.tolist() == merged.bus["BUS_I"].astype(int).tolist()
+    assert mappings["bus"][("south", 30)] == 39
+    assert mappings["gen"].tolist() == [1, 2, 3, 4, 5, 6]
+    assert merged.gen["GEN_BUS"].tolist() == [1, 2, 3, 10, 39, 11]
+    assert merged.gencost.index.tolist() == [1, 2, 3, 4, 5, 6]
+    np.testing.assert_array_equal(merged.gencost["MODEL"], [2, 2, 2, 1, 1, 2])
+    assert merged.dcline[["F_BUS", "T_BUS"]].values.tolist()[0] == [39, 13]
+    assert len(merged.dclinecost) == 4
+
+    # the tie-line comes last, with default branch values
+    assert len(merged.branch) == 19 and mappings["branch"].tolist()[-1] == 18
+    tie = merged.branch.iloc[-1]
+    assert [tie["F_BUS"], tie["T_BUS"], tie["BR_X"], tie["BR_STATUS"]] == [
+        5,
+        39,
+        0.1,
+        1,
+    ]
+    assert merged.topology().n_islands == 1
+    assert merged.validate().ok
+
+    # sources are not changed
+    assert north.bus["BUS_I"].max() == 9 and len(north.branch) == 9
+
+    with pytest.raises(ValueError, match="collide"):
+        north.merge([north], offsets=0)
+    with pytest.raises(ValueError, match="not found"):
+        north.merge([north], ties=ties)
+    assert bus_offsets([north, south, north]).tolist() == [0, 9, 39]
+    assert bus_offsets([north, north], 1000).tolist() == [0, 1000]
+
+
+def test_concat_cases_names_reserves():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cf.set_attribute("gen_name", pd.Index(["a", "b", "c"], name="gen_name"))
+    reserves = {"zones": [[1, 1, 0]], "req": [[10]], "cost": [[1], [2]]}
+    cf.set_attribute("reserves", ReservesFrames(reserves_data_to_dataframes(reserves)))
+    other = CaseFrames(CASE_PATH_CASE9)
+    other.set_attribute("gen_name", pd.Index(["c", "d", "e"], name="gen_name"))
+    for case in (cf, other):
+        case.gen.index = case.gen_name
+
+    merged, mappings = cf.merge([other], keys=["x", "y"])
+    names = ["a", "b", "c_x", "d", "e", "c_y"]
+    assert merged.gen_name.tolist() == ["a", "b", "c_x", "c_y", "d", "e"]
+    assert merged.gen.index.equals(merged.gen_name)
+    assert merged.gencost.index.equals(merged.gen_name)
+    assert sorted(mappings["gen"]) == sorted(names)
+    assert mappings["gen"][("y", "c")] == "c_y"
+    assert merged.reserves.zones.shape == (1, 6)
+    assert merged.reserves.zones.to_numpy().tolist() == [[1, 1, 0, 0, 0, 0]]
+    assert merged.reserves.cost.index.tolist() == [1, 2]
+
+    # reactive cost rows of all sources follow the active ones
+    reactive = CaseFrames(CASE_PATH_CASE9)
+    reactive.gencost = pd.concat([reactive.gencost, reactive.gencost])
+    with pytest.raises(ValueError, match="reactive"):
+        reactive.merge([other])
+    merged = reactive.merge([reactive]).case
+    np.testing.assert_array_equal(
+        merged.gencost["STARTUP"], np.tile(reactive.gencost["STARTUP"][:3], 4)
+    )
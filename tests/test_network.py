@@ -0,0 +1,153 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.network import bus_positions, make_ybus
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_DIR = os.path.join(os.path.dirname(CURDIR), "data")
+CASE_PATHS = sorted(glob.glob(os.path.join(CASE_DIR, "*.m")))
+CASE_IDS = [os.path.basename(path) for path in CASE_PATHS]
+
+
+def make_ybus_dense(baseMVA, bus, branch):
+    """Dense reference following MATPOWER makeYbus line by line."""
+    nb, nl = len(bus), len(branch)
+    stat = branch["BR_STATUS"].to_numpy()
+    Ys = np.zeros(nl, dtype=complex)
+    on = stat != 0
+    Ys[on] = 1 / (branch["BR_R"].to_numpy()[on] + 1j * branch["BR_X"].to_numpy()[on])
+    Bc = stat * branch["BR_B"].to_numpy()
+    tap = np.ones(nl)
+    i = branch["TAP"].to_numpy() != 0
+    tap[i] = branch["TAP"].to_numpy()[i]
+    tap = tap * np.exp(1j * np.pi / 180 * branch["SHIFT"].to_numpy())
+    Ytt = Ys + 1j * Bc / 2
+    Yff = Ytt / (tap * np.conj(tap))
+    Yft = -Ys / np.conj(tap)
+    Ytf = -Ys / tap
+    Ysh = (bus["GS"].to_numpy() + 1j * bus["BS"].to_numpy()) / baseMVA
+
+    bus_map = {b: k for k, b in enumerate(bus["BUS_I"])}
+    f = [bus_map[b] for b in branch["F_BUS"]]
+    t = [bus_map[b] for b in branch["T_BUS"]]
+    Cf = np.zeros((nl, nb))
+    Ct = np.zeros((nl, nb))
+    Cf[np.arange(nl), f] = 1
+    Ct[np.arange(nl), t] = 1
+    Yf = Yff[:, None] * Cf + Yft[:, None] * Ct
+    Yt = Ytf[:, None] * Cf + Ytt[:, None] * Ct
+    Ybus = Cf.T @ Yf + Ct.T @ Yt + np.diag(Ysh)
+    return Ybus, Yf, Yt
+
+
+@pytest.mark.parametrize("case_path", CASE_PATHS, ids=CASE_IDS)
+def test_make_ybus(case_path):
+    cf = CaseFrames(case_path)
+    Ybus, Yf, Yt = cf.make_ybus()
+    Ybus_ref, Yf_ref, Yt_ref = make_ybus_dense(cf.baseMVA, cf.bus, cf.branch)
+
+    assert Ybus.shape == (len(cf.bus), len(cf.bus))
+    assert Yf.shape == Yt.shape == (len(cf.branch), len(cf.bus))
+    assert np.allclose(Ybus.toarray(), Ybus_ref)
+    assert np.allclose(Yf.toarray(), Yf_ref)
+    assert np.allclose(Yt.toarray(), Yt_ref)
+
+
+@pytest.mark.parametrize("case_path", CASE_PATHS, ids=CASE_IDS)
+def test_make_ybus_matpower(case_path):
+    from matpower import start_instance
+
+    cf = CaseFrames(case_path)
+    bus = cf.bus.to_numpy(dtype=float, copy=True)
+    branch = cf.branch.to_numpy(dtype=float, copy=True)
+
+    # MATPOWER makeYbus requires consecutive internal bus numbering
+    branch[:, 0] = bus_positions(cf.bus, cf.branch["F_BUS"]) + 1
+    branch[:, 1] = bus_positions(cf.bus, cf.branch["T_BUS"]) + 1
+    bus[:, 0] = np.arange(1, len(bus) + 1)
+
+    m = start_instance()
+    Ybus_ref, Yf_ref, Yt_ref = m.makeYbus(cf.baseMVA, bus, branch, nout=3)
+    m.exit()
+
+    Ybus, Yf, Yt = cf.make_ybus()
+    assert np.allclose(Ybus.toarray(), Ybus_ref.toarray())
+    assert np.allclose(Yf.toarray(), Yf_ref.toarray())
+    assert np.allclose(Yt.toarray(), Yt_ref.toarray())
+
+
+def test_make_ybus_cache():
+    cf = CaseFrames(os.path.join(CASE_DIR, "case9.m"))
+    Ybus, Yf, Yt = cf.make_ybus()
+    assert cf.make_ybus()[0] is Ybus
+
+    # non-input columns do not invalidate the cache
+    cf.bus.loc[5, "PD"] = 0
+    cf.gen["PG"] = 0
+    assert cf.make_ybus()[0] is Ybus
+
+    # in-place edits of input columns do, with or without Copy-on-Write
+    Bbus = cf.make_bdc()[0]
+    cf.branch.loc[1, "BR_X"] = 2 * cf.branch.loc[1, "BR_X"]
+    Ybus_new = cf.make_ybus()[0]
+    assert Ybus_new is not Ybus
+    assert not np.allclose(Ybus_new.toarray(), Ybus.toarray())
+    Ybus_ref = make_ybus(cf.baseMVA, cf.bus, cf.branch)[0]
+    assert np.allclose(Ybus_new.toarray(), Ybus_ref.toarray())
+    assert not np.allclose(cf.make_bdc()[0].toarray(), Bbus.toarray())
+
+    # replacing a table does too
+    cf.branch = cf.branch.iloc[1:]
+    Ybus_drop = cf.make_ybus()[0]
+    assert Ybus_drop is not Ybus_new
+    Ybus_ref = make_ybus(cf.baseMVA, cf.bus, cf.branch)[0]
+    assert np.allclose(Ybus_drop.toarray(), Ybus_ref.toarray())
+
+    # shallow copies share the cache until modified
+    cf_copy = cf.copy()
+    assert cf_copy.make_ybus()[0] is Ybus_drop
+    cf_copy.bus.loc[5, "BS"] = 10
+    assert cf_copy.make_ybus()[0] is not Ybus_drop
+    assert cf.make_ybus()[0] is Ybus_drop
+
+
+def test_make_ybus_missing_bus():
+    cf = CaseFrames(os.path.join(CASE_DIR, "case9.m"))
+    cf.branch.loc[1, "T_BUS"] = 99
+    with pytest.raises(ValueError, match="99"):
+        cf.make_ybus()
+
+
+@pytest.mark.parametrize("case_path", CASE_PATHS, ids=CASE_IDS)
+def test_make_bdc(case_path):
+    cf = CaseFrames(case_path)
+    Bbus, Bf, Pbusinj, Pfinj = cf.make_bdc()
+
+    # Bbus equals the imaginary part of Ybus without resistance, shunts, and charging
+    branch = cf.branch.copy()
+    branch["BR_R"] = 0.0
+    branch["BR_B"] = 0.0
+    branch["SHIFT"] = 0.0
+    bus = cf.bus.copy()
+    bus["GS"] = 0.0
+    bus["BS"] = 0.0
+    tap = branch["TAP"].where(branch["TAP"] != 0, 1.0)
+    branch["TAP"] = 1.0
+    branch["BR_X"] = branch["BR_X"] * tap
+    Ybus, Yf, _ = make_ybus(cf.baseMVA, bus, branch)
+    assert np.allclose(Bbus.toarray(), -Ybus.imag.toarray())
+    assert np.allclose(Bf.toarray(), -Yf.imag.toarray())
+
+    f = bus_positions(cf.bus, cf.branch["F_BUS"])
+    b = Bf.toarray()[np.arange(len(cf.branch)), f]
+    shift = np.deg2rad(cf.branch["SHIFT"].to_numpy())
+    assert np.allclose(Pfinj, -b * shift)
+    assert np.allclose(Pbusinj.sum(), 0)
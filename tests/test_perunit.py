@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from matpower import path_matpower
+
+from matpowercaseframes import CaseFrames, PerUnitView
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CASE_NAME_CASE9 = "case9.m"
+CASE_PATH_T_CASE9_DCLINE = f"{path_matpower}/lib/t/t_case9_dcline.m"
+
+
+def assert_tables_close(cf1, cf2, attributes):
+    for attribute in attributes:
+        pd.testing.assert_frame_equal(
+            getattr(cf1, attribute), getattr(cf2, attribute), check_dtype=False
+        )
+
+
+def test_to_pu_and_from_pu_round_trip():
+    cf = CaseFrames(CASE_NAME_CASE9)
+    cf_rt = cf.to_pu().from_pu()
+    assert_tables_close(cf, cf_rt, ["bus", "gen", "branch", "gencost"])
+
+    # the converted case is an independent copy
+    cf_pu = cf.to_pu()
+    cf_pu.bus.loc[1, "VM"] = 0.5
+    cf_pu.branch.loc[1, "BR_X"] = 0.5
+    assert cf.bus.loc[1, "VM"] == 1 and cf.branch.loc[1, "BR_X"] == 0.0576
+
+
+def test_to_pu_polynomial_cost():
+    cf = CaseFrames(CASE_NAME_CASE9)
+    cf_pu = cf.to_pu()
+
+    # cost evaluated at p.u. power must equal cost evaluated at MW
+    pg = cf.gen["PG"].to_numpy()
+    pg_pu = cf_pu.gen["PG"].to_numpy()
+    cost = np.polyval(cf.gencost.loc[1, ["C2", "C1", "C0"]].to_numpy(), pg[0])
+    cost_pu = np.polyval(cf_pu.gencost.loc[1, ["C2", "C1", "C0"]].to_numpy(), pg_pu[0])
+    assert np.isclose(cost, cost_pu)
+    assert (cf_pu.gencost["STARTUP"] == cf.gencost["STARTUP"]).all()
+
+
+def test_to_pu_piecewise_and_dcline():
+    cf = CaseFrames(CASE_PATH_T_CASE9_DCLINE)
+    cf_pu = cf.to_pu()
+
+    # gen 1 and 2 are piecewise linear, gen 3 is linear polynomial
+    assert np.allclose(cf_pu.gencost.loc[1, "COST3"], cf.gencost.loc[1, "COST3"] / 100)
+    assert np.allclose(cf_pu.gencost.loc[1, "COST4"], cf.gencost.loc[1, "COST4"])
+    assert np.allclose(cf_pu.gencost.loc[3, "COST1"], cf.gencost.loc[3, "COST1"] * 100)
+    assert np.allclose(cf_pu.gencost.loc[3, "COST2"], cf.gencost.loc[3, "COST2"])
+    assert np.allclose(cf_pu.dcline["PMAX"], cf.dcline["PMAX"] / 100)
+
+    cf_rt = cf_pu.from_pu()
+    assert_tables_close(cf, cf_rt, ["bus", "gen", "branch", "gencost", "dcline"])
+
+
+def test_pu_view():
+    cf = CaseFrames(CASE_NAME_CASE9)
+    view = cf.pu_view()
+    assert isinstance(view, PerUnitView)
+
+    cf_pu = cf.to_pu()
+    assert_tables_close(view, cf_pu, ["bus", "gen", "branch", "gencost"])
+    assert view.baseMVA == cf.baseMVA
+
+    # cached until the underlying table changes
+    bus_pu = view.bus
+    assert view.bus is bus_pu
+
+    cf.bus.loc[5, "PD"] = 50
+    assert view.bus is not bus_pu
+    assert view.bus.loc[5, "PD"] == 0.5
+    assert bus_pu.loc[5, "PD"] == 0.9
+
+    cf.set_attribute("gen", cf.gen.iloc[:2])
+    assert len(view.gen) == 2
+
+    assert_tables_close(view.to_case(), cf.to_pu(), ["bus", "gen", "branch"])
@@ -0,0 +1,272 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.network import bus_positions
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_DIR = os.path.join(os.path.dirname(CURDIR), "data")
+CASE_PATHS = sorted(glob.glob(os.path.join(CASE_DIR, "*.m")))
+CASE_IDS = [os.path.basename(path) for path in CASE_PATHS]
+CASE_PATH_CASE9 = os.path.join(CASE_DIR, "case9.m")
+
+
+def test_run_dcpf_case9():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    results = cf.run_dcpf()
+
+    # MATPOWER rundcpf('case9')
+    va = [0, 9.796, 5.0606, -2.2112, -3.7381, 2.2067, 0.8224, 3.959, -4.0634]
+    pf = [67, 28.9674, -61.0326, 85, 23.9674, -76.0326, -163, 86.9674, -38.0326]
+    assert np.allclose(results.bus["VA"], va, atol=1e-4)
+    assert np.allclose(results.branch["PF"], pf, atol=1e-4)
+    assert np.allclose(results.branch["PT"], -results.branch["PF"])
+    assert np.allclose(results.gen["PG"], [67, 163, 85])
+    assert results.success == 1
+
+    # input case is not modified
+    assert "PF" not in cf.branch.columns
+    assert (cf.bus["VA"] == 0).all()
+
+
+def test_run_dcpf_isolated_bus():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cf.bus.loc[9, "BUS_TYPE"] = 4
+    results = cf.run_dcpf()
+
+    # PYPOWER rundcpf(case9) with bus 9 isolated, its branches carry no flow
+    va = [0, 35.5868, 22.241, 1.9141, 4.9714, 19.3871, 23.0256, 29.7498, 0]
+    pf = [-58, -58, -148, 85, -63, -163, -163, 0, 0]
+    assert np.allclose(results.bus["VA"], va, atol=1e-4)
+    assert np.allclose(results.branch["PF"], pf, atol=1e-4)
+    assert np.allclose(results.gen["PG"], [-58, 163, 85])
+
+    batch = cf.run_pf_batch(dc=True)
+    assert np.allclose(batch["VA"][0], va, atol=1e-4)
+    assert np.allclose(batch["PF"][0], pf, atol=1e-4)
+    assert np.allclose(batch["PG"][0], [-58, 163, 85])
+
+
+@pytest.mark.parametrize("case_path", CASE_PATHS, ids=CASE_IDS)
+def test_run_dcpf_balance(case_path):
+    cf = CaseFrames(case_path)
+    results = cf.run_dcpf()
+    solver = cf.dcpf_solver()
+    Bbus = solver.Bbus
+
+    # power balance holds at every non-isolated bus
+    Va = np.deg2rad(results.bus["VA"].to_numpy())
+    Pbus = solver.injections(results)
+    buses = np.r_[solver.ref, solver.pv, solver.pq]
+    assert np.allclose((Bbus @ Va)[buses], Pbus[buses])
+
+    # flows are consistent with angles
+    assert results.branch.columns.tolist()[-4:] == ["PF", "QF", "PT", "QT"]
+    assert np.allclose(
+        results.branch["PF"], solver.branch_flows(Va) * cf.baseMVA, atol=1e-8
+    )
+
+
+def test_dcpf_solver_reuse():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    solver = cf.dcpf_solver()
+    assert cf.dcpf_solver() is solver
+
+    Pbus = solver.injections(cf)
+    Va = solver.solve(Pbus)
+
+    # batch of scaled injections, solved at once
+    scales = np.linspace(0.5, 1.5, 11)
+    Va_batch = solver.solve(scales[:, None] * Pbus)
+    assert Va_batch.shape == (11, len(cf.bus))
+    assert np.allclose(Va_batch[5], Va)
+    assert np.allclose(Va_batch, scales[:, None] * Va)
+
+    flows = solver.branch_flows(Va_batch)
+    assert flows.shape == (11, len(cf.branch))
+
+    # loads are not part of the factorization
+    cf.bus.loc[5, "PD"] = 10
+    assert cf.dcpf_solver() is solver
+
+    # reactances are, with or without Copy-on-Write
+    cf.branch.loc[1, "BR_X"] = 2 * cf.branch.loc[1, "BR_X"]
+    solver = cf.dcpf_solver()
+    Pbus = solver.injections(cf)
+    assert np.allclose(solver.solve(Pbus), cf.dcpf_solver(use_cache=False).solve(Pbus))
+    assert np.allclose(cf.run_dcpf().bus["VA"], np.rad2deg(solver.solve(Pbus)))
+
+    # branch outage is
+    cf.branch.loc[2, "BR_STATUS"] = 0
+    assert cf.dcpf_solver() is not solver
+
+    # bus 5 left without any in-service branch
+    cf.branch.loc[3, "BR_STATUS"] = 0
+    with pytest.raises(ValueError, match="singular"):
+        cf.dcpf_solver()
+
+
+@pytest.mark.parametrize("case_path", CASE_PATHS, ids=CASE_IDS)
+def test_run_dcpf_matpower(case_path):
+    from matpower import start_instance
+
+    cf = CaseFrames(case_path)
+    m = start_instance()
+    mpopt = m.mpoption("verbose", 0, "out.all", 0)
+    mpc = m.rundcpf(cf.to_mpc(), mpopt)
+    m.exit()
+
+    results = cf.run_dcpf()
+    assert np.allclose(results.bus["VA"], mpc.bus[:, 8])
+    assert np.allclose(results.branch["PF"], mpc.branch[:, 13])
+    assert np.allclose(results.gen["PG"], mpc.gen[:, 1])
+
+
+def test_run_pf_case9():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    results = cf.run_pf()
+
+    # MATPOWER runpf('case9')
+    vm = [1.04, 1.025, 1.025, 1.0258, 1.0127, 1.0324, 1.0159, 1.0258, 0.9956]
+    va = [0, 9.28, 4.6648, -2.2168, -3.6874, 1.9667, 0.7275, 3.7197, -3.9888]
+    qf = [
+        27.0459,
+        1.03,
+        -13.4566,
+        -10.8597,
+        3.1195,
+        -10.7042,
+        9.1781,
+        -8.3808,
+        -38.6872,
+    ]
+    assert np.allclose(results.bus["VM"], vm, atol=1e-4)
+    assert np.allclose(results.bus["VA"], va, atol=1e-4)
+    assert np.allclose(results.gen["PG"], [71.641, 163, 85], atol=1e-3)
+    assert np.allclose(results.gen["QG"], [27.0459, 6.6537, -10.8597], atol=1e-4)
+    assert np.allclose(results.branch["QF"], qf, atol=1e-4)
+    assert results.branch.columns.tolist()[-4:] == ["PF", "QF", "PT", "QT"]
+    assert results.success == 1
+
+    # input case is not modified
+    assert "PF" not in cf.branch.columns
+    assert (cf.bus["VA"] == 0).all()
+
+
+@pytest.mark.parametrize("case_path", CASE_PATHS, ids=CASE_IDS)
+def test_run_pf_balance(case_path):
+    cf = CaseFrames(case_path)
+    results = cf.run_pf()
+    assert results.success == 1
+
+    # generation at PV and REF buses balances load and network injections
+    Ybus, Yf, _ = cf.make_ybus()
+    bus, gen = results.bus, results.gen
+    V = bus["VM"].to_numpy() * np.exp(1j * np.deg2rad(bus["VA"].to_numpy()))
+    Sd = (bus["PD"] + 1j * bus["QD"]).to_numpy()
+    S = V * np.conj(Ybus @ V) * cf.baseMVA + Sd
+    on = (gen["GEN_STATUS"] > 0).to_numpy()
+    gbus = bus_positions(bus, gen["GEN_BUS"][on])
+    Sg = np.zeros(len(bus), dtype=complex)
+    np.add.at(Sg, gbus, (gen["PG"] + 1j * gen["QG"]).to_numpy()[on])
+    is_gen_bus = bus["BUS_TYPE"].isin([2, 3]).to_numpy()
+    assert np.allclose(Sg[is_gen_bus], S[is_gen_bus])
+
+    # flows are consistent with voltages
+    f = bus_positions(bus, cf.branch["F_BUS"])
+    Sf = V[f] * np.conj(Yf @ V) * cf.baseMVA
+    on = (cf.branch["BR_STATUS"] != 0).to_numpy()
+    assert np.allclose(results.branch["PF"][on], Sf.real[on], atol=1e-8)
+    assert np.allclose(results.branch["QF"][on], Sf.imag[on], atol=1e-8)
+
+
+def test_run_pf_qlim():
+    cf = CaseFrames(os.path.join(CASE_DIR, "case118.m"))
+    gen = cf.run_pf().gen
+    violated = (gen["QG"] > gen["QMAX"]) | (gen["QG"] < gen["QMIN"])
+    assert violated.any()
+
+    results = cf.run_pf(qlim=True)
+    gen = results.gen
+    assert results.success == 1
+    assert ((gen["QG"] <= gen["QMAX"] + 1e-6) & (gen["QG"] >= gen["QMIN"] - 1e-6)).all()
+
+    # generator buses at their limits are converted to PQ buses
+    limited = gen.loc[violated, "GEN_BUS"]
+    bus_type = results.bus.set_index("BUS_I")["BUS_TYPE"]
+    assert (bus_type[limited] == 1).all()
+    assert (results.gen["GEN_STATUS"] == cf.gen["GEN_STATUS"]).all()
+    assert (results.bus["PD"] == cf.bus["PD"]).all()
+
+
+def test_run_pf_not_converged():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cf.bus["PD"] = cf.bus["PD"] * 10
+    results = cf.run_pf()
+    assert results.success == 0
+
+
+@pytest.mark.parametrize("qlim", [False, True])
+@pytest.mark.parametrize("case_path", CASE_PATHS, ids=CASE_IDS)
+def test_run_pf_matpower(case_path, qlim):
+    from matpower import start_instance
+
+    cf = CaseFrames(case_path)
+    m = start_instance()
+    mpopt = m.mpoption("verbose", 0, "out.all", 0, "pf.enforce_q_lims", int(qlim))
+    mpc = m.runpf(cf.to_mpc(), mpopt)
+    m.exit()
+
+    results = cf.run_pf(qlim=qlim)
+    assert np.allclose(results.bus["VM"], mpc.bus[:, 7])
+    assert np.allclose(results.bus["VA"], mpc.bus[:, 8])
+    assert np.allclose(results.gen["PG"], mpc.gen[:, 1])
+    assert np.allclose(results.gen["QG"], mpc.gen[:, 2])
+    assert np.allclose(results.branch["PF"], mpc.branch[:, 13])
+    assert np.allclose(results.branch["QF"], mpc.branch[:, 14])
+
+
+@pytest.mark.parametrize("dc", [False, True])
+def test_run_pf_batch(dc):
+    cf = CaseFrames(CASE_PATH_CASE9)
+    scales = np.linspace(0.8, 1.1, 4)[:, None]
+    PD = scales * cf.bus["PD"].to_numpy()
+    PG = scales * cf.gen["PG"].to_numpy()
+    results = cf.run_pf_batch(PD=PD, PG=PG, dc=dc)
+    assert results["VM"].shape == (4, len(cf.bus))
+    assert results["PF"].shape == (4, len(cf.branch))
+    assert results["success"].all()
+
+    # same as solving each scenario on its own
+    for s in range(4):
+        case = cf.copy()
+        case.bus["PD"] = PD[s]
+        case.gen["PG"] = PG[s]
+        expected = case.run_dcpf() if dc else case.run_pf()
+        assert np.allclose(results["VM"][s], expected.bus["VM"])
+        assert np.allclose(results["VA"][s], expected.bus["VA"])
+        assert np.allclose(results["PF"][s], expected.branch["PF"])
+        assert np.allclose(results["QT"][s], expected.branch["QT"])
+        assert np.allclose(results["PG"][s], expected.gen["PG"])
+        assert np.allclose(results["QG"][s], expected.gen["QG"])
+
+
+def test_run_pf_batch_processes():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    QD = np.linspace(0.5, 1.5, 5)[:, None] * cf.bus["QD"].to_numpy()
+    results = cf.run_pf_batch(QD=QD, processes=2)
+    expected = cf.run_pf_batch(QD=QD)
+    assert np.allclose(results["VM"], expected["VM"])
+    assert np.allclose(results["QF"], expected["QF"])
+
+    with pytest.raises(ValueError, match="columns"):
+        cf.run_pf_batch(PD=np.ones((2, 3)))
+    with pytest.raises(ValueError, match="scenarios"):
+        cf.run_pf_batch(PD=np.ones((2, 9)), QD=np.ones((3, 9)))
@@ -0,0 +1,137 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matpowercaseframes import CaseFrames, Profile, xGenDataTableFrames
+from matpowercaseframes.changes import apply_changes
+from matpowercaseframes.idx.ct import (
+    CT_LOAD_ALL_P,
+    CT_LOAD_ALL_PQ,
+    CT_MODCOST_X,
+    CT_TAREABRCH,
+    CT_TAREALOAD,
+    CT_TBUS,
+    CT_TGEN,
+    CT_TGENCOST,
+    CT_TLOAD,
+)
+from matpowercaseframes.idx.profile import PR_ADD, PR_REL, PR_REP
+from matpowercaseframes.profiles import profiles_to_changes, profiles_to_most
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def _case9_with_dispatchable_load():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    gen = cf.gen.loc[[3]].set_axis([4])
+    gen.loc[4, ["GEN_BUS", "PG", "QG", "PMAX", "PMIN", "QMAX", "QMIN"]] = [
+        9,
+        -20,
+        -5,
+        0,
+        -20,
+        0,
+        -5,
+    ]
+    cf.set_attribute("gen", pd.concat([cf.gen, gen]))
+    cf.set_attribute("gencost", pd.concat([cf.gencost, cf.gencost.iloc[[2]]]))
+    cf.bus.loc[[3, 6, 9], "BUS_AREA"] = 2
+    return cf
+
+
+def test_expand_profiles_matches_changes():
+    cf = _case9_with_dispatchable_load()
+    rng = np.random.default_rng(0)
+    profiles = [
+        # wind-like profile, as MOST ex_wind_profile
+        Profile("mpcData", CT_TGEN, 1, 9, PR_REL, rng.uniform(0.5, 1.5, (4, 3))),
+        # load profile, as MOST ex_load_profile
+        Profile(
+            "mpcData", CT_TLOAD, 0, CT_LOAD_ALL_PQ, PR_REP, rng.uniform(300, 400, 4)
+        ),
+        Profile(
+            "mpcData",
+            CT_TAREALOAD,
+            [1, 2],
+            -CT_LOAD_ALL_P,
+            PR_ADD,
+            rng.uniform(-10, 10, (1, 3, 2)),
+        ),
+        Profile("mpcData", CT_TAREABRCH, 2, 6, PR_REP, rng.uniform(100, 200, (4, 3))),
+        Profile(
+            "mpcData",
+            CT_TGENCOST,
+            [1, 3],
+            CT_MODCOST_X,
+            PR_REL,
+            rng.uniform(0.9, 1.1, (4, 1, 2)),
+        ),
+        Profile("mpcData", CT_TGENCOST, 0, 6, PR_ADD, 1.0),
+        Profile("mpcData", CT_TBUS, [2, 5], 12, PR_REP, [[[1.05, 1.02]]]),
+    ]
+    expanded = cf.apply_profiles(profiles)
+    assert (expanded.nt, expanded.nj) == (4, 3)
+    assert expanded.get("gen", "PMAX").shape == (4, 3, 4)
+    assert expanded.get("bus", "VM").shape == (4, 3, 9)
+    assert "VM" not in expanded.varying["bus"]
+
+    changes = profiles_to_changes(profiles)
+    for t in range(4):
+        for j in range(3):
+            expected = apply_changes(cf, 0, changes[t][j])
+            case = expanded.case(t, j)
+            for attribute in ("bus", "gen", "branch", "gencost"):
+                np.testing.assert_allclose(
+                    getattr(case, attribute).to_numpy(dtype=float),
+                    getattr(expected, attribute).to_numpy(dtype=float),
+                )
+    np.testing.assert_allclose(
+        expanded.get("gen", "PMAX")[:, :, 0], 250 * profiles[0].values[..., 0]
+    )
+
+
+def test_expand_profiles_xgd():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    xgd = xGenDataTableFrames(
+        {"CommitKey": [1, 1, 2], "PositiveActiveReservePrice": [1.0, 2.0, 3.0]}
+    )
+    profiles = [
+        Profile(
+            "xGenData", "PositiveActiveReservePrice", [2, 3], 0, PR_REL, [[[2, 3]]]
+        ),
+        Profile("xGenData", "CommitSched", 0, 0, PR_REP, np.ones((5, 1))),
+    ]
+    expanded = cf.apply_profiles(profiles, nj=2, xgd=xgd)
+    assert expanded.get_xgd("PositiveActiveReservePrice").shape == (5, 2, 3)
+    assert np.all(expanded.get_xgd("PositiveActiveReservePrice") == [1, 4, 9])
+    assert np.all(expanded.get_xgd("CommitSched") == 1)
+    assert np.all(expanded.get_xgd("CommitKey") == [1, 1, 2])
+    assert expanded.varying == {"xgd": ["PositiveActiveReservePrice", "CommitSched"]}
+
+    with pytest.raises(ValueError):
+        cf.apply_profiles(profiles)
+
+
+def test_profile_most_struct():
+    profile = Profile("mpcData", CT_TGEN, [1, 2], 9, PR_REL, np.ones((12, 3, 2)))
+    (struct,) = profiles_to_most(profile)
+    assert struct["rows"].shape == (2, 1)
+    assert struct["values"].shape == (12, 3, 2)
+    profile_ = Profile.from_dict(struct)
+    assert profile_.rows.tolist() == [1, 2]
+    assert (profile_.table, profile_.col, profile_.chgtype) == (CT_TGEN, 9, PR_REL)
+    assert profile.expand(6, 3).shape == (6, 3, 2)
+
+    with pytest.raises(ValueError):
+        Profile("mpcData", CT_TGEN, [1, 2], 9, PR_REL, np.ones((12, 3, 3)))
+    with pytest.raises(ValueError):
+        Profile("mpcData", "PMAX", 1, 9, PR_REL, 1.0)
+    with pytest.raises(ValueError):
+        profile.expand(24, 3)
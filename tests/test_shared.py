@@ -0,0 +1,68 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.contingencies import map_outages
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+_WORKER = {}
+
+
+def _init(descriptor):
+    _WORKER["case"] = descriptor.attach()
+
+
+def _total_load(_):
+    return _WORKER["case"].bus["PD"].sum()
+
+
+def _max_flow(case):
+    return np.abs(case.run_dcpf().branch["PF"].to_numpy()).max()
+
+
+def test_shared_memory_attach():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    with cf.to_shared_memory() as shared:
+        assert len(pickle.dumps(shared.descriptor)) < len(pickle.dumps(cf))
+        case = shared.attach()
+        for attribute in ("bus", "gen", "branch", "gencost"):
+            assert getattr(case, attribute).equals(getattr(cf, attribute))
+        assert case.baseMVA == cf.baseMVA
+
+        # shared columns are read-only, copies are writable
+        with pytest.raises(ValueError):
+            case.bus.loc[5, "PD"] = 0
+        variant = case.copy()
+        variant.bus.loc[5, "PD"] = 0
+        assert case.bus.loc[5, "PD"] == 90
+        thawed = case.thaw()
+        thawed.branch.loc[1, "BR_X"] = 1
+        variant.branch.loc[1, "BR_X"] = 2
+        assert thawed.branch.loc[1, "BR_X"] == 1
+        assert case.branch.loc[1, "BR_X"] == cf.branch.loc[1, "BR_X"]
+        del case, variant, thawed
+    with pytest.raises(FileNotFoundError):
+        shared.attach()
+
+
+def test_shared_memory_workers():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    with cf.to_shared_memory() as shared:
+        with ProcessPoolExecutor(
+            max_workers=2, initializer=_init, initargs=(shared.descriptor,)
+        ) as executor:
+            assert list(executor.map(_total_load, range(4))) == [315] * 4
+
+    expected = map_outages(_max_flow, cf, skip_bridges=True)
+    results = map_outages(_max_flow, cf, processes=2, shared=True, skip_bridges=True)
+    assert results == pytest.approx(expected)
@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matpowercaseframes import CaseFrames, ReservesFrames
+from matpowercaseframes.core import reserves_data_to_dataframes
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+CASE_PATH_DCLINE = os.path.join(os.path.dirname(CURDIR), "data", "t_case9_dcline.m")
+
+
+def test_extract_island():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cf.branch.loc[[1, 7], "BR_STATUS"] = 0
+    islands = cf.islands()
+    main = cf.extract(islands == islands[3])
+    assert main.case.bus.index.tolist() == [3, 4, 5, 6, 7, 8, 9]
+    assert main.case.branch.index.tolist() == [2, 3, 4, 5, 6, 8, 9]
+    assert main.case.gen["GEN_BUS"].tolist() == [3]
+    assert main.case.gencost.index.tolist() == [3]
+    assert main.case.topology().n_islands == 1
+    assert main.ties["branch"].index.tolist() == [1, 7]
+    assert (main.bus_map.index == main.bus_map.to_numpy()).all()
+
+    # the source case is not changed
+    assert len(cf.bus) == 9 and len(cf.gen) == 3
+
+    with pytest.raises(ValueError, match="3 values for 9 bus rows"):
+        cf.extract(np.ones(3, dtype=bool))
+    with pytest.raises(ValueError, match="not found"):
+        cf.extract([1, 99])
+
+
+def test_extract_renumber():
+    cf = CaseFrames(CASE_PATH_DCLINE)
+    sub, ties, bus_map = cf.extract([30, 4, 5, 6, 9], renumber=True)
+    assert bus_map.to_dict() == {30: 1, 4: 2, 5: 3, 6: 4, 9: 5}
+    assert sub.bus["BUS_I"].tolist() == [1, 2, 3, 4, 5]
+    assert sub.bus.index.tolist() == [1, 2, 3, 4, 5]
+    assert sub.branch[["F_BUS", "T_BUS"]].values.tolist() == [
+        [2, 3],
+        [3, 4],
+        [1, 4],
+        [5, 2],
+    ]
+    assert sub.gen["GEN_BUS"].tolist() == [1]
+    assert sub.dcline[["F_BUS", "T_BUS"]].values.tolist() == [[1, 2], [3, 5]]
+    assert sub.dclinecost.index.tolist() == sub.dcline.index.tolist() == [0, 3]
+    assert ties["branch"].index.tolist() == [1, 5, 8]
+    assert ties["dcline"].index.tolist() == [1, 2]
+
+    # only the reference bus is lost
+    assert sub.validate().errors["check"].tolist() == ["ref_missing"]
+
+
+def test_extract_names_reserves():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    cf.set_attribute("gen_name", pd.Index(["a", "b", "c"], name="gen_name"))
+    cf.gen.index = cf.gen_name
+    reserves = {
+        "zones": [[1, 1, 0], [0, 0, 1]],
+        "req": [[10], [20]],
+        "cost": [[1], [2], [3]],
+        "qty": [[5], [6], [7]],
+    }
+    cf.set_attribute("reserves", ReservesFrames(reserves_data_to_dataframes(reserves)))
+
+    sub = cf.extract(cf.bus["BUS_I"] != 3).case
+    assert sub.gen_name.tolist() == sub.gen.index.tolist() == ["a", "b"]
+    assert sub.reserves.zones.shape == (1, 2)
+    assert sub.reserves.req["PREQ"].tolist() == [10]
+    assert sub.reserves.cost["C1"].tolist() == [1, 2]
+    assert sub.reserves.qty.index.tolist() == sub.reserves.zones.columns.tolist()
+    assert cf.reserves.zones.shape == (2, 3)
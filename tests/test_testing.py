@@ -0,0 +1,58 @@
+import os
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.testing import assert_cases_close, compare_cases
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+
+
+def test_compare_cases():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    assert compare_cases(cf, cf.copy()).equal
+
+    other = cf.copy()
+    other.bus["BUS_TYPE"] = other.bus["BUS_TYPE"].astype(int)
+    other.bus["VM"] = other.bus["VM"] + 1e-9
+    assert_cases_close(cf, other)
+    comparison = compare_cases(cf, other, check_dtype=True)
+    assert comparison.messages == ["bus.BUS_TYPE: dtype float64 != int64"]
+
+    other.bus.loc[other.bus["PD"] > 0, "PD"] += 1.0
+    other.branch.loc[2, "BR_STATUS"] = 0
+    other.baseMVA = 200
+    comparison = compare_cases(cf, other, max_cells=2)
+    assert not comparison
+    assert comparison.mismatches.values.tolist() == [
+        ["bus", "PD", 3, 1.0],
+        ["branch", "BR_STATUS", 1, 1.0],
+    ]
+    assert comparison.cells["index"].tolist() == [5, 7]
+    assert comparison.messages == ["baseMVA: 100 != 200"]
+    assert compare_cases(cf, other, atol=0.5, rtol=0.05, max_cells=2).mismatches[
+        "column"
+    ].tolist() == ["BR_STATUS"]
+    with pytest.raises(AssertionError, match="4 cells differ") as excinfo:
+        assert_cases_close(cf, other, max_cells=2)
+    assert len(str(excinfo.value).splitlines()) < 15
+
+    other = cf.copy()
+    other.gen = other.gen.drop(index=[3])
+    other.bus = other.bus.set_axis(np.arange(len(cf.bus)))
+    comparison = compare_cases(cf, other)
+    assert comparison.messages == [
+        "bus: 1 rows only in left, 1 rows only in right",
+        "gen: 1 rows only in left, 0 rows only in right",
+    ]
+    assert "BUS_I" in comparison.mismatches["column"].tolist()
+    # by position, only the removed gen differs
+    comparison = compare_cases(cf, other, check_index=False)
+    assert comparison.messages == ["gen: 3 rows != 2 rows"]
+    assert comparison.mismatches.empty
@@ -0,0 +1,76 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.contingencies import _bridges_dfs, bridges, radial_branches
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+CASE_PATH_CASE118 = os.path.join(os.path.dirname(CURDIR), "data", "case118.m")
+CASE_PATH_DCLINE = os.path.join(os.path.dirname(CURDIR), "data", "t_case9_dcline.m")
+
+
+def test_topology_islands():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    topology = cf.topology()
+    assert cf.topology() is topology
+    assert topology.adjacency.shape == (9, 9) and topology.adjacency.nnz == 18
+    assert topology.n_islands == 1
+    np.testing.assert_array_equal(topology.degree(), [1, 1, 1, 3, 2, 3, 2, 3, 2])
+
+    # the cache follows the branch statuses
+    cf.branch.loc[[1, 7], "BR_STATUS"] = 0
+    topology = cf.topology()
+    assert topology.n_islands == 3
+    islands = cf.islands()
+    assert islands.index.equals(cf.bus.index)
+    assert islands.groupby(islands).size().tolist() == [1, 1, 7]
+    np.testing.assert_array_equal(topology.island_sizes(), [1, 1, 7])
+    cf.branch.loc[[1, 7], "BR_STATUS"] = 1
+    assert cf.topology().n_islands == 1
+
+    assert cf.topology().neighbors(1).tolist() == [1, 4]
+    assert cf.topology().neighbors([1, 2], hops=2).tolist() == [1, 2, 4, 5, 7, 8, 9]
+    with pytest.raises(ValueError, match="not found"):
+        cf.topology().neighbors(99)
+
+
+@pytest.mark.parametrize("case_path", [CASE_PATH_CASE9, CASE_PATH_CASE118])
+def test_topology_bridges(case_path):
+    cf = CaseFrames(case_path)
+    status = cf.branch.columns.get_loc("BR_STATUS")
+    rng = np.random.default_rng(1)
+    for fraction in (0, 0.1, 0.2, 0.3):
+        cf.branch.iloc[:, status] = (rng.random(len(cf.branch)) >= fraction).astype(int)
+        topology = cf.topology()
+        np.testing.assert_array_equal(topology.bridges(), _bridges_dfs(cf))
+        np.testing.assert_array_equal(bridges(cf), _bridges_dfs(cf))
+        np.testing.assert_array_equal(topology.radial_branches(), radial_branches(cf))
+
+    # parallel branches and self-loops are never bridges
+    cf.branch = pd.concat([cf.branch, cf.branch.iloc[[0, 0]]], ignore_index=True)
+    cf.branch.iloc[-1, cf.branch.columns.get_loc("T_BUS")] = cf.branch.iloc[-1]["F_BUS"]
+    cf.branch.iloc[:, status] = 1
+    mask = cf.topology().bridges()
+    np.testing.assert_array_equal(mask, _bridges_dfs(cf))
+    assert not mask[[0, -2, -1]].any()
+
+
+def test_topology_dcline():
+    cf = CaseFrames(CASE_PATH_DCLINE)
+    topology = cf.topology()
+    assert topology.adjacency.nnz == 2 * 12
+    # the DC line 30-4 doubles the branch 30-6
+    assert np.flatnonzero(topology.bridges()).tolist() == [0, 6]
+    assert np.flatnonzero(cf.topology(dcline=False).bridges()).tolist() == [0, 3, 6]
+    assert not topology.bridges("dcline").any()
+    assert topology.neighbors(30).tolist() == [30, 4, 6]
+    with pytest.raises(ValueError, match="not part"):
+        cf.topology(dcline=False).bridges("dcline")
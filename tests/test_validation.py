@@ -0,0 +1,67 @@
+import os
+
+import numpy as np
+import pytest
+
+from matpowercaseframes import CaseFrames
+from matpowercaseframes.validation import CHECKS, register_check, validate
+
+"""
+    pytest -n auto -rA --cov-report term --cov=matpowercaseframes tests/
+"""
+
+CURDIR = os.path.realpath(os.path.dirname(__file__))
+CASE_PATH_CASE9 = os.path.join(os.path.dirname(CURDIR), "data", "case9.m")
+CASE_PATH_DCLINE = os.path.join(os.path.dirname(CURDIR), "data", "t_case9_dcline.m")
+
+
+def test_validate():
+    cf = CaseFrames(CASE_PATH_CASE9)
+    report = cf.validate()
+    assert report.ok and report.issues.empty
+    assert report.checks == list(CHECKS)
+    assert CaseFrames(CASE_PATH_DCLINE).validate().ok
+
+    bad = cf.copy()
+    bad.gen.loc[2, "GEN_BUS"] = 99
+    bad.branch.loc[[3, 4], "T_BUS"] = 100
+    bad.gen.loc[3, "PMIN"] = 500
+    bad.bus["BUS_TYPE"] = np.where(bad.bus["BUS_TYPE"] == 3, 2, bad.bus["BUS_TYPE"])
+    bad.gencost = bad.gencost.iloc[:2]
+    report = bad.validate()
+    assert not report
+    assert report.errors[["check", "attribute", "index"]].values.tolist() == [
+        ["ref_missing", "bus", None],
+        ["gen_bus", "gen", 2],
+        ["gen_limits", "gen", 3],
+        ["branch_bus", "branch", 3],
+        ["branch_bus", "branch", 4],
+        ["gencost", "gencost", None],
+    ]
+    assert report.summary()["count"].tolist() == [1, 1, 1, 2, 1]
+    with pytest.raises(ValueError, match="T_BUS not found"):
+        report.raise_for_errors()
+
+    # checks can be selected, skipped, and registered
+    assert validate(bad, checks=["gen_bus"]).issues["check"].unique().tolist() == [
+        "gen_bus"
+    ]
+    assert (
+        "ref_missing" not in bad.validate(skip=["ref_missing"]).issues["check"].tolist()
+    )
+    with pytest.raises(ValueError, match="Unknown checks"):
+        bad.validate(checks=["nope"])
+
+    @register_check("test_pg_negative", severity="warning")
+    def check_pg(case):
+        """Generator outputs are not negative."""
+        return [("gen", case.gen["PG"].to_numpy() < 0, "negative PG")]
+
+    try:
+        bad.gen.loc[1, "PG"] = -1
+        report = bad.validate(checks=["test_pg_negative"])
+        assert report.ok
+        assert report.warnings["index"].tolist() == [1]
+        assert CHECKS["test_pg_negative"].description == check_pg.__doc__
+    finally:
+        del CHECKS["test_pg_negative"]